@@ -0,0 +1,205 @@
+"""
+Cross-year watering analytics
+
+Streams every people_{year}.json file (and archived copies in backups/)
+one file at a time and combines small per-file aggregates into per-person,
+per-year and per-month statistics. Per-file aggregates are cached by file
+hash in analytics_cache.json, so only changed years are parsed again.
+"""
+
+import os
+import year_files
+
+CACHE_FILE = "analytics_cache.json"
+CACHE_VERSION = 1
+
+def aggregate_year_file(path):
+    """Build the compact aggregate for one year file
+
+    Only counts, month totals and gap bounds are kept per person, so the
+    aggregate stays small no matter how many weeks the file holds.
+    """
+    file_data = year_files.read_year_file(path)
+    if file_data is None:
+        return None
+
+    persons = {}
+    months = {}
+
+    def person_stats(name):
+        if name not in persons:
+            persons[name] = {'main': 0, 'ersatz': 0, 'first': None, 'last': None, 'max_gap': 0}
+        return persons[name]
+
+    records = year_files.week_records_from_history(file_data.get("WATERING_HISTORY", {}))
+    for year, week, main, ersatz in records:
+        month = year_files.week_start_date(year, week).strftime('%Y-%m')
+        ordinal = year_files.week_ordinal(year, week)
+        for person in main:
+            if not person:
+                continue
+            stats = person_stats(person)
+            stats['main'] += 1
+            if stats['last'] is not None:
+                stats['max_gap'] = max(stats['max_gap'], ordinal - stats['last'])
+            if stats['first'] is None:
+                stats['first'] = ordinal
+            stats['last'] = ordinal
+            months[month] = months.get(month, 0) + 1
+        for person in ersatz:
+            if person:
+                person_stats(person)['ersatz'] += 1
+
+    for person in file_data.get("PEOPLE", []):
+        person_stats(person)
+
+    return {
+        'weeks': len(records),
+        'people': file_data.get("PEOPLE", []),
+        'persons': persons,
+        'months': months
+    }
+
+def _load_cache():
+    cached = year_files.read_year_file(CACHE_FILE) if os.path.exists(CACHE_FILE) else None
+    if not cached or cached.get("version") != CACHE_VERSION:
+        return {"version": CACHE_VERSION, "files": {}}
+    return cached
+
+def percentile(sorted_values, fraction):
+    """Linear interpolation percentile of an already sorted list"""
+    if not sorted_values:
+        return 0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def gini_coefficient(values):
+    """Gini coefficient of the watering counts (0 = perfectly even)"""
+    values = sorted(values)
+    total = sum(values)
+    if not values or total == 0:
+        return 0.0
+    weighted = sum((i + 1) * value for i, value in enumerate(values))
+    return (2 * weighted) / (len(values) * total) - (len(values) + 1) / len(values)
+
+def get_cross_year_analytics(include_archives=True, use_cache=True):
+    """Combine all year files into cross-year fairness statistics
+
+    Returns:
+        dict: per_person, per_year, per_month, percentiles, gini, longest_gaps
+              and the list of processed/reparsed files
+    """
+    cache = _load_cache() if use_cache else {"version": CACHE_VERSION, "files": {}}
+    cache_changed = False
+    seen_paths = set()
+
+    per_person = {}
+    per_year = {}
+    per_month = {}
+    gap_state = {}  # person -> [last ordinal, longest gap]
+    processed = []
+    reparsed = []
+
+    for year, path, is_archive in year_files.iter_year_files(include_archives=include_archives):
+        key = os.path.normpath(path)
+        seen_paths.add(key)
+        try:
+            content_hash = year_files.file_hash(path)
+        except OSError as e:
+            print(f"Error hashing {path}: {e}")
+            continue
+
+        entry = cache["files"].get(key)
+        if entry and entry.get("hash") == content_hash:
+            aggregate = entry["aggregate"]
+        else:
+            aggregate = aggregate_year_file(path)
+            if aggregate is None:
+                continue
+            cache["files"][key] = {"hash": content_hash, "aggregate": aggregate}
+            cache_changed = True
+            reparsed.append(path)
+        processed.append(path)
+
+        year_counts = {}
+        for person, stats in aggregate['persons'].items():
+            totals = per_person.setdefault(person, {'main': 0, 'ersatz': 0, 'years': 0})
+            totals['main'] += stats['main']
+            totals['ersatz'] += stats['ersatz']
+            totals['years'] += 1
+            year_counts[person] = stats['main']
+
+            # Gaps inside this year, then the gap across the year boundary
+            state = gap_state.setdefault(person, [None, 0])
+            state[1] = max(state[1], stats['max_gap'])
+            if stats['first'] is not None:
+                if state[0] is not None:
+                    state[1] = max(state[1], stats['first'] - state[0])
+                state[0] = stats['last']
+        per_year[year] = year_counts
+
+        for month, count in aggregate['months'].items():
+            per_month[month] = per_month.get(month, 0) + count
+
+    if use_cache:
+        for key in list(cache["files"]):
+            if key not in seen_paths:
+                del cache["files"][key]
+                cache_changed = True
+        if cache_changed:
+            try:
+                year_files.atomic_write_json(CACHE_FILE, cache, compact=True)
+            except OSError as e:
+                print(f"Error writing {CACHE_FILE}: {e}")
+
+    counts = sorted(totals['main'] for totals in per_person.values())
+    return {
+        'per_person': per_person,
+        'per_year': per_year,
+        'per_month': dict(sorted(per_month.items())),
+        'percentiles': {label: percentile(counts, fraction)
+                        for label, fraction in (('p10', 0.1), ('p25', 0.25), ('p50', 0.5), ('p75', 0.75), ('p90', 0.9))},
+        'gini': gini_coefficient(counts),
+        'longest_gaps': {person: state[1] for person, state in gap_state.items()},
+        'files': processed,
+        'reparsed': reparsed
+    }
+
+def get_cross_year_report(include_archives=True):
+    """Generate a text report of watering fairness across all years"""
+    analytics = get_cross_year_analytics(include_archives=include_archives)
+    if not analytics['per_person']:
+        return "No year files with watering data found"
+
+    years = sorted(analytics['per_year'])
+    report = []
+    report.append("=== CROSS-YEAR WATERING ANALYSIS ===")
+    report.append(f"Years analysed: {years[0]} - {years[-1]} ({len(analytics['files'])} files, "
+                  f"{len(analytics['reparsed'])} re-read)")
+    report.append(f"Gini coefficient (main duties): {analytics['gini']:.3f}")
+    report.append("Percentiles: " + ", ".join(f"{label} {value:.1f}" for label, value in analytics['percentiles'].items()))
+    report.append("")
+
+    report.append("Per person (main / ersatz / longest gap in weeks):")
+    ranked = sorted(analytics['per_person'].items(), key=lambda item: item[1]['main'], reverse=True)
+    for person, totals in ranked:
+        gap = analytics['longest_gaps'].get(person, 0)
+        report.append(f"  {person}: {totals['main']} / {totals['ersatz']} / {gap}")
+
+    report.append("")
+    report.append("Per year (main duties):")
+    for year in years:
+        year_counts = analytics['per_year'][year]
+        report.append(f"  {year}: {sum(year_counts.values())} across {len(year_counts)} people")
+
+    report.append("")
+    report.append("Per month (main duties):")
+    for month, count in analytics['per_month'].items():
+        report.append(f"  {month}: {count}")
+
+    return "\n".join(report)
+
+if __name__ == "__main__":
+    print(get_cross_year_report())
@@ -0,0 +1,122 @@
+"""
+Automatic regeneration of the exports after data changes (opt-in)
+
+AutoExporter is notified on every data commit. It waits until no further
+change arrived for DEBOUNCE_MS, so a generation run or a bulk import
+triggers one export instead of dozens, then runs the export jobs on a
+worker thread. A job that fails with PermissionError (file open in Excel)
+is retried after each of RETRY_DELAYS seconds before it is given up.
+
+Before anything is generated, the source signature (stat of all year
+files and the fairness ledger, output settings, current week) is compared
+with the one of the last successful run - if nothing changed, no export
+is even prepared.
+The exporters themselves still skip unchanged files.
+"""
+
+import time
+import queue
+import threading
+
+DEBOUNCE_MS = 5000
+RETRY_DELAYS = (2, 5, 15, 30, 60)  # seconds between attempts on PermissionError
+POLL_MS = 200
+
+def run_with_retry(job, retry_delays=RETRY_DELAYS, sleep=time.sleep, name="export"):
+    """Run job(), retrying with backoff while the target file is locked
+
+    Raises:
+        PermissionError: still locked after the last retry
+    """
+    for delay in tuple(retry_delays) + (None,):
+        try:
+            return job()
+        except PermissionError as e:
+            if delay is None:
+                raise
+            print(f"🔒 {name}: file locked ({e}) - retrying in {delay}s")
+            sleep(delay)
+
+class AutoExporter:
+    def __init__(self, widget, signature, prepare, on_status=None, delay_ms=DEBOUNCE_MS):
+        """
+        Args:
+            widget: any Tk widget, used for after() scheduling
+            signature(): cheap, stat-based state of the export sources
+            prepare(): called in the Tk thread, returns the jobs as a list of
+                       (name, callable) - the callables run on the worker thread
+            on_status(text, finished): optional, called in the Tk thread with progress messages
+        """
+        self.widget = widget
+        self.signature = signature
+        self.prepare = prepare
+        self.on_status = on_status or (lambda text, finished=False: print(text))
+        self.delay_ms = delay_ms
+        self.enabled = False
+        self.last_signature = None
+        self._after_id = None
+        self._running = False
+        self._dirty = False
+
+    def notify(self, *args):
+        """Data changed - (re)start the debounce timer; usable as data subscriber"""
+        if not self.enabled:
+            return
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+        self._after_id = self.widget.after(self.delay_ms, self._start)
+
+    def cancel(self):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        self._dirty = False
+
+    def _start(self):
+        self._after_id = None
+        if self._running:
+            self._dirty = True  # Run again with the new data when the worker is done
+            return
+        try:
+            signature = self.signature()
+            if signature == self.last_signature:
+                print("📄 Auto export: no changes since the last export")
+                return
+            jobs = self.prepare()
+        except Exception as e:
+            self.on_status(f"❌ Auto export failed: {e}", True)
+            return
+        if not jobs:
+            return
+
+        self._running = True
+        self.on_status("🔄 Auto export running...")
+        results = queue.Queue()
+
+        def worker():
+            failed = []
+            for name, job in jobs:
+                try:
+                    run_with_retry(job, name=name)
+                except Exception as e:
+                    failed.append(f"{name}: {e}")
+            results.put(failed)
+
+        def poll():
+            try:
+                failed = results.get_nowait()
+            except queue.Empty:
+                self.widget.after(POLL_MS, poll)
+                return
+            self._running = False
+            if failed:
+                self.on_status("❌ Auto export failed - " + "; ".join(failed), True)
+            else:
+                self.last_signature = signature
+                self.on_status(f"✅ Auto export done at {time.strftime('%H:%M:%S')}", True)
+            if self._dirty:
+                self._dirty = False
+                self.notify()
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.widget.after(POLL_MS, poll)
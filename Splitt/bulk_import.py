@@ -0,0 +1,314 @@
+"""
+Bulk CSV import of schedules, rosters and availability
+
+Entering weeks one by one in the Manual Management tab rewrites the year
+file once per week. The bulk importer reads up to three CSV files:
+
+    schedule:      Kalenderwoche, Jahr, Person 1, Person 2, Ersatz 1, Ersatz 2
+                   (the Tabelle layout - Datum and Status columns are ignored)
+    roster:        Name, Erfahrung (optional: new, beginner, learning, experienced)
+    availability:  Name, Jahr, Kalenderwoche, Bis KW (optional, for ranges)
+
+All rows of all files are validated in one pass and every problem is
+reported at once. Names are resolved against the roster (including the
+people added by the roster file) via normalize_german_name, so "Jörg"
+finds "Joerg". Only if nothing is wrong the import is committed: one
+write per year file, one ledger write and one write of availability.json.
+"""
+
+import os
+import csv
+import datetime
+
+import data
+import year_files
+import fairness_ledger
+import history_log
+from mentor_matching import AVAILABILITY_FILE
+
+EXPERIENCE_LEVELS = ["new", "beginner", "learning", "experienced"]
+
+# Accepted column names (lower case) per field
+COLUMNS = {
+    'week': ['kalenderwoche', 'kw', 'week'],
+    'year': ['jahr', 'year'],
+    'person1': ['person 1', 'person1'],
+    'person2': ['person 2', 'person2'],
+    'ersatz1': ['ersatz 1', 'ersatz1', 'ersatzperson 1'],
+    'ersatz2': ['ersatz 2', 'ersatz2', 'ersatzperson 2'],
+    'name': ['name', 'person'],
+    'level': ['erfahrung', 'experience', 'level'],
+    'until_week': ['bis kw', 'bis', 'until week'],
+}
+
+def read_csv(path):
+    """Read a CSV exported by Excel (';' or ',' separated, with or without BOM)
+
+    Returns:
+        list: (line number, {field: value}) with fields mapped through COLUMNS
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='') as file:
+        sample = file.read(4096)
+        file.seek(0)
+        delimiter = ';' if sample.split('\n', 1)[0].count(';') > sample.split('\n', 1)[0].count(',') else ','
+        reader = csv.DictReader(file, delimiter=delimiter)
+        field_of = {}
+        for column in reader.fieldnames or []:
+            for field, aliases in COLUMNS.items():
+                if column and column.strip().lower() in aliases:
+                    field_of[column] = field
+        rows = []
+        for row in reader:
+            mapped = {field_of[column]: (value or "").strip() for column, value in row.items() if column in field_of}
+            if any(mapped.values()):
+                rows.append((reader.line_num, mapped))
+        return rows
+
+def classify_csv(path):
+    """'schedule', 'availability', 'roster' or None, detected from the header row"""
+    rows = read_csv(path)
+    fields = set()
+    for line, row in rows[:1]:
+        fields = set(row)
+    if not rows:
+        # Header only - look at the columns
+        with open(path, 'r', encoding='utf-8-sig', newline='') as file:
+            header = file.readline().lower()
+        fields = {field for field, aliases in COLUMNS.items() if any(alias in header for alias in aliases)}
+    if 'person1' in fields or 'person2' in fields:
+        return 'schedule'
+    if 'name' in fields and 'week' in fields:
+        return 'availability'
+    if 'name' in fields:
+        return 'roster'
+    return None
+
+def _parse_int(text):
+    digits = "".join(char for char in str(text) if char.isdigit())
+    return int(digits) if digits else None
+
+def _weeks_in_year(year):
+    return datetime.date(year, 12, 28).isocalendar()[1]
+
+class NameResolver:
+    """Map names from CSV files to roster names"""
+    def __init__(self, people):
+        self.people = list(people)
+        self.lookup = {}
+        for person in self.people:
+            self.add(person)
+
+    def add(self, person):
+        self.lookup.setdefault(person, person)
+        self.lookup.setdefault(data.normalize_german_name(person).lower(), person)
+
+    def resolve(self, name):
+        """Roster name or None"""
+        if name in self.lookup:
+            return self.lookup[name]
+        return self.lookup.get(data.normalize_german_name(name.strip()).lower())
+
+def validate_import(schedule_path=None, roster_path=None, availability_path=None):
+    """Validate all files in one pass
+
+    Returns:
+        tuple: (plan dict, list of problem strings) - the plan is only used if there are no problems
+    """
+    problems = []
+    plan = {'new_people': [], 'levels': {}, 'weeks': {}, 'unavailable': {}}
+    resolver = NameResolver(data.PEOPLE)
+
+    def read(path, label):
+        try:
+            return read_csv(path)
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            problems.append(f"{label}: cannot read {path}: {e}")
+            return []
+
+    def resolve(label, line, name, column):
+        person = resolver.resolve(name)
+        if person is None:
+            problems.append(f"{label} line {line}: unknown person '{name}' in {column}")
+        return person
+
+    # Roster first - its people may be used by the other files
+    if roster_path:
+        for line, row in read(roster_path, "Roster"):
+            name = row.get('name', '')
+            normalized = data.normalize_german_name(name)
+            if not normalized or not normalized.replace(" ", "").isalpha():
+                problems.append(f"Roster line {line}: invalid name '{name}' (letters only)")
+                continue
+            person = resolver.resolve(normalized)
+            if person is None:
+                person = normalized
+                plan['new_people'].append(person)
+                resolver.add(person)
+            level = row.get('level', '').lower()
+            if level:
+                if level not in EXPERIENCE_LEVELS:
+                    problems.append(f"Roster line {line}: invalid experience level '{level}' for {person} "
+                                    f"(one of {', '.join(EXPERIENCE_LEVELS)})")
+                else:
+                    plan['levels'][person] = level
+
+    if schedule_path:
+        for line, row in read(schedule_path, "Schedule"):
+            year, week = _parse_int(row.get('year', '')), _parse_int(row.get('week', ''))
+            if year is None or not 2000 <= year <= 2100:
+                problems.append(f"Schedule line {line}: invalid year '{row.get('year', '')}'")
+                continue
+            if week is None or not 1 <= week <= _weeks_in_year(year):
+                problems.append(f"Schedule line {line}: invalid calendar week '{row.get('week', '')}' for {year}")
+                continue
+            if week in plan['weeks'].get(year, {}):
+                problems.append(f"Schedule line {line}: {year} KW {week} appears more than once")
+                continue
+
+            main = []
+            for column in ('person1', 'person2'):
+                if not row.get(column):
+                    problems.append(f"Schedule line {line}: {year} KW {week} is missing {column.replace('person', 'Person ')}")
+                else:
+                    main.append(resolve("Schedule", line, row[column], column.replace('person', 'Person ')))
+            ersatz = [resolve("Schedule", line, row[column], column.replace('ersatz', 'Ersatz '))
+                      if row.get(column) else "" for column in ('ersatz1', 'ersatz2')]
+            if len(main) < 2 or None in main or None in ersatz:
+                continue
+            if main[0] == main[1]:
+                problems.append(f"Schedule line {line}: {year} KW {week} has {main[0]} twice as main person")
+                continue
+            if ersatz[0] and ersatz[0] == ersatz[1]:
+                problems.append(f"Schedule line {line}: {year} KW {week} has {ersatz[0]} twice as ErsatzPerson")
+                continue
+            if any(person in main for person in ersatz if person):
+                problems.append(f"Schedule line {line}: {year} KW {week} has an ErsatzPerson who is also a main person")
+                continue
+            plan['weeks'].setdefault(year, {})[week] = (main, ersatz)
+
+    if availability_path:
+        for line, row in read(availability_path, "Availability"):
+            person = resolve("Availability", line, row.get('name', ''), "Name")
+            year, week = _parse_int(row.get('year', '')), _parse_int(row.get('week', ''))
+            until = _parse_int(row.get('until_week', '')) if row.get('until_week') else week
+            if year is None or week is None or until is None or not 1 <= week <= until <= _weeks_in_year(year or 2000):
+                problems.append(f"Availability line {line}: invalid year/week '{row.get('year', '')}' "
+                                f"KW '{row.get('week', '')}'-'{row.get('until_week', '')}'")
+                continue
+            if person:
+                plan['unavailable'].setdefault(person, set()).update((year, number) for number in range(week, until + 1))
+
+    return plan, problems
+
+def _apply_weeks(history, year, weeks):
+    """Replace the given weeks in a {person: [entries]} history in place"""
+    prefixes = tuple(f"{year} KW {week}:" for week in weeks)
+    for person, entries in history.items():
+        if isinstance(entries, list):
+            history[person] = [entry for entry in entries if not entry.startswith(prefixes)]
+    for week in sorted(weeks):
+        main, ersatz = weeks[week]
+        entry = year_files.format_week_entry(year, week, main[0], main[1], ersatz[0], ersatz[1])
+        for person in dict.fromkeys(main + ersatz):
+            if person:
+                history.setdefault(person, []).append(entry)
+
+def commit_import(plan):
+    """Write a validated plan - one write per touched file
+
+    Returns:
+        dict: counts of 'people', 'levels', 'weeks' and 'unavailable' entries imported
+    """
+    current_year = data.get_current_year()
+    roster_changed = bool(plan['new_people'] or plan['levels'])
+
+    # Stage the roster on copies - the loaded data is only changed once the
+    # other year files are written, so a failed write leaves it untouched
+    people, weights, extra_weights = data.PEOPLE.copy(), data.WEIGHTS.copy(), data.EXTRA_WEIGHTS.copy()
+    new_roster = []
+    for person in plan['new_people']:
+        weight = data.calculate_initial_weight(weights)
+        extra_weight = data.calculate_initial_extra_weight(extra_weights)
+        people.append(person)
+        weights.append(weight)
+        extra_weights.append(extra_weight)
+        new_roster.append((person, weight, extra_weight))
+
+    # Other years: read, change and replace each file once
+    for year, weeks in sorted(plan['weeks'].items()):
+        target_file = f"people_{year}.json"
+        if target_file == data.FILE_PATH:
+            continue
+        file_data = year_files.read_year_file(target_file) if os.path.exists(target_file) else None
+        if file_data is None:
+            file_data = {
+                "PEOPLE": people.copy(),
+                "WEIGHTS": weights.copy(),
+                "EXTRA_WEIGHTS": extra_weights.copy(),
+                "WATERING_HISTORY": {person: [] for person in people}
+            }
+        _apply_weeks(file_data.setdefault("WATERING_HISTORY", {}), year, weeks)
+        year_files.atomic_write_json(target_file, file_data)
+        data.invalidate_week_cache(year)
+
+    # Roster changes and weeks of the loaded year
+    for person, weight, extra_weight in new_roster:
+        data.PEOPLE.append(person)
+        data.WEIGHTS.append(weight)
+        data.EXTRA_WEIGHTS.append(extra_weight)
+        data.watering_history.setdefault(person, [])
+        history_log.record_event('person_added', person=person, weight=weight, extra_weight=extra_weight)
+    for person, level in plan['levels'].items():
+        data.experience_overrides[person] = level
+        history_log.record_event('experience_override', person=person, level=level)
+    for year, weeks in sorted(plan['weeks'].items()):
+        if f"people_{year}.json" == data.FILE_PATH:
+            _apply_weeks(data.watering_history, year, weeks)
+
+    if roster_changed or current_year in plan['weeks']:
+        # Recomputes the weights and saves the loaded year file once
+        data.update_weights()
+    if roster_changed:
+        data.save_base_people_template()
+
+    imported_weeks = [(year, week, weeks[week][0]) for year, weeks in sorted(plan['weeks'].items())
+                      for week in sorted(weeks)]
+    if imported_weeks:
+        fairness_ledger.record_weeks(imported_weeks, data.PEOPLE)
+        for year, weeks in sorted(plan['weeks'].items()):
+            for week in sorted(weeks):
+                history_log.record_week('week_edited', year, week, weeks[week][0], weeks[week][1], source='bulk_import')
+
+    if plan['unavailable']:
+        existing = year_files.read_year_file(AVAILABILITY_FILE) if os.path.exists(AVAILABILITY_FILE) else None
+        unavailable = (existing or {}).get("unavailable", {})
+        for person, weeks in plan['unavailable'].items():
+            keys = set(unavailable.get(person, [])) | {f"{year}-{week}" for year, week in weeks}
+            unavailable[person] = sorted(keys, key=lambda key: [int(part) for part in key.split("-")])
+        year_files.atomic_write_json(AVAILABILITY_FILE, {"unavailable": unavailable})
+
+    if roster_changed:
+        data.emit(data.ROSTER_CHANGED, people=plan['new_people'] + list(plan['levels']))
+    for year, weeks in sorted(plan['weeks'].items()):
+        data.emit(data.WEEK_CHANGED, year=year, weeks=sorted(weeks))
+
+    counts = {
+        'people': len(plan['new_people']),
+        'levels': len(plan['levels']),
+        'weeks': len(imported_weeks),
+        'unavailable': sum(len(weeks) for weeks in plan['unavailable'].values())
+    }
+    print(f"📥 Bulk import: {counts['weeks']} weeks, {counts['people']} new people, "
+          f"{counts['levels']} experience levels, {counts['unavailable']} unavailable weeks")
+    return counts
+
+def bulk_import(schedule_path=None, roster_path=None, availability_path=None):
+    """Validate and, if everything is valid, commit an import
+
+    Returns:
+        tuple: (counts dict or None, list of problems)
+    """
+    plan, problems = validate_import(schedule_path, roster_path, availability_path)
+    if problems:
+        return None, problems
+    return commit_import(plan), []
@@ -0,0 +1,34 @@
+"""
+Expected-vs-current diff of the CSV Tabelle
+
+Hash join of two row lists on their (Jahr, Kalenderwoche) key: both sides
+are indexed once into {key: row hash} dicts (csv_export.index_rows), so a
+diff is O(n) even for multi-year files. Each key ends up as
+
+    added    - only in the expected rows (missing in the CSV)
+    removed  - only in the CSV rows
+    changed  - in both, with different values
+    same     - in both, identical
+
+The Tabelle tab highlights the differing rows with it; csv_export uses
+the same join against its manifest to decide whether the CSV is written.
+"""
+
+from csv_export import index_rows, diff_index
+
+def diff_rows(expected_rows, current_rows):
+    """Diff the expected rows (schedule model) against the rows of the CSV"""
+    return diff_index(index_rows(expected_rows), index_rows(current_rows))
+
+def row_states(result):
+    """{key: state} of all differing keys - 'same' keys are left out"""
+    states = {}
+    for state in ('added', 'removed', 'changed'):
+        for key in result[state]:
+            states[key] = state
+    return states
+
+def summary(result):
+    """Short text like "2 new, 1 changed, 0 removed" """
+    return (f"{len(result['added'])} new, {len(result['changed'])} changed, "
+            f"{len(result['removed'])} removed")
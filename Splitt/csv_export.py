@@ -0,0 +1,227 @@
+"""
+Incremental CSV Tabelle export
+
+The Tabelle CSV lives on a network share that Excel users keep open, so
+every rewrite is slow and briefly locks them out. A row-hash manifest is
+kept next to the CSV ("giessplan_2025.csv.manifest.json"): each row is
+hashed by its (Jahr, Kalenderwoche) key and the file is only written when
+a row was added, changed, removed or moved. The comparison is a hash
+join on the row keys (index_rows/diff_index, also used by csv_diff for
+the Tabelle tab); if the CSV on disk no longer matches the size/mtime
+recorded in the manifest, it is read and diffed directly instead.
+
+A write streams the rows into a temporary file in the same folder and
+replaces the CSV with os.replace, so readers never see a half written
+file. The CSV is left read-only like before.
+"""
+
+import os
+import csv
+import stat
+import json
+import hashlib
+import tempfile
+
+import year_files
+
+FIELDNAMES = ['Kalenderwoche', 'Jahr', 'Datum', 'Person 1', 'Person 2', 'Ersatz 1', 'Ersatz 2', 'Status']
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+STATES = ('added', 'removed', 'changed', 'same')
+
+def schedule_rows(schedule_data):
+    """CSV row dicts from TabelleManager.get_schedule_data() items"""
+    return [{
+        'Kalenderwoche': item['week'],
+        'Jahr': item['year'],
+        'Datum': item['date_range'],
+        'Person 1': item['person1'],
+        'Person 2': item['person2'],
+        'Ersatz 1': item['ersatz1'],
+        'Ersatz 2': item['ersatz2'],
+        'Status': item['status']
+    } for item in schedule_data]
+
+def row_key(row):
+    """Manifest key of a row, e.g. "2025|KW 32" """
+    return f"{row.get('Jahr', '')}|{row.get('Kalenderwoche', '')}"
+
+def row_hash(row):
+    """SHA-1 of the row values in FIELDNAMES order"""
+    values = "\x1f".join(str(row.get(field, '')) for field in FIELDNAMES)
+    return hashlib.sha1(values.encode('utf-8')).hexdigest()
+
+def index_rows(rows):
+    """(keys in row order, {key: row hash}) of row dicts"""
+    keys = []
+    hashes = {}
+    for row in rows:
+        key = row_key(row)
+        keys.append(key)
+        hashes[key] = row_hash(row)
+    return keys, hashes
+
+def diff_index(expected, current):
+    """Diff two (keys, hashes) indexes
+
+    Returns:
+        dict: key lists 'added', 'removed', 'changed' and 'same', plus
+              'moved' (True if only the row order or duplicates differ)
+    """
+    expected_keys, expected_hashes = expected
+    current_keys, current_hashes = current
+    result = {state: [] for state in STATES}
+    for key, value in expected_hashes.items():
+        other = current_hashes.get(key)
+        if other is None:
+            result['added'].append(key)
+        elif other != value:
+            result['changed'].append(key)
+        else:
+            result['same'].append(key)
+    result['removed'] = [key for key in current_hashes if key not in expected_hashes]
+    result['moved'] = not (result['added'] or result['removed']) and expected_keys != current_keys
+    return result
+
+def has_differences(result):
+    return bool(result['added'] or result['removed'] or result['changed'] or result['moved'])
+
+def manifest_path(csv_path):
+    return csv_path + MANIFEST_SUFFIX
+
+def load_manifest(csv_path):
+    """Manifest of the last export or None if missing/unreadable"""
+    try:
+        with open(manifest_path(csv_path), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != MANIFEST_VERSION or manifest.get('fieldnames') != FIELDNAMES:
+        return None
+    return manifest
+
+def file_signature(path):
+    """(size, mtime_ns) of a file or None if it does not exist"""
+    try:
+        stat_info = os.stat(path)
+    except OSError:
+        return None
+    return [stat_info.st_size, stat_info.st_mtime_ns]
+
+def read_rows(csv_path):
+    """Row dicts of a CSV or None if it is missing or has other columns"""
+    try:
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='') as csvfile:
+            reader = csv.DictReader(csvfile)
+            if reader.fieldnames != FIELDNAMES:
+                return None
+            return list(reader)
+    except (OSError, UnicodeDecodeError, csv.Error):
+        return None
+
+def compare_rows(manifest, rows):
+    """Compare rows with the manifest of the last export
+
+    Returns:
+        dict: diff_index result - row keys 'added', 'changed', 'removed', 'same'
+              and 'moved' (True if only the order differs)
+    """
+    previous = (manifest.get('order', []), manifest.get('rows', {})) if manifest else ([], {})
+    return diff_index(index_rows(rows), previous)
+
+def needs_write(csv_path, rows, manifest=None):
+    """Decide whether the CSV has to be written
+
+    Returns:
+        tuple: (bool, differences dict of compare_rows)
+    """
+    manifest = load_manifest(csv_path) if manifest is None else manifest
+    if manifest is None or file_signature(csv_path) != manifest.get('file'):
+        # No manifest, or the file was hand-edited or replaced by someone
+        # else - diff against the file itself so an identical file is kept
+        current_rows = read_rows(csv_path)
+        if current_rows is None:
+            return True, compare_rows(None, rows)
+        differences = diff_index(index_rows(rows), index_rows(current_rows))
+    else:
+        differences = compare_rows(manifest, rows)
+    return has_differences(differences), differences
+
+def _make_writable(path):
+    try:
+        os.chmod(path, stat.S_IWRITE | stat.S_IREAD)
+    except OSError:
+        pass  # Continue anyway, os.replace reports the real problem
+
+def _make_read_only(path):
+    # Some network drives do not support permissions - the CSV stays writable then
+    try:
+        os.chmod(path, stat.S_IREAD | stat.S_IRGRP | stat.S_IROTH)
+    except OSError:
+        pass
+
+def write_csv_atomic(csv_path, rows):
+    """Stream rows into a temporary file and replace the CSV with it"""
+    folder = os.path.dirname(os.path.abspath(csv_path))
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp_", suffix=".csv", dir=folder)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8-sig', newline='') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+        if os.path.exists(csv_path):
+            # A read-only target cannot be replaced on Windows
+            _make_writable(csv_path)
+        os.replace(temp_path, csv_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    _make_read_only(csv_path)
+
+def save_manifest(csv_path, rows):
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'fieldnames': FIELDNAMES,
+        'file': file_signature(csv_path),
+        'order': [row_key(row) for row in rows],
+        'rows': {row_key(row): row_hash(row) for row in rows}
+    }
+    year_files.atomic_write_json(manifest_path(csv_path), manifest, public=True)
+
+def export_rows(csv_path, rows, force=False):
+    """Write the CSV only if its content changed
+
+    Args:
+        csv_path: target CSV file
+        rows: row dicts with FIELDNAMES keys
+        force: write even if the manifest says nothing changed
+
+    Returns:
+        dict: 'written' (bool) plus the 'added', 'changed' and 'removed' row keys
+
+    Raises:
+        PermissionError: the CSV is locked (e.g. open in Excel)
+    """
+    manifest = load_manifest(csv_path)
+    write, differences = needs_write(csv_path, rows, manifest)
+    if write or force:
+        write_csv_atomic(csv_path, rows)
+        try:
+            save_manifest(csv_path, rows)
+        except OSError as e:
+            # Without a manifest the next export simply writes again
+            print(f"Error writing {manifest_path(csv_path)}: {e}")
+        print(f"📄 CSV written: {csv_path} ({len(differences['added'])} added, "
+              f"{len(differences['changed'])} changed, {len(differences['removed'])} removed)")
+    else:
+        if manifest is None or file_signature(csv_path) != manifest.get('file'):
+            # The file itself matched - remember it so the next check needs no read
+            try:
+                save_manifest(csv_path, rows)
+            except OSError as e:
+                print(f"Error writing {manifest_path(csv_path)}: {e}")
+        print(f"📄 CSV unchanged, skipped writing {csv_path}")
+    differences['written'] = write or force
+    return differences
@@ -0,0 +1,125 @@
+"""
+Background loading of the "Current CSV Content" preview
+
+The CSV on the network share can hold several years and reading it in
+the Tk thread froze the Tabelle tab. CsvPreviewLoader reads the file in
+chunks of CHUNK_ROWS rows on a worker thread; the Tk side polls a queue
+and hands the rows read so far to the (virtual) treeview, so the first
+rows show up right away.
+
+Parsed rows are cached per path and keyed on (size, mtime), so switching
+tabs or refreshing does not read an unchanged file again. The exporter
+stores the rows it just wrote with remember().
+"""
+
+import csv
+import queue
+import threading
+
+from csv_export import file_signature
+
+CHUNK_ROWS = 2000
+POLL_MS = 50
+
+_cache = {}  # path -> (signature, rows)
+
+def cached_rows(path, signature=None):
+    """Cached rows of a file if it is unchanged, otherwise None"""
+    signature = file_signature(path) if signature is None else signature
+    cached = _cache.get(path)
+    if cached and signature is not None and cached[0] == signature:
+        return cached[1]
+    return None
+
+def remember(path, rows):
+    """Cache rows that are known to be the current content of a file"""
+    signature = file_signature(path)
+    if signature is not None:
+        _cache[path] = (signature, rows)
+
+def read_chunks(path, chunk_rows=CHUNK_ROWS, cancel_event=None):
+    """Yield lists of row dicts, chunk_rows at a time"""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as csvfile:
+        chunk = []
+        for row in csv.DictReader(csvfile):
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                yield chunk
+                chunk = []
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+        if chunk:
+            yield chunk
+
+class CsvPreviewLoader:
+    def __init__(self, widget):
+        """widget: any Tk widget, used for after() polling"""
+        self.widget = widget
+        self.cancel_event = None
+
+    def cancel(self):
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+            self.cancel_event = None
+
+    def load(self, path, on_rows, on_done, on_error):
+        """Load a CSV, from the cache if unchanged, otherwise in the background
+
+        Args:
+            on_rows(rows): called in the Tk thread with the rows read so far while loading
+            on_done(rows): called once with the complete rows
+            on_error(exception): called if the file cannot be read
+
+        Returns:
+            bool: True if the rows came from the cache (callbacks already called)
+        """
+        self.cancel()
+        signature = file_signature(path)
+        rows = cached_rows(path, signature)
+        if rows is not None:
+            on_done(rows)
+            return True
+
+        cancel_event = self.cancel_event = threading.Event()
+        results = queue.Queue()
+
+        def worker():
+            try:
+                for chunk in read_chunks(path, cancel_event=cancel_event):
+                    results.put(('rows', chunk))
+                results.put(('done', None))
+            except Exception as e:
+                results.put(('error', e))
+
+        rows = []
+
+        def poll():
+            if cancel_event.is_set():
+                return  # A newer load took over
+            received = False
+            try:
+                while True:
+                    message, payload = results.get_nowait()
+                    if message == 'rows':
+                        rows.extend(payload)
+                        received = True
+                    elif message == 'done':
+                        self.cancel_event = None
+                        # Only cache if the file did not change while it was read
+                        if file_signature(path) == signature:
+                            _cache[path] = (signature, rows)
+                        on_done(rows)
+                        return
+                    else:
+                        self.cancel_event = None
+                        on_error(payload)
+                        return
+            except queue.Empty:
+                pass
+            if received:
+                on_rows(rows)
+            self.widget.after(POLL_MS, poll)
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.widget.after(POLL_MS, poll)
+        return False
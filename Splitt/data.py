@@ -1,7 +1,13 @@
 import json
 import os
+import heapq
 import datetime
 from tkinter import messagebox
+from year_files import parse_week_entry, format_week_entry
+import fairness_ledger
+import history_log
+import startup_profiler
+from schedule_model import ScheduleModel
 
 FILE_PATH = "people.json"
 
@@ -12,6 +18,47 @@ EXTRA_WEIGHTS = []
 watering_history = {}
 experience_overrides = {}  # Manual experience level overrides
 
+# Change notification - views subscribe to the events they render
+ROSTER_CHANGED = "RosterChanged"      # person added/removed or experience level changed
+WEEK_CHANGED = "WeekChanged"          # week assignments changed (details: year, weeks)
+YEAR_SWITCHED = "YearSwitched"        # another year file loaded or the current one reloaded
+WEIGHTS_CHANGED = "WeightsChanged"    # WEIGHTS / EXTRA_WEIGHTS recomputed
+_subscribers = {}
+
+def subscribe(event_type, callback):
+    """Call callback(event_type, details) whenever event_type is emitted"""
+    _subscribers.setdefault(event_type, []).append(callback)
+
+def unsubscribe(event_type, callback):
+    if callback in _subscribers.get(event_type, []):
+        _subscribers[event_type].remove(callback)
+
+# Bumped on every change of the in-memory data - cached views compare it
+DATA_VERSION = 0
+_schedule_model = None
+
+def bump_data_version():
+    global DATA_VERSION
+    DATA_VERSION += 1
+
+def get_schedule_model():
+    """Parsed week records of the current watering history, rebuilt once per data version"""
+    global _schedule_model
+    if (_schedule_model is None or _schedule_model.version != DATA_VERSION
+            or _schedule_model.history is not watering_history):
+        _schedule_model = ScheduleModel(watering_history, DATA_VERSION)
+        _schedule_model.history = watering_history
+    return _schedule_model
+
+def emit(event_type, **details):
+    """Notify all subscribers of a data change"""
+    bump_data_version()
+    for callback in list(_subscribers.get(event_type, [])):
+        try:
+            callback(event_type, details)
+        except Exception as e:
+            print(f"Error in {event_type} subscriber: {e}")
+
 def normalize_german_name(name):
     """Normalize German umlauts to prevent encoding issues"""
     if not name:
@@ -78,17 +125,19 @@ def save_base_people_template():
         print(f"Error saving people.json template: {e}")
         return False
 
-def calculate_initial_weight():
+def calculate_initial_weight(weights=None):
     """Calculate initial weight for new person: 10 if no one exists, otherwise average"""
-    if not WEIGHTS:
+    weights = WEIGHTS if weights is None else weights
+    if not weights:
         return 10
-    return sum(WEIGHTS) // len(WEIGHTS)
+    return sum(weights) // len(weights)
 
-def calculate_initial_extra_weight():
+def calculate_initial_extra_weight(extra_weights=None):
     """Calculate initial extra weight for new person"""
-    if not EXTRA_WEIGHTS:
+    extra_weights = EXTRA_WEIGHTS if extra_weights is None else extra_weights
+    if not extra_weights:
         return 3
-    return sum(EXTRA_WEIGHTS) // len(EXTRA_WEIGHTS)
+    return sum(extra_weights) // len(extra_weights)
 
 def get_previous_year_data(target_year):
     """Get data from the previous year to use as template for new year"""
@@ -112,6 +161,55 @@ def get_previous_year_data(target_year):
     
     return None
 
+# Parsed week assignments per year file, validated by (mtime, size) so the
+# manual week editor does not re-read the file for every lookup
+_week_cache = {}
+
+def invalidate_week_cache(year=None):
+    """Drop the cached week assignments of one year, or of all years"""
+    if year is None:
+        _week_cache.clear()
+    else:
+        _week_cache.pop(int(year), None)
+
+def _get_year_model(year):
+    """ScheduleModel of one year file (empty if the file does not exist)"""
+    target_file = f"people_{year}.json"
+    try:
+        stat = os.stat(target_file)
+    except OSError:
+        _week_cache.pop(year, None)
+        return ScheduleModel({})
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _week_cache.get(year)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    with open(target_file, "r") as file:
+        data = json.load(file)
+    model = ScheduleModel(data.get("WATERING_HISTORY", {}))
+    _week_cache[year] = (signature, model)
+    return model
+
+def prefetch_week_data(year, week):
+    """Load the year files of the weeks before and after year/week into the cache
+
+    Weeks of the same year share one cache entry, so this only reads a file
+    when the neighbouring week belongs to the previous or next year.
+    """
+    try:
+        year, week = int(year), int(week)
+    except (TypeError, ValueError):
+        return
+    weeks_in_year = lambda y: datetime.date(y, 12, 28).isocalendar()[1]
+    neighbours = [(year, week - 1) if week > 1 else (year - 1, weeks_in_year(year - 1)),
+                  (year, week + 1) if week < weeks_in_year(year) else (year + 1, 1)]
+    for neighbour_year, _ in neighbours:
+        try:
+            _get_year_model(neighbour_year)
+        except (OSError, ValueError) as e:
+            print(f"Error prefetching people_{neighbour_year}.json: {e}")
+
 def save_to_file():
     """Save current data to the active file"""
     global FILE_PATH
@@ -124,6 +222,8 @@ def save_to_file():
                 "WATERING_HISTORY": watering_history,
                 "EXPERIENCE_OVERRIDES": experience_overrides
             }, file, indent=2, ensure_ascii=False)
+        invalidate_week_cache()
+        bump_data_version()
     except PermissionError:
         print(f"Permission error writing to {FILE_PATH} - file may be open in another application")
         raise PermissionError(f"Cannot write to {FILE_PATH} - file may be open in another application")
@@ -174,13 +274,17 @@ def load_year_data(year):
                 experience_overrides.clear()
                 experience_overrides.update(data.get("EXPERIENCE_OVERRIDES", {}))
                 FILE_PATH = target_file
+                emit(YEAR_SWITCHED, year=int(year))
                 return True
         except (json.JSONDecodeError, Exception) as e:
             print(f"Error loading {target_file}: {e}")
             return False
     else:
         # File doesn't exist, create new year file
-        return create_new_year_file(year)
+        created = create_new_year_file(year)
+        if created:
+            emit(YEAR_SWITCHED, year=int(year))
+        return created
 
 def create_new_year_file(year):
     """Create a new year file, using previous year's balanced weights"""
@@ -281,6 +385,8 @@ def initialize_system():
     current_year = get_current_year()
     if not load_year_data(current_year):
         print(f"Failed to initialize system for year {current_year}")
+        return
+    history_log.ensure_baseline(PEOPLE, WEIGHTS, EXTRA_WEIGHTS, experience_overrides, watering_history)
 
 def get_current_year():
     """Get the year currently being worked on"""
@@ -293,10 +399,15 @@ def get_current_year():
         return int(match.group(1)) if match else datetime.date.today().year
 
 # Initialize the system on import
-initialize_system()
+with startup_profiler.phase("data.initialize_system"):
+    initialize_system()
 
-def reload_current_data():
-    """Reload data from the currently selected file"""
+def reload_current_data(notify=True):
+    """Reload data from the currently selected file
+    
+    Args:
+        notify: emit YEAR_SWITCHED so that views redraw the reloaded data
+    """
     global FILE_PATH, PEOPLE, WEIGHTS, EXTRA_WEIGHTS, watering_history, experience_overrides
     
     # Use the current FILE_PATH instead of getting the most recent file
@@ -314,17 +425,25 @@ def reload_current_data():
                 watering_history.update(data.get("WATERING_HISTORY", {}))
                 experience_overrides.clear()
                 experience_overrides.update(data.get("EXPERIENCE_OVERRIDES", {}))
+            bump_data_version()
+            if notify:
+                emit(YEAR_SWITCHED, year=get_current_year(), reloaded=True)
         except json.JSONDecodeError:
             pass  # Keep current data if file is corrupted
 
-def get_person_experience_level(person):
-    """Get experience level of a person based on their watering history or manual override"""
+def get_person_experience_level(person, history=None):
+    """Get experience level of a person based on their watering history or manual override
+    
+    Args:
+        history: watering history to count in, defaults to the loaded one
+    """
     # Check if there's a manual override first
     if person in experience_overrides:
         return experience_overrides[person]
     
     # Default to automatic calculation based on watering history
-    watering_count = len(watering_history.get(person, []))
+    history = watering_history if history is None else history
+    watering_count = len(history.get(person, []))
     if watering_count == 0:
         return "new"
     elif watering_count <= 2:
@@ -356,10 +475,12 @@ def set_person_experience_level(person, level):
     
     # Set the manual override
     experience_overrides[person] = level
+    history_log.record_event('experience_override', person=person, level=level)
     print(f"Set {person}'s experience level to '{level}'")
+    emit(ROSTER_CHANGED, person=person)
     
-    # Save to file
-    save_to_file()
+    # Experience levels feed the weights - recompute and save in one write
+    update_weights()
     return True
 
 def remove_person_experience_override(person):
@@ -373,35 +494,41 @@ def remove_person_experience_override(person):
     """
     if person in experience_overrides:
         del experience_overrides[person]
+        history_log.record_event('experience_override', person=person, level=None)
         print(f"Removed experience level override for {person}")
-        save_to_file()
+        emit(ROSTER_CHANGED, person=person)
+        update_weights()
         return True
     else:
         print(f"No experience level override found for {person}")
         return False
 
-def get_all_experience_levels():
+def get_all_experience_levels(history=None):
     """Get experience levels for all people
     
+    Args:
+        history: watering history to count in, defaults to the loaded one
+    
     Returns:
         dict: Dictionary mapping person names to their experience levels
     """
-    return {person: get_person_experience_level(person) for person in PEOPLE}
+    return {person: get_person_experience_level(person, history) for person in PEOPLE}
 
-def get_experienced_people():
+def get_experienced_people(history=None):
     """Get list of experienced people who can mentor newcomers"""
     experienced = []
     for person in PEOPLE:
-        if get_person_experience_level(person) == "experienced":
+        if get_person_experience_level(person, history) == "experienced":
             experienced.append(person)
     return experienced
 
-def get_new_people():
+def get_new_people(history=None):
     """Get list of new people who need mentoring"""
+    history = watering_history if history is None else history
     new_people = []
     for person in PEOPLE:
-        experience_level = get_person_experience_level(person)
-        watering_count = len(watering_history.get(person, []))
+        experience_level = get_person_experience_level(person, history)
+        watering_count = len(history.get(person, []))
         
         # Include people who are new, beginner, or learning with low watering counts
         if (experience_level in ["new", "beginner"] or 
@@ -411,6 +538,8 @@ def get_new_people():
 
 def update_weights():
     """Update weights based on watering history to maintain balance - newcomer friendly"""
+    previous_weights = (list(WEIGHTS), list(EXTRA_WEIGHTS))
+    
     # Calculate total weeks active in system - filter out non-list entries
     all_week_entries = []
     for entries in watering_history.values():
@@ -474,8 +603,11 @@ def update_weights():
     
     # Normalize weights if they become too extreme
     normalize_extreme_weights()
+    history_log.record_weights('update_weights', PEOPLE, WEIGHTS, EXTRA_WEIGHTS)
     
     save_to_file()
+    if (WEIGHTS, EXTRA_WEIGHTS) != previous_weights:
+        emit(WEIGHTS_CHANGED)
 
 # Excel functions removed - using JSON-only data storage
 
@@ -538,6 +670,7 @@ def refresh_dependencies():
     
     update_weights()
     normalize_extreme_weights()
+    history_log.record_weights('refresh_dependencies', PEOPLE, WEIGHTS, EXTRA_WEIGHTS)
     save_to_file()
 
 def add_new_person_with_context(name, join_week=None):
@@ -556,13 +689,16 @@ def add_new_person_with_context(name, join_week=None):
     WEIGHTS.append(initial_weight)
     EXTRA_WEIGHTS.append(initial_extra_weight)
     watering_history[normalized_name] = []
+    history_log.record_event('person_added', person=normalized_name, weight=initial_weight,
+                             extra_weight=initial_extra_weight, join_week=join_week)
     
     # Update base template when adding new person
     save_base_people_template()
     
-    # Update all weights to maintain system balance
+    emit(ROSTER_CHANGED, person=normalized_name)
+    
+    # Update all weights to maintain system balance (saves the file)
     update_weights()
-    save_to_file()
     return True
 
 def remove_person_and_rebalance(name):
@@ -591,70 +727,30 @@ def remove_person_and_rebalance(name):
         EXTRA_WEIGHTS.pop(index)
     watering_history.pop(name, None)
     experience_overrides.pop(name, None)  # Remove experience override if it exists
+    history_log.record_event('person_removed', person=name, waterings=leaving_person_waterings)
     
     # Update base template when removing person
     save_base_people_template()
     
+    emit(ROSTER_CHANGED, person=name)
+    
     # Recalculate weights based on new system balance
     # The system should naturally rebalance through the normal weight update process
     update_weights()
-    save_to_file()
     return True
 
 def get_week_data(year, week):
     """Find the two people assigned for a given year and week."""
-    target_file = f"people_{year}.json"
-    if os.path.exists(target_file):
-        with open(target_file, "r") as file:
-            data = json.load(file)
-        wh = data.get("WATERING_HISTORY", {})
-        week_str = f"{year} KW {week}:"
-        for entries in wh.values():
-            for entry in entries:
-                if entry.startswith(week_str):
-                    # Example entry: "2025 KW 30: Jan and Jeff"
-                    try:
-                        people_part = entry.split(":")[1].strip()
-                        person1, _, person2 = people_part.partition(" and ")
-                        return [person1.strip(), person2.strip()]
-                    except Exception:
-                        continue
-    return ["", ""]
+    return get_week_data_with_ersatz(year, week)[:2]
 
 def get_week_data_with_ersatz(year, week):
     """Find all four people assigned for a given year and week (main persons and ErsatzPersons)."""
-    target_file = f"people_{year}.json"
-    if os.path.exists(target_file):
-        with open(target_file, "r") as file:
-            data = json.load(file)
-        wh = data.get("WATERING_HISTORY", {})
-        week_str = f"{year} KW {week}:"
-        for entries in wh.values():
-            for entry in entries:
-                if entry.startswith(week_str):
-                    # Example entry: "2025 KW 30: Jan and Jeff (ErsatzPersons: Rosa and Alexander)"
-                    try:
-                        # Split the entry to get main part and ersatz part
-                        if "(ErsatzPersons:" in entry:
-                            main_part = entry.split("(ErsatzPersons:")[0].strip()
-                            ersatz_part = entry.split("(ErsatzPersons:")[1].strip().rstrip(")")
-                            
-                            # Extract main persons
-                            people_part = main_part.split(":")[1].strip()
-                            person1, _, person2 = people_part.partition(" and ")
-                            
-                            # Extract ersatz persons
-                            ersatz_person1, _, ersatz_person2 = ersatz_part.partition(" and ")
-                            
-                            return [person1.strip(), person2.strip(), ersatz_person1.strip(), ersatz_person2.strip()]
-                        else:
-                            # Old format without ErsatzPersons
-                            people_part = entry.split(":")[1].strip()
-                            person1, _, person2 = people_part.partition(" and ")
-                            return [person1.strip(), person2.strip(), "", ""]
-                    except Exception:
-                        continue
-    return ["", "", "", ""]
+    try:
+        year, week = int(year), int(week)
+    except (TypeError, ValueError):
+        return ["", "", "", ""]
+    record = _get_year_model(year).get_week(year, week)
+    return record[2] + record[3] if record else ["", "", "", ""]
 
 def update_week_data(year, week, person1, person2):
     """Update data for a specific week in a given year."""
@@ -696,14 +792,21 @@ def update_week_data(year, week, person1, person2):
     # Update the data structure
     data["WATERING_HISTORY"] = watering_history_data
 
-    # Save back to the file
-    with open(target_file, "w") as file:
-        json.dump(data, file, indent=2)
-    
-    # If we're updating the current file, also update global variables
     if target_file == FILE_PATH:
+        # Current year: update the global variables, recompute weights and save once
         watering_history.clear()
         watering_history.update(watering_history_data)
+        update_weights()
+    else:
+        # Save back to the file
+        with open(target_file, "w") as file:
+            json.dump(data, file, indent=2)
+        invalidate_week_cache(year)
+    
+    # Keep the cross-year fairness ledger in step with the committed week
+    fairness_ledger.record_week(year, week, [person1, person2], data.get("PEOPLE", PEOPLE))
+    history_log.record_week('week_edited', year, week, [person1, person2])
+    emit(WEEK_CHANGED, year=int(year), weeks=[int(week)])
 
 def update_week_data_with_ersatz(year, week, person1, person2, ersatz_person1="", ersatz_person2=""):
     """Update data for a specific week in a given year, including ErsatzPersons."""
@@ -752,14 +855,42 @@ def update_week_data_with_ersatz(year, week, person1, person2, ersatz_person1=""
     # Update the data structure
     data["WATERING_HISTORY"] = watering_history_data
 
-    # Save back to the file
-    with open(target_file, "w") as file:
-        json.dump(data, file, indent=2)
-    
-    # If we're updating the current file, also update global variables
     if target_file == FILE_PATH:
+        # Current year: update the global variables, recompute weights and save once
         watering_history.clear()
         watering_history.update(watering_history_data)
+        update_weights()
+    else:
+        # Save back to the file
+        with open(target_file, "w") as file:
+            json.dump(data, file, indent=2)
+        invalidate_week_cache(year)
+    
+    # Keep the cross-year fairness ledger in step with the committed week
+    fairness_ledger.record_week(year, week, [person1, person2], data.get("PEOPLE", PEOPLE))
+    history_log.record_week('week_edited', year, week, [person1, person2], [ersatz_person1, ersatz_person2])
+    emit(WEEK_CHANGED, year=int(year), weeks=[int(week)])
+
+def delete_week_data(year, week):
+    """Delete all entries of a week from the currently loaded history
+    
+    Returns:
+        int: Number of removed entries
+    """
+    search_pattern = f"{year} KW {week}:"
+    removed = 0
+    for person in PEOPLE:
+        entries = watering_history.get(person, [])
+        kept = [entry for entry in entries if not entry.startswith(search_pattern)]
+        removed += len(entries) - len(kept)
+        watering_history[person] = kept
+    
+    if removed:
+        update_weights()
+        fairness_ledger.remove_week(year, week)
+        history_log.record_week('week_deleted', year, week)
+        emit(WEEK_CHANGED, year=int(year), weeks=[int(week)])
+    return removed
 
 def analyze_watering_imbalance():
     """Analyze the watering history to identify imbalances and their causes"""
@@ -801,8 +932,41 @@ def analyze_watering_imbalance():
     
     return analysis
 
+def _collect_week_records():
+    """Group the history entries of all people into one record per (year, week)"""
+    records = {}
+    for person in PEOPLE:
+        for entry in watering_history.get(person, []):
+            parsed = parse_week_entry(entry)
+            if not parsed:
+                continue
+            year, week, main, ersatz = parsed
+            record = records.get((year, week))
+            if record is None or record['entry'] != entry:
+                if record is not None:
+                    # Conflicting entries for the same week - leave that week alone
+                    record['conflict'] = True
+                    continue
+                record = records[(year, week)] = {
+                    'entry': entry,
+                    'main': main,
+                    'ersatz': ersatz,
+                    'holders': [],
+                    'conflict': False
+                }
+            record['holders'].append(person)
+    return records
+
 def balance_watering_history(target_range=2):
-    """Balance the watering history by redistributing entries"""
+    """Balance watering counts by swapping people inside week assignments
+    
+    Over-target people give up main duties to under-target people who are
+    not already part of that week. Every swapped week keeps a consistent
+    entry for all people named in it, and the file is written once.
+    
+    Returns:
+        tuple: (success, message) - the message lists every swapped week
+    """
     analysis = analyze_watering_imbalance()
     if not analysis:
         return False, "No people data available"
@@ -810,59 +974,102 @@ def balance_watering_history(target_range=2):
     if analysis['difference'] <= target_range:
         return False, f"Watering counts are already balanced (difference: {analysis['difference']})"
     
-    # Calculate target counts
-    total_waterings = analysis['total_waterings']
-    num_people = len(PEOPLE)
-    base_count = total_waterings // num_people
-    extra_count = total_waterings % num_people
-    
-    # Determine target counts for each person
-    target_counts = {}
-    for i, person in enumerate(PEOPLE):
-        target_counts[person] = base_count + (1 if i < extra_count else 0)
-    
-    # Create a copy of watering history to modify
-    new_history = {}
-    for person in PEOPLE:
-        new_history[person] = watering_history.get(person, []).copy()
-    
-    # Collect all entries to redistribute
-    all_entries = []
-    for person in PEOPLE:
-        for entry in new_history[person]:
-            all_entries.append(entry)
-    
-    # Clear all histories
-    for person in PEOPLE:
-        new_history[person] = []
-    
-    # Redistribute entries based on target counts
-    person_index = 0
-    for entry in all_entries:
-        # Find the person with the lowest current count who hasn't reached their target
-        candidates = []
-        for person in PEOPLE:
-            current_count = len(new_history[person])
-            if current_count < target_counts[person]:
-                candidates.append((person, current_count))
+    counts = dict(analysis['counts'])
+    order = {person: i for i, person in enumerate(PEOPLE)}
+    
+    # Target counts - the remainder goes to the people who already have the most
+    base_count, extra_count = divmod(analysis['total_waterings'], len(PEOPLE))
+    by_count = sorted(PEOPLE, key=lambda p: (-counts[p], order[p]))
+    target_counts = {person: base_count + (1 if i < extra_count else 0) for i, person in enumerate(by_count)}
+    
+    # Max-heap of over-target people and min-heap of under-target people
+    over_heap = [(-counts[p], order[p], p) for p in PEOPLE if counts[p] > target_counts[p]]
+    under_heap = [(counts[p], order[p], p) for p in PEOPLE if counts[p] < target_counts[p]]
+    heapq.heapify(over_heap)
+    heapq.heapify(under_heap)
+    
+    records = _collect_week_records()
+    weeks_by_person = {}
+    for key, record in records.items():
+        if record['conflict']:
+            continue
+        for person in record['main']:
+            if person in record['holders']:
+                weeks_by_person.setdefault(person, []).append(key)
+    for keys in weeks_by_person.values():
+        keys.sort(reverse=True)  # Prefer the latest (upcoming) weeks
+    
+    diff = []
+    while over_heap and under_heap:
+        _, _, over_person = heapq.heappop(over_heap)
+        
+        skipped = []
+        swap = None
+        while under_heap and swap is None:
+            candidate = heapq.heappop(under_heap)
+            under_person = candidate[2]
+            for key in weeks_by_person.get(over_person, []):
+                record = records[key]
+                named = set(record['main']) | set(record['ersatz']) | set(record['holders'])
+                if under_person not in named:
+                    swap = (key, under_person, candidate)
+                    break
+            if swap is None:
+                skipped.append(candidate)
+        for candidate in skipped:
+            heapq.heappush(under_heap, candidate)
+        
+        if swap is None:
+            continue  # Nobody can take over any of this person's weeks
+        
+        key, under_person, candidate = swap
+        record = records[key]
+        old_entry = record['entry']
+        record['main'] = [under_person if p == over_person else p for p in record['main']]
+        new_entry = format_week_entry(key[0], key[1], *record['main'], *record['ersatz'])
+        
+        # Rewrite the entry for everybody who holds this week
+        for holder in record['holders']:
+            history = watering_history[holder]
+            history[history.index(old_entry)] = new_entry
+        watering_history[over_person].remove(new_entry)
+        watering_history.setdefault(under_person, []).append(new_entry)
+        record['holders'] = [h for h in record['holders'] if h != over_person] + [under_person]
+        record['entry'] = new_entry
         
-        if candidates:
-            # Sort by current count (lowest first)
-            candidates.sort(key=lambda x: x[1])
-            chosen_person = candidates[0][0]
-            new_history[chosen_person].append(entry)
+        weeks_by_person[over_person].remove(key)
+        weeks_by_person.setdefault(under_person, []).append(key)
+        weeks_by_person[under_person].sort(reverse=True)
+        
+        counts[over_person] -= 1
+        counts[under_person] += 1
+        diff.append({'year': key[0], 'week': key[1], 'removed': over_person, 'added': under_person})
+        
+        if counts[over_person] > target_counts[over_person]:
+            heapq.heappush(over_heap, (-counts[over_person], order[over_person], over_person))
+        if counts[under_person] < target_counts[under_person]:
+            heapq.heappush(under_heap, (counts[under_person], order[under_person], under_person))
     
-    # Update global watering history
-    watering_history.clear()
-    watering_history.update(new_history)
+    if not diff:
+        return False, "No week could be swapped without placing someone twice in the same week"
     
-    # Save to file
-    save_to_file()
+    for key in {(change['year'], change['week']) for change in diff}:
+        fairness_ledger.record_week(key[0], key[1], records[key]['main'], PEOPLE, save=False)
+        history_log.record_week('week_edited', key[0], key[1], records[key]['main'], records[key]['ersatz'], reason='balance')
+    fairness_ledger.save_ledger()
     
-    # Update weights
+    # update_weights recalculates the weights and writes the file once
     update_weights()
     
-    return True, f"Successfully balanced watering history. New range: {max(len(h) for h in new_history.values()) - min(len(h) for h in new_history.values())}"
+    changed_weeks = sorted({(change['year'], change['week']) for change in diff})
+    for year in sorted({year for year, week in changed_weeks}):
+        emit(WEEK_CHANGED, year=year, weeks=[week for week_year, week in changed_weeks if week_year == year])
+    
+    new_range = max(counts.values()) - min(counts.values())
+    lines = [f"Swapped {len(diff)} week(s). New range: {new_range}"]
+    for change in sorted(diff, key=lambda c: (c['year'], c['week'])):
+        lines.append(f"  {change['year']} KW {change['week']}: {change['removed']} -> {change['added']}")
+    return True, "\n".join(lines)
 
 def get_watering_history_report():
     """Generate a detailed report of watering history"""
@@ -0,0 +1,168 @@
+"""
+Cumulative fairness ledger across year boundaries
+
+Every new year file starts with an empty watering history, so extra duties
+done in December were forgotten in January. The ledger keeps, per year,
+which main persons were committed for each week and the roster the week's
+share was split over, plus every person's load (main duties done) and
+share (fair part of all duties while they were on the roster). Scoring reads the carry-over credit from previous years in
+O(1) through a cached prefix table.
+
+The ledger is stored compactly as fairness_ledger.json next to the year
+files and can be rebuilt from the year files at any time.
+"""
+
+import os
+import year_files
+
+LEDGER_FILE = "fairness_ledger.json"
+LEDGER_VERSION = 2
+PEOPLE_PER_WEEK = 2
+
+_ledger = None
+_carryover_cache = {}
+
+def _empty_ledger():
+    return {"version": LEDGER_VERSION, "years": {}}
+
+def _year_bucket(ledger, year):
+    return ledger["years"].setdefault(str(int(year)), {"weeks": {}, "load": {}, "share": {}})
+
+def get_ledger():
+    """Return the loaded ledger, creating it from the year files on first use"""
+    global _ledger
+    if _ledger is None:
+        loaded = year_files.read_year_file(LEDGER_FILE) if os.path.exists(LEDGER_FILE) else None
+        if loaded and loaded.get("version") == LEDGER_VERSION:
+            _ledger = loaded
+        else:
+            print("Fairness ledger missing or outdated - rebuilding from year files")
+            rebuild_from_history()
+    return _ledger
+
+def save_ledger():
+    """Write the ledger to disk in compact form"""
+    if _ledger is None:
+        return
+    try:
+        year_files.atomic_write_json(LEDGER_FILE, _ledger, compact=True)
+    except OSError as e:
+        print(f"Error writing {LEDGER_FILE}: {e}")
+
+def _add_share(bucket, roster, sign=1):
+    """Add (sign=1) or take back (sign=-1) the fair share of one week"""
+    if roster:
+        share = sign * PEOPLE_PER_WEEK / len(roster)
+        for person in roster:
+            bucket["share"][person] = bucket["share"].get(person, 0) + share
+
+def _apply_week(ledger, year, week, main_people, active_people):
+    """Replace the committed main persons of one week, O(people) per call"""
+    bucket = _year_bucket(ledger, year)
+    week_key = str(int(week))
+    main_people = [person for person in main_people if person]
+    roster = list(active_people or [])
+
+    previous = bucket["weeks"].get(week_key)
+    if previous is None:
+        # A newly committed week adds a fair share for everyone on the roster
+        _add_share(bucket, roster)
+    else:
+        for person in previous["main"]:
+            bucket["load"][person] = bucket["load"].get(person, 0) - 1
+        if previous["roster"] != roster:
+            # Move the share to the current roster, exactly as it was added
+            _add_share(bucket, previous["roster"], -1)
+            _add_share(bucket, roster)
+
+    for person in main_people:
+        bucket["load"][person] = bucket["load"].get(person, 0) + 1
+    bucket["weeks"][week_key] = {"main": main_people, "roster": roster}
+
+def record_week(year, week, main_people, active_people, save=True):
+    """Commit (or re-commit) the main persons of a week"""
+    ledger = get_ledger()
+    _apply_week(ledger, year, week, main_people, active_people)
+    _carryover_cache.clear()
+    if save:
+        save_ledger()
+
+def record_weeks(weeks, active_people):
+    """Commit several weeks with a single write
+
+    Args:
+        weeks: iterable of (year, week, [person1, person2])
+        active_people: people on the roster when the weeks were committed
+    """
+    ledger = get_ledger()
+    for year, week, main_people in weeks:
+        _apply_week(ledger, year, week, main_people, active_people)
+    _carryover_cache.clear()
+    save_ledger()
+
+def remove_week(year, week, save=True):
+    """Take a deleted week out of the ledger, with the share it was committed with"""
+    ledger = get_ledger()
+    bucket = _year_bucket(ledger, year)
+    previous = bucket["weeks"].pop(str(int(week)), None)
+    if previous is None:
+        return
+    for person in previous["main"]:
+        bucket["load"][person] = bucket["load"].get(person, 0) - 1
+    _add_share(bucket, previous["roster"], -1)
+    _carryover_cache.clear()
+    if save:
+        save_ledger()
+
+def _carryover_table(year):
+    """Credit per person accumulated in all years before the given year"""
+    table = _carryover_cache.get(year)
+    if table is None:
+        table = {}
+        for year_key, bucket in get_ledger()["years"].items():
+            if int(year_key) >= year:
+                continue
+            for person, load in bucket["load"].items():
+                table[person] = table.get(person, 0) + load
+            for person, share in bucket["share"].items():
+                table[person] = table.get(person, 0) - share
+        _carryover_cache[year] = table
+    return table
+
+def get_carryover_credit(person, year):
+    """Duties done above (positive) or below (negative) the fair share before this year"""
+    return _carryover_table(int(year)).get(person, 0)
+
+def get_person_totals(person):
+    """Cumulative load, fair share and debt (share minus load) over all years"""
+    load = 0
+    share = 0
+    for bucket in get_ledger()["years"].values():
+        load += bucket["load"].get(person, 0)
+        share += bucket["share"].get(person, 0)
+    return {'load': load, 'share': share, 'debt': share - load}
+
+def rebuild_from_history(folder=".", include_archives=False):
+    """Recreate the ledger by streaming all year files once
+
+    Used for migrations and whenever the ledger file is missing. Each year
+    file's PEOPLE list is taken as the roster for its weeks.
+    """
+    global _ledger
+    ledger = _empty_ledger()
+    for year, path, is_archive in year_files.iter_year_files(folder, include_archives=include_archives):
+        file_data = year_files.read_year_file(path)
+        if file_data is None:
+            continue
+        roster = file_data.get("PEOPLE", [])
+        _year_bucket(ledger, year)
+        for record_year, week, main, ersatz in year_files.week_records_from_history(file_data.get("WATERING_HISTORY", {})):
+            _apply_week(ledger, record_year, week, main, roster)
+    _ledger = ledger
+    _carryover_cache.clear()
+    save_ledger()
+    return ledger
+
+if __name__ == "__main__":
+    rebuilt = rebuild_from_history()
+    print(f"✅ Rebuilt {LEDGER_FILE} from {len(rebuilt['years'])} year files")
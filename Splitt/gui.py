@@ -4,8 +4,15 @@ import data
 from data import save_to_file, refresh_dependencies, add_new_person_with_context, remove_person_and_rebalance, reload_current_data, get_available_years, load_year_data, get_current_year, get_week_data, get_week_data_with_ersatz, update_week_data, update_week_data_with_ersatz, get_person_experience_level, set_person_experience_level, remove_person_experience_override, get_all_experience_levels, analyze_watering_imbalance, balance_watering_history, get_watering_history_report
 from schedule import show_schedule
 from tabelle_management import TabelleManager
+from virtual_tree import VirtualTreeview
+from schedule_canvas import ScheduleCanvas
+from heatmap_view import HeatmapView
+import year_files
 import datetime
 import re
+import queue
+import threading
+import startup_profiler
 
 # Import backup recovery system
 try:
@@ -25,6 +32,8 @@ except ImportError as e:
     THEME_AVAILABLE = False
     print(f"❌ Theme integration failed: {e}")
 
+startup_profiler.checkpoint("gui imports")
+
 # Create the GUI
 root = tk.Tk()
 root.title("Gießplan Generator - Rotkreuz-Institut BBW")
@@ -58,6 +67,8 @@ else:
     widgets = theme_integration.create_styled_widgets(modern_theme=False)
     colors = theme_instance.colors
 
+startup_profiler.checkpoint("create root window and apply theme")
+
 # Create main container with professional spacing
 main_frame = widgets['frame'](root, padding="20")
 main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -106,13 +117,7 @@ def on_year_changed(event=None):
     try:
         selected_year = int(year_var.get())
         if load_year_data(selected_year):
-            # Update all displays with the new year data
-            update_all_displays()
-            update_status()
-            # Update tabelle manager for new year
-            if 'tabelle_manager' in globals():
-                tabelle_manager.update_csv_file_path()
-                tabelle_manager.update_displays()
+            # Displays follow through the YearSwitched event
             messagebox.showinfo("Success", f"Switched to year {selected_year}")
         else:
             messagebox.showerror("Error", f"No data file found for year {selected_year}")
@@ -200,7 +205,7 @@ def update_theme_switch_appearance():
 
 def toggle_theme():
     """Toggle between dark and light themes"""
-    global widgets  # Make sure we can update the global widgets
+    global widgets, theme, theme_instance  # Make sure we can update the global widgets
     
     # Toggle the state
     theme_var.set(not theme_var.get())
@@ -218,14 +223,16 @@ def toggle_theme():
             # Switch to dark mode
             print("🌙 Switching to dark mode...")
             if THEME_AVAILABLE:
-                apply_rki_theme_to_app(root, modern_theme=True, light_mode=False)
+                theme, widgets = apply_rki_theme_to_app(root, modern_theme=True, light_mode=False)
+                theme_instance = theme
             else:
                 print("⚠️  Dark theme not available, using default")
         else:
             # Switch to light mode
             print("☀️ Switching to light mode...")
             if THEME_AVAILABLE:
-                apply_rki_theme_to_app(root, modern_theme=True, light_mode=True)
+                theme, widgets = apply_rki_theme_to_app(root, modern_theme=True, light_mode=True)
+                theme_instance = theme
             else:
                 print("⚠️  Light theme not available")
                 messagebox.showerror("Theme Error", "Light theme not available.")
@@ -379,6 +386,30 @@ notebook.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pa
 # Initialize Tabelle Manager
 tabelle_manager = TabelleManager(main_frame, widgets, colors, theme if THEME_AVAILABLE else None)
 
+# Lazy tabs - only the tab visible at launch is built right away, the others
+# register a builder that runs the first time the tab is selected
+_tab_builders = {}  # tab widget path -> builder, removed once built
+
+def register_lazy_tab(frame, builder):
+    _tab_builders[str(frame)] = builder
+
+def is_tab_built(frame):
+    return str(frame) not in _tab_builders
+
+def ensure_tab_built(frame):
+    """Run the builder of a tab if it has not been built yet"""
+    builder = _tab_builders.pop(str(frame), None)
+    if builder is not None:
+        print(f"Building tab: {notebook.tab(frame, 'text')}")
+        builder()
+
+def on_tab_changed(event=None):
+    ensure_tab_built(notebook.select())
+
+notebook.bind('<<NotebookTabChanged>>', on_tab_changed)
+
+startup_profiler.checkpoint("year selection and theme switch")
+
 # Tab 1: People Management
 people_frame = widgets['frame'](notebook, padding="15", card_style=True)
 notebook.add(people_frame, text="👥 People Management")
@@ -446,6 +477,9 @@ analyze_button.grid(row=0, column=0, padx=(0, 15))
 balance_button = widgets['button'](balance_button_frame, text="⚖️ Balance History", command=lambda: balance_watering_counts())
 balance_button.grid(row=0, column=1, padx=(15, 0))
 
+cross_year_button = widgets['button'](balance_button_frame, text="📈 Cross-Year Report", command=lambda: show_cross_year_analysis())
+cross_year_button.grid(row=1, column=0, columnspan=2, pady=(10, 0))
+
 # Configure grid weights for balance frame
 balance_frame.columnconfigure(0, weight=1)
 balance_frame.columnconfigure(1, weight=1)
@@ -474,6 +508,7 @@ people_tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 people_scrollbar = widgets['scrollbar'](people_right, orient=tk.VERTICAL, command=people_tree.yview)
 people_scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
 people_tree.configure(yscrollcommand=people_scrollbar.set)
+people_view = VirtualTreeview(people_tree, people_scrollbar)
 
 # Configure grid weights for people frame
 people_frame.columnconfigure(0, weight=1)
@@ -504,10 +539,8 @@ def add_person():
         return
         
     if add_new_person_with_context(name):
-        update_people_list()
         refresh_dependencies()
         name_entry.delete(0, tk.END)
-        update_status()
         
         # Show different message if name was normalized
         if name_changed:
@@ -535,10 +568,8 @@ def delete_person():
     # Confirmation dialog
     if messagebox.askyesno("Confirm Delete", f"Are you sure you want to remove {name}?"):
         if remove_person_and_rebalance(name):
-            update_people_list()
             refresh_dependencies()
             name_entry.delete(0, tk.END)
-            update_status()
             messagebox.showinfo("Success", f"Removed {name} and rebalanced system.")
         else:
             messagebox.showerror("Error", "Failed to remove person.")
@@ -557,8 +588,6 @@ def set_experience_level():
         return
     
     if set_person_experience_level(person, level):
-        update_people_list()
-        update_status()
         messagebox.showinfo("Success", f"Set {person}'s experience level to '{level}'.")
     else:
         messagebox.showerror("Error", "Failed to set experience level.")
@@ -572,8 +601,6 @@ def remove_experience_override():
         return
     
     if remove_person_experience_override(person):
-        update_people_list()
-        update_status()
         messagebox.showinfo("Success", f"Reset {person}'s experience level to automatic calculation.")
     else:
         messagebox.showinfo("Info", f"No manual override found for {person}.")
@@ -618,6 +645,36 @@ def show_watering_analysis():
     except Exception as e:
         messagebox.showerror("Error", f"Failed to generate analysis: {str(e)}")
 
+def show_cross_year_analysis():
+    """Show fairness statistics across all year files"""
+    try:
+        import analytics
+        report = analytics.get_cross_year_report()
+        
+        analysis_window = tk.Toplevel(root)
+        analysis_window.title("Cross-Year Watering Analysis")
+        analysis_window.geometry("600x500")
+        
+        text_frame = widgets['frame'](analysis_window)
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        text_widget = tk.Text(text_frame, wrap=tk.WORD)
+        theme_instance.configure_text_widget(text_widget)
+        scrollbar = widgets['scrollbar'](text_frame, orient=tk.VERTICAL, command=text_widget.yview)
+        text_widget.configure(yscrollcommand=scrollbar.set)
+        
+        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        text_widget.insert(tk.END, report)
+        text_widget.configure(state=tk.DISABLED)
+        
+        close_btn = widgets['button'](analysis_window, text="Close", command=analysis_window.destroy)
+        close_btn.pack(side=tk.RIGHT, padx=20, pady=(0, 20))
+        
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to generate cross-year analysis: {str(e)}")
+
 def balance_watering_counts():
     """Balance the watering counts across all people"""
     try:
@@ -637,7 +694,7 @@ def balance_watering_counts():
         confirm_msg = (f"Current watering distribution:\n"
                       f"Range: {analysis['min_count']} - {analysis['max_count']} (difference: {analysis['difference']})\n"
                       f"Average: {analysis['average']:.1f}\n\n"
-                      f"This will redistribute watering entries to balance the counts.\n"
+                      f"This will swap people inside existing week assignments to balance the counts.\n"
                       f"Do you want to proceed?")
         
         if not messagebox.askyesno("Confirm Balancing", confirm_msg):
@@ -647,10 +704,6 @@ def balance_watering_counts():
         success, message = balance_watering_history()
         
         if success:
-            # Update all displays
-            update_people_list()
-            update_schedule_display()
-            update_status()
             messagebox.showinfo("Success", f"Watering history balanced successfully!\n\n{message}")
         else:
             messagebox.showinfo("Info", message)
@@ -659,10 +712,6 @@ def balance_watering_counts():
         messagebox.showerror("Error", f"Failed to balance watering history: {str(e)}")
 
 def update_people_list():
-    # Clear existing items
-    for item in people_tree.get_children():
-        people_tree.delete(item)
-    
     # Ensure watering history is up to date
     for person in data.PEOPLE:
         if person not in data.watering_history:
@@ -671,10 +720,8 @@ def update_people_list():
         if person not in data.PEOPLE:
             del data.watering_history[person]
     
-    # Update weights to ensure they reflect current watering counts
-    data.update_weights()
-    
-    # Add people to treeview
+    # Build the rows for the virtual treeview
+    rows = []
     for i, person in enumerate(data.PEOPLE):
         watering_count = len(data.watering_history.get(person, []))
         experience_level = get_person_experience_level(person)
@@ -683,185 +730,140 @@ def update_people_list():
             experience_level += " (Manual)"
         weight = data.WEIGHTS[i] if i < len(data.WEIGHTS) else 1
         extra_weight = data.EXTRA_WEIGHTS[i] if i < len(data.EXTRA_WEIGHTS) else 1
-        people_tree.insert('', 'end', values=(person, watering_count, experience_level, weight, extra_weight))
+        rows.append((person, (person, watering_count, experience_level, weight, extra_weight), ()))
+    people_view.set_rows(rows)
     
     # Update person combos when people list changes
     update_person_combos()
 
+startup_profiler.checkpoint("build People tab")
+
 # Tab 2: Schedule Generation  
 schedule_frame = widgets['frame'](notebook, padding="15", card_style=True)
 notebook.add(schedule_frame, text="📅 Schedule Generation")# Schedule generation section
-schedule_gen_frame = widgets['labelframe'](schedule_frame, text="🔄 Generate New Schedule", padding="15")
-schedule_gen_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 15))
+schedule_type_var = tk.StringVar(value="Next 6 Weeks")
 
-# Schedule controls frame
-schedule_controls = widgets['frame'](schedule_gen_frame)
-schedule_controls.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 15))
+def build_schedule_tab():
+    """Create the schedule tab widgets, called when the tab is first opened"""
+    global schedule_view, schedule_visual, generate_button
+    # Schedule generation section
+    schedule_gen_frame = widgets['labelframe'](schedule_frame, text="🔄 Generate New Schedule", padding="15")
+    schedule_gen_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 15))
+
+    # Schedule controls frame
+    schedule_controls = widgets['frame'](schedule_gen_frame)
+    schedule_controls.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 15))
+
+    widgets['label'](schedule_controls, text="Schedule Options:").grid(row=0, column=0, padx=(0, 10))
+
+    # Dropdown for schedule type
+    schedule_type_combo = widgets['combobox'](schedule_controls, textvariable=schedule_type_var, 
+                                      values=["Next 6 Weeks", "Remaining Weeks"], 
+                                      state="readonly", width=15)
+    schedule_type_combo.grid(row=0, column=1, padx=(0, 15))
+
+    generate_button = widgets['button'](schedule_controls, text="🔄 Generate Schedule", command=lambda: generate_and_show_schedule())
+    generate_button.grid(row=0, column=2, padx=(15, 0))
+
+    refresh_button = widgets['button'](schedule_controls, text="🔄 Refresh Display", command=lambda: update_all_displays())
+    refresh_button.grid(row=0, column=3, padx=(10, 0))
+
+    # Schedule display - create container for both sections
+    schedule_display_container = widgets['frame'](schedule_frame)
+    schedule_display_container.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 15))
+
+    # Current Schedule section
+    current_schedule_frame = widgets['labelframe'](schedule_display_container, text="📋 Current Schedule", padding="15")
+    current_schedule_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 5))
+
+    # Create a frame to hold the treeview and scrollbar
+    current_schedule_content = widgets['frame'](current_schedule_frame)
+    current_schedule_content.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+    # Treeview for schedule display
+    schedule_tree = widgets['treeview'](current_schedule_content, columns=('Week', 'Date Range', 'Person 1', 'Person 2', 'ErsatzPerson 1', 'ErsatzPerson 2'), show='headings', height=10)
+    schedule_tree.heading('Week', text='Week')
+    schedule_tree.heading('Date Range', text='Date Range')
+    schedule_tree.heading('Person 1', text='Person 1')
+    schedule_tree.heading('Person 2', text='Person 2')
+    schedule_tree.heading('ErsatzPerson 1', text='ErsatzPerson 1')
+    schedule_tree.heading('ErsatzPerson 2', text='ErsatzPerson 2')
+    schedule_tree.column('Week', width=60)
+    schedule_tree.column('Date Range', width=120)
+    schedule_tree.column('Person 1', width=100)
+    schedule_tree.column('Person 2', width=100)
+    schedule_tree.column('ErsatzPerson 1', width=100)
+    schedule_tree.column('ErsatzPerson 2', width=100)
+    schedule_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 10))
+
+    # Configure alternating row colors with theme
+    theme_instance.configure_treeview_tags(schedule_tree)
+
+    # Scrollbar for schedule treeview
+    schedule_tree_scrollbar = widgets['scrollbar'](current_schedule_content, orient=tk.VERTICAL, command=schedule_tree.yview)
+    schedule_tree_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+    schedule_tree.configure(yscrollcommand=schedule_tree_scrollbar.set)
+    schedule_view = VirtualTreeview(schedule_tree, schedule_tree_scrollbar)
+
+    # Schedule Summary section - now at the same level as Current Schedule
+    schedule_summary_frame = widgets['labelframe'](schedule_display_container, text="📊 Schedule Summary", padding="15")
+    schedule_summary_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(5, 0))
+
+    # Create a frame for the canvas and scrollbar inside the labelframe
+    summary_content_frame = widgets['frame'](schedule_summary_frame)
+    summary_content_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+    # Create a canvas for visual schedule representation - let it expand to match the treeview height
+    schedule_canvas = tk.Canvas(summary_content_frame, width=300)
+    theme_instance.configure_canvas(schedule_canvas)
+    schedule_canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+    # Canvas scrollbar
+    canvas_scrollbar = widgets['scrollbar'](summary_content_frame, orient=tk.VERTICAL, command=schedule_canvas.yview)
+    canvas_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+    schedule_canvas.configure(yscrollcommand=canvas_scrollbar.set)
+    schedule_visual = ScheduleCanvas(schedule_canvas, canvas_scrollbar)
+
+    # Configure grid weights for schedule display
+    schedule_display_container.columnconfigure(0, weight=2)  # Current Schedule gets more space
+    schedule_display_container.columnconfigure(1, weight=1)  # Schedule Summary gets less space
+    schedule_display_container.rowconfigure(0, weight=1)
+    current_schedule_frame.columnconfigure(0, weight=1)
+    current_schedule_frame.rowconfigure(0, weight=1)
+    current_schedule_content.columnconfigure(0, weight=1)
+    current_schedule_content.rowconfigure(0, weight=1)
+    schedule_summary_frame.columnconfigure(0, weight=1)
+    schedule_summary_frame.rowconfigure(0, weight=1)
+    summary_content_frame.columnconfigure(0, weight=1)
+    summary_content_frame.rowconfigure(0, weight=1)
+
+    # Configure grid weights for schedule frame
+    schedule_frame.columnconfigure(0, weight=1)
+    schedule_frame.rowconfigure(1, weight=1)
 
-widgets['label'](schedule_controls, text="Schedule Options:").grid(row=0, column=0, padx=(0, 10))
+    update_schedule_display()
 
-# Dropdown for schedule type
-schedule_type_var = tk.StringVar(value="Next 6 Weeks")
-schedule_type_combo = widgets['combobox'](schedule_controls, textvariable=schedule_type_var, 
-                                  values=["Next 6 Weeks", "Remaining Weeks"], 
-                                  state="readonly", width=15)
-schedule_type_combo.grid(row=0, column=1, padx=(0, 15))
-
-generate_button = widgets['button'](schedule_controls, text="🔄 Generate Schedule", command=lambda: generate_and_show_schedule())
-generate_button.grid(row=0, column=2, padx=(15, 0))
-
-refresh_button = widgets['button'](schedule_controls, text="🔄 Refresh Display", command=lambda: update_all_displays())
-refresh_button.grid(row=0, column=3, padx=(10, 0))
-
-# Schedule display - create container for both sections
-schedule_display_container = widgets['frame'](schedule_frame)
-schedule_display_container.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 15))
-
-# Current Schedule section
-current_schedule_frame = widgets['labelframe'](schedule_display_container, text="📋 Current Schedule", padding="15")
-current_schedule_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 5))
-
-# Create a frame to hold the treeview and scrollbar
-current_schedule_content = widgets['frame'](current_schedule_frame)
-current_schedule_content.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-# Treeview for schedule display
-schedule_tree = widgets['treeview'](current_schedule_content, columns=('Week', 'Date Range', 'Person 1', 'Person 2', 'ErsatzPerson 1', 'ErsatzPerson 2'), show='headings', height=10)
-schedule_tree.heading('Week', text='Week')
-schedule_tree.heading('Date Range', text='Date Range')
-schedule_tree.heading('Person 1', text='Person 1')
-schedule_tree.heading('Person 2', text='Person 2')
-schedule_tree.heading('ErsatzPerson 1', text='ErsatzPerson 1')
-schedule_tree.heading('ErsatzPerson 2', text='ErsatzPerson 2')
-schedule_tree.column('Week', width=60)
-schedule_tree.column('Date Range', width=120)
-schedule_tree.column('Person 1', width=100)
-schedule_tree.column('Person 2', width=100)
-schedule_tree.column('ErsatzPerson 1', width=100)
-schedule_tree.column('ErsatzPerson 2', width=100)
-schedule_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 10))
-
-# Configure alternating row colors with theme
-theme_instance.configure_treeview_tags(schedule_tree)
-
-# Scrollbar for schedule treeview
-schedule_tree_scrollbar = widgets['scrollbar'](current_schedule_content, orient=tk.VERTICAL, command=schedule_tree.yview)
-schedule_tree_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-schedule_tree.configure(yscrollcommand=schedule_tree_scrollbar.set)
-
-# Schedule Summary section - now at the same level as Current Schedule
-schedule_summary_frame = widgets['labelframe'](schedule_display_container, text="📊 Schedule Summary", padding="15")
-schedule_summary_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(5, 0))
-
-# Create a frame for the canvas and scrollbar inside the labelframe
-summary_content_frame = widgets['frame'](schedule_summary_frame)
-summary_content_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-# Create a canvas for visual schedule representation - let it expand to match the treeview height
-schedule_canvas = tk.Canvas(summary_content_frame, width=300)
-theme_instance.configure_canvas(schedule_canvas)
-schedule_canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-# Canvas scrollbar
-canvas_scrollbar = widgets['scrollbar'](summary_content_frame, orient=tk.VERTICAL, command=schedule_canvas.yview)
-canvas_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-schedule_canvas.configure(yscrollcommand=canvas_scrollbar.set)
-
-# Configure grid weights for schedule display
-schedule_display_container.columnconfigure(0, weight=2)  # Current Schedule gets more space
-schedule_display_container.columnconfigure(1, weight=1)  # Schedule Summary gets less space
-schedule_display_container.rowconfigure(0, weight=1)
-current_schedule_frame.columnconfigure(0, weight=1)
-current_schedule_frame.rowconfigure(0, weight=1)
-current_schedule_content.columnconfigure(0, weight=1)
-current_schedule_content.rowconfigure(0, weight=1)
-schedule_summary_frame.columnconfigure(0, weight=1)
-schedule_summary_frame.rowconfigure(0, weight=1)
-summary_content_frame.columnconfigure(0, weight=1)
-summary_content_frame.rowconfigure(0, weight=1)
-
-# Configure grid weights for schedule frame
-schedule_frame.columnconfigure(0, weight=1)
-schedule_frame.rowconfigure(1, weight=1)
+register_lazy_tab(schedule_frame, build_schedule_tab)
 
 def update_schedule_display():
     """Update the schedule display with current data"""
-    # Clear existing items
-    for item in schedule_tree.get_children():
-        schedule_tree.delete(item)
-    
-    # Clear canvas
-    schedule_canvas.delete("all")
+    if not is_tab_built(schedule_frame):
+        return  # Filled when the tab is first opened
+    # Year of the loaded data file
+    current_year = data.get_current_year()
     
-    # Get current year from the selected data
-    current_year = datetime.date.today().year
-    if hasattr(data, 'FILE_PATH') and 'people_' in data.FILE_PATH:
-        import re
-        match = re.search(r'people_(\d{4})\.json', data.FILE_PATH)
-        if match:
-            current_year = int(match.group(1))
-    
-    # Collect all schedule entries from watering history
+    # Week assignments of the viewed year from the shared parsed model
     week_assignments = {}  # week_number: {'main': [person1, person2], 'ersatz': [ersatz1, ersatz2]}
-    
-    for person in data.PEOPLE:
-        if person in data.watering_history:
-            for entry in data.watering_history[person]:
-                if "KW" in entry:
-                    try:
-                        # Parse new KW format: "2025 KW 15: person1 and person2 (ErsatzPersons: ersatz1 and ersatz2)"
-                        parts = entry.split(":")
-                        if len(parts) >= 2:
-                            week_part = parts[0].strip()
-                            # Extract year and week number
-                            if "KW" in week_part:
-                                import re
-                                match = re.search(r'(\d{4})\s*KW\s*(\d+)', week_part)
-                                if match:
-                                    year_num = int(match.group(1))
-                                    week_num = int(match.group(2))
-                                    
-                                    # Only show entries for the current year being viewed
-                                    if year_num == current_year:
-                                        if week_num not in week_assignments:
-                                            week_assignments[week_num] = {'main': [], 'ersatz': []}
-                                        
-                                        # Parse main persons and ersatz persons
-                                        if person not in week_assignments[week_num]['main']:
-                                            week_assignments[week_num]['main'].append(person)
-                                        
-                                        # Try to extract ErsatzPersons from the entry
-                                        if "ErsatzPersons:" in entry:
-                                            ersatz_part = entry.split("ErsatzPersons:")[1].strip()
-                                            if " and " in ersatz_part:
-                                                ersatz_persons = ersatz_part.rstrip(")").split(" and ")
-                                                if len(ersatz_persons) >= 2:
-                                                    ersatz1 = ersatz_persons[0].strip()
-                                                    ersatz2 = ersatz_persons[1].strip()
-                                                    if ersatz1 not in week_assignments[week_num]['ersatz']:
-                                                        week_assignments[week_num]['ersatz'].append(ersatz1)
-                                                    if ersatz2 not in week_assignments[week_num]['ersatz']:
-                                                        week_assignments[week_num]['ersatz'].append(ersatz2)
-                    except (ValueError, IndexError):
-                        continue
-                elif entry.startswith("Week "):  # Support old format for backward compatibility
-                    try:
-                        week_part = entry.split(":")[0]
-                        week_num = int(week_part.split()[1])
-                        
-                        if week_num not in week_assignments:
-                            week_assignments[week_num] = {'main': [], 'ersatz': []}
-                        
-                        if person not in week_assignments[week_num]['main']:
-                            week_assignments[week_num]['main'].append(person)
-                    except (ValueError, IndexError):
-                        continue
+    for year_num, week_num, main, ersatz in data.get_schedule_model().year_records(current_year):
+        week_assignments[week_num] = {'main': [person for person in main if person],
+                                      'ersatz': [person for person in ersatz if person]}
     
     # Sort weeks and create display entries
     sorted_weeks = sorted(week_assignments.keys())
     current_week = datetime.date.today().isocalendar()[1]
     actual_current_year = datetime.date.today().year
     
+    rows = []
     for i, week_num in enumerate(sorted_weeks):
         # Calculate date range for the week
         try:
@@ -895,21 +897,15 @@ def update_schedule_display():
             # For past or future years, just use alternating row colors
             tag = 'oddrow' if i % 2 == 0 else 'evenrow'
         
-        # Insert into treeview
-        schedule_tree.insert('', 'end', values=(f"KW {week_num}", date_range, person1, person2, ersatz_person1, ersatz_person2), tags=(tag,))
+        # Row keyed by year and week for the virtual treeview
+        rows.append((f"{current_year}-{week_num}", (f"KW {week_num}", date_range, person1, person2, ersatz_person1, ersatz_person2), (tag,)))
+    schedule_view.set_rows(rows)
     
     # Draw canvas visualization
     draw_schedule_visualization(sorted_weeks, week_assignments, current_week, current_year, actual_current_year)
 
 def draw_schedule_visualization(sorted_weeks, week_assignments, current_week, current_year, actual_current_year):
     """Draw a visual representation of the schedule on the canvas"""
-    canvas_width = 280
-    # Calculate content height based on number of weeks for scrolling
-    canvas_height = len(sorted_weeks) * 60 + 40
-    
-    # Update canvas scroll region
-    schedule_canvas.configure(scrollregion=(0, 0, canvas_width, canvas_height))
-    
     # Get theme colors if available
     if THEME_AVAILABLE:
         canvas_colors = theme.get_canvas_colors()
@@ -929,92 +925,140 @@ def draw_schedule_visualization(sorted_weeks, week_assignments, current_week, cu
         colors_list = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc', '#c2c2f0', '#ffb3e6', '#c4e17f']
         person_colors = {person: colors_list[i % len(colors_list)] for i, person in enumerate(data.PEOPLE)}
     
-    # Draw week blocks (removed "Visual Schedule" title)
-    y_offset = 20  # Reduced offset since no title
-    block_height = 50
-    block_width = 260
-    
-    for i, week_num in enumerate(sorted_weeks):
+    # Build one row per week - ScheduleCanvas only draws the rows in view
+    rows = []
+    for week_num in sorted_weeks:
         # Determine block color based on week status - only highlight current/next week if viewing the actual current year
-        if current_year == actual_current_year:
-            if week_num == current_week:
-                border_color = canvas_colors['current_week_border']
-                border_width = 3
-                bg_color = canvas_colors['current_week']
-            elif week_num == current_week + 1:
-                border_color = canvas_colors['next_week_border']
-                border_width = 2
-                bg_color = canvas_colors['next_week']
-            else:
-                border_color = canvas_colors['border']
-                border_width = 1
-                bg_color = canvas_colors['background']
+        if current_year == actual_current_year and week_num == current_week:
+            bg_color, border_color, border_width = canvas_colors['current_week'], canvas_colors['current_week_border'], 3
+        elif current_year == actual_current_year and week_num == current_week + 1:
+            bg_color, border_color, border_width = canvas_colors['next_week'], canvas_colors['next_week_border'], 2
         else:
             # For past or future years, just use normal styling
-            border_color = canvas_colors['border']
-            border_width = 1
-            bg_color = canvas_colors['background']
-        
-        # Draw main block
-        schedule_canvas.create_rectangle(10, y_offset, 10 + block_width, y_offset + block_height, 
-                                       outline=border_color, width=border_width, fill=bg_color)
-        
-        # Draw week number
-        schedule_canvas.create_text(30, y_offset + 15, text=f"Week {week_num}", 
-                                  font=theme_instance.get_canvas_font('heading'), anchor='w', fill=canvas_colors['text'])
+            bg_color, border_color, border_width = canvas_colors['background'], canvas_colors['border'], 1
         
         # Get people for this week
         assignment = week_assignments.get(week_num, {'main': [], 'ersatz': []})
-        main_people = assignment.get('main', [])
-        
-        if len(main_people) >= 2:
-            person1, person2 = main_people[0], main_people[1]
-            
-            # Draw person 1 section
-            person1_color = person_colors.get(person1, colors.LIGHT_GRAY)
-            schedule_canvas.create_rectangle(15, y_offset + 25, 135, y_offset + 45, 
-                                           fill=person1_color, outline=colors.DARK_GRAY, width=1)
-            schedule_canvas.create_text(75, y_offset + 35, text=person1, 
-                                      font=theme_instance.get_canvas_font('text'), anchor='center', fill=canvas_colors['text'])
-            
-            # Draw person 2 section
-            person2_color = person_colors.get(person2, colors.LIGHT_GRAY)
-            schedule_canvas.create_rectangle(140, y_offset + 25, 260, y_offset + 45, 
-                                           fill=person2_color, outline=colors.DARK_GRAY, width=1)
-            schedule_canvas.create_text(200, y_offset + 35, text=person2, 
-                                      font=theme_instance.get_canvas_font('text'), anchor='center', fill=canvas_colors['text'])
+        main_people = assignment.get('main', [])[:2]
+        people = tuple((person, person_colors.get(person, colors.LIGHT_GRAY)) for person in main_people)
+        rows.append((week_num, bg_color, border_color, border_width, people))
+    
+    style = {
+        'colors': canvas_colors,
+        'fonts': {name: theme_instance.get_canvas_font(name) for name in ('heading', 'text', 'legend')},
+        'person_outline': colors.DARK_GRAY
+    }
+    schedule_visual.set_rows(rows, style)
+
+def generate_and_show_schedule():
+    """Plan on the main thread, generate in a worker thread, commit when done"""
+    schedule_type = schedule_type_var.get()
+    ensure_tab_built(schedule_frame)  # Ctrl+G works before the tab was opened
+    try:
+        # Import the schedule generation stages
+        from schedule import plan_schedule, run_schedule
         
-        y_offset += block_height + 10
+        plan = plan_schedule(schedule_type)
+    except PermissionError:
+        messagebox.showerror("File Permission Error", 
+                           "Cannot access the file - it may be open in another application.\n\n"
+                           "Please close any Excel files or other applications using this file and try again.")
+        return
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to generate schedule: {str(e)}")
+        return
+    
+    if not plan:
+        finish_schedule_generation(schedule_type, [])
+        return
+    
+    progress_queue = queue.Queue()
+    cancel_event = threading.Event()
+    
+    # Modal progress window - blocks edits that the committed run would overwrite
+    progress_window = tk.Toplevel(root)
+    progress_window.title("Generating Schedule")
+    progress_window.geometry("400x150")
+    progress_window.transient(root)
+    progress_window.grab_set()
+    progress_window.protocol("WM_DELETE_WINDOW", cancel_event.set)
+    
+    progress_frame = widgets['frame'](progress_window, padding="15")
+    progress_frame.pack(fill=tk.BOTH, expand=True)
+    progress_label = widgets['label'](progress_frame, text=f"Generating {len(plan['weeks'])} weeks...")
+    progress_label.pack(anchor=tk.W, pady=(0, 10))
+    progress_bar = ttk.Progressbar(progress_frame, mode='determinate', maximum=len(plan['weeks']))
+    progress_bar.pack(fill=tk.X, pady=(0, 15))
+    
+    def cancel_generation():
+        cancel_event.set()
+        cancel_button.configure(state=tk.DISABLED)
+        progress_label.configure(text="Cancelling after the current week...")
+    
+    cancel_button = widgets['button'](progress_frame, text="Cancel", command=cancel_generation)
+    cancel_button.pack(side=tk.RIGHT)
+    generate_button.configure(state=tk.DISABLED)
+    
+    global _generation_running
+    _generation_running = True
     
-    # Draw legend
-    legend_y = y_offset + 20
-    schedule_canvas.create_text(15, legend_y, text="Legend:", 
-                              font=theme_instance.get_canvas_font('heading'), anchor='w', fill=canvas_colors['legend'])
+    def worker():
+        try:
+            result = run_schedule(plan,
+                                  progress_callback=lambda done, total, entry: progress_queue.put(('progress', done, total, entry)),
+                                  cancel_event=cancel_event)
+            progress_queue.put(('done', result))
+        except Exception as e:
+            progress_queue.put(('error', e))
     
-    # Current week indicator
-    schedule_canvas.create_rectangle(15, legend_y + 15, 25, legend_y + 25, 
-                                   outline=canvas_colors['current_week_border'], width=3, 
-                                   fill=canvas_colors['current_week'])
-    schedule_canvas.create_text(30, legend_y + 20, text="Current Week", 
-                              font=theme_instance.get_canvas_font('legend'), anchor='w', fill=canvas_colors['text'])
+    def poll_progress():
+        try:
+            while True:
+                message = progress_queue.get_nowait()
+                if message[0] == 'progress':
+                    done, total, entry = message[1:]
+                    progress_bar['value'] = done
+                    progress_label.configure(text=f"Week {done} of {total}: {entry.split(' (')[0]}")
+                else:
+                    global _generation_running
+                    _generation_running = False
+                    progress_window.grab_release()
+                    progress_window.destroy()
+                    generate_button.configure(state=tk.NORMAL)
+                    if message[0] == 'done':
+                        commit_generated_schedule(schedule_type, plan, message[1])
+                    else:
+                        messagebox.showerror("Error", f"Failed to generate schedule: {str(message[1])}")
+                    return
+        except queue.Empty:
+            pass
+        root.after(50, poll_progress)
     
-    # Next week indicator
-    schedule_canvas.create_rectangle(15, legend_y + 35, 25, legend_y + 45, 
-                                   outline=canvas_colors['next_week_border'], width=2, 
-                                   fill=canvas_colors['next_week'])
-    schedule_canvas.create_text(30, legend_y + 40, text="Next Week", 
-                              font=theme_instance.get_canvas_font('legend'), anchor='w', fill=canvas_colors['text'])
+    threading.Thread(target=worker, daemon=True).start()
+    root.after(50, poll_progress)
 
-def generate_and_show_schedule():
+def commit_generated_schedule(schedule_type, plan, result):
+    """Write a finished worker run to disk and refresh the displays"""
+    if result['cancelled']:
+        messagebox.showinfo("Cancelled", "Schedule generation was cancelled - nothing was saved.")
+        return
     try:
-        schedule_type = schedule_type_var.get()
-        
-        # Import the schedule generation function
-        from schedule import generate_schedule
-        
-        # Generate schedule with the selected type
-        new_schedule = generate_schedule(schedule_type)
+        from schedule import commit_schedule
         
+        new_schedule = commit_schedule(plan, result)
+    except PermissionError:
+        messagebox.showerror("File Permission Error", 
+                           "Cannot access the file - it may be open in another application.\n\n"
+                           "Please close any Excel files or other applications using this file and try again.")
+        return
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to generate schedule: {str(e)}")
+        return
+    finish_schedule_generation(schedule_type, new_schedule)
+
+def finish_schedule_generation(schedule_type, new_schedule):
+    """Show the generated weeks and refresh all displays"""
+    try:
         if new_schedule:
             # Extract week information from the generated schedule
             week_info = []
@@ -1023,7 +1067,6 @@ def generate_and_show_schedule():
             
             for entry in new_schedule:
                 # Extract year and week number from entries like "2025 KW 48: Jan and Rosa"
-                import re
                 match = re.search(r'(\d{4}) KW (\d+)', entry)
                 if match:
                     year = int(match.group(1))
@@ -1063,14 +1106,7 @@ def generate_and_show_schedule():
         else:
             messagebox.showinfo("Info", "Schedule generation completed")
         
-        # Update all displays - including year selection in case new year files were created
-        refresh_years()
-        update_schedule_display()
-        update_people_list()
-        update_status()
-        # Update tabelle management displays
-        if 'tabelle_manager' in globals():
-            tabelle_manager.update_displays()
+        # The displays follow through the WeekChanged / YearSwitched events of the commit
         
     except PermissionError:
         messagebox.showerror("File Permission Error", 
@@ -1084,83 +1120,16 @@ manual_frame = widgets['frame'](notebook, padding="15", card_style=True)
 notebook.add(manual_frame, text="✏️ Manual Management")
 
 # Tab 4: Tabelle Management
-tabelle_manager.create_tabelle_tab(notebook)
+tabelle_frame = tabelle_manager.create_tabelle_tab(notebook)
+register_lazy_tab(tabelle_frame, tabelle_manager.build_tabelle_tab)
 
-# Manual date/week management
-manual_mgmt_frame = widgets['labelframe'](manual_frame, text="✏️ Add/Remove Specific Dates or Weeks", padding="15")
-manual_mgmt_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 15))
-
-# Calendar week and year selection
-widgets['label'](manual_mgmt_frame, text="Calendar Week:").grid(row=0, column=0, sticky=tk.W, pady=8)
+# Manual date/week management - the variables exist before the widgets
 week_var = tk.StringVar()
-week_combo = widgets['combobox'](manual_mgmt_frame, textvariable=week_var, width=10, state="readonly")
-week_combo['values'] = [f"KW {i}" for i in range(1, 53)]
-week_combo.grid(row=0, column=1, sticky=tk.W, pady=8, padx=(10, 0))
-
-widgets['label'](manual_mgmt_frame, text="Year:").grid(row=0, column=2, sticky=tk.W, pady=8, padx=(20, 0))
 manual_year_var = tk.StringVar()
-manual_year_combo = widgets['combobox'](manual_mgmt_frame, textvariable=manual_year_var, width=10, state="readonly")
-manual_year_combo.grid(row=0, column=3, sticky=tk.W, pady=8, padx=(10, 0))
-
-widgets['label'](manual_mgmt_frame, text="Person 1:").grid(row=1, column=0, sticky=tk.W, pady=8)
 person1_var = tk.StringVar()
-person1_combo = widgets['combobox'](manual_mgmt_frame, textvariable=person1_var, width=18, state="readonly")
-person1_combo.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=8, padx=(10, 0))
-
-widgets['label'](manual_mgmt_frame, text="Person 2:").grid(row=1, column=2, sticky=tk.W, pady=8, padx=(20, 0))
 person2_var = tk.StringVar()
-person2_combo = widgets['combobox'](manual_mgmt_frame, textvariable=person2_var, width=18, state="readonly")
-person2_combo.grid(row=1, column=3, sticky=(tk.W, tk.E), pady=8, padx=(10, 0))
-
-# ErsatzPerson (substitute person) fields
-widgets['label'](manual_mgmt_frame, text="ErsatzPerson 1:").grid(row=2, column=0, sticky=tk.W, pady=8)
 ersatz_person1_var = tk.StringVar()
-ersatz_person1_combo = widgets['combobox'](manual_mgmt_frame, textvariable=ersatz_person1_var, width=18, state="readonly")
-ersatz_person1_combo.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=8, padx=(10, 0))
-
-widgets['label'](manual_mgmt_frame, text="ErsatzPerson 2:").grid(row=2, column=2, sticky=tk.W, pady=8, padx=(20, 0))
 ersatz_person2_var = tk.StringVar()
-ersatz_person2_combo = widgets['combobox'](manual_mgmt_frame, textvariable=ersatz_person2_var, width=18, state="readonly")
-ersatz_person2_combo.grid(row=2, column=3, sticky=(tk.W, tk.E), pady=8, padx=(10, 0))
-
-manual_button_frame = widgets['frame'](manual_mgmt_frame)
-manual_button_frame.grid(row=3, column=0, columnspan=4, pady=15)
-
-add_date_button = widgets['success_button'](manual_button_frame, text="➕ Add Date/Week", command=lambda: add_date_or_week())
-add_date_button.grid(row=0, column=0, padx=(0, 15))
-
-delete_date_button = widgets['button'](manual_button_frame, text="➖ Delete Date/Week", command=lambda: delete_date_or_week())
-delete_date_button.grid(row=0, column=1, padx=(15, 0))
-
-# Configure grid weights for manual frame
-manual_mgmt_frame.columnconfigure(1, weight=1)
-manual_mgmt_frame.columnconfigure(3, weight=1)
-
-# Data Backup and Recovery System
-backup_frame = widgets['labelframe'](manual_frame, text="💾 Data Backup & Recovery", padding="15")
-backup_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 15))
-
-# Backup section
-backup_info_frame = widgets['frame'](backup_frame)
-backup_info_frame.grid(row=0, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
-
-backup_info_label = widgets['label'](backup_info_frame, 
-    text="Create and manage data backups for recovery after code reinstallation.")
-backup_info_label.grid(row=0, column=0, sticky=tk.W)
-
-# Template status
-template_status_frame = widgets['frame'](backup_frame)
-template_status_frame.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(5, 10))
-
-template_status_label = widgets['label'](template_status_frame, text="Template Status:")
-template_status_label.grid(row=0, column=0, sticky=tk.W)
-
-template_status_value = widgets['label'](template_status_frame, text="Checking...")
-template_status_value.grid(row=0, column=1, sticky=tk.W, padx=(10, 0))
-
-# Backup buttons
-backup_button_frame = widgets['frame'](backup_frame)
-backup_button_frame.grid(row=2, column=0, columnspan=3, pady=10)
 
 def backup_current_data():
     """Backup current data to people.json template"""
@@ -1253,24 +1222,10 @@ def create_migration_package():
     else:
         messagebox.showerror("Not Available", "Backup system not available.")
 
-backup_button = widgets['success_button'](backup_button_frame, text="💾 Backup Current Data", 
-                                          command=backup_current_data)
-backup_button.grid(row=0, column=0, padx=(0, 10))
-
-restore_button = widgets['button'](backup_button_frame, text="🔄 Restore from Backup", 
-                                  command=restore_from_backup)
-restore_button.grid(row=0, column=1, padx=(10, 10))
-
-integrity_button = widgets['button'](backup_button_frame, text="🔍 Check Integrity", 
-                                    command=check_data_integrity)
-integrity_button.grid(row=0, column=2, padx=(10, 10))
-
-migrate_button = widgets['button'](backup_button_frame, text="📦 Create Migration Package", 
-                                  command=create_migration_package)
-migrate_button.grid(row=0, column=3, padx=(10, 0))
-
 def update_template_status():
     """Update the template status display"""
+    if not is_tab_built(manual_frame):
+        return
     import os
     if os.path.exists("people.json"):
         try:
@@ -1289,22 +1244,205 @@ def update_template_status():
     else:
         template_status_value.config(text="❌ Not Found", foreground="red")
 
-# Configure grid weights for backup frame
-backup_frame.columnconfigure(0, weight=1)
+def build_manual_tab():
+    """Create the manual management and backup widgets, called when the tab is first opened"""
+    global week_combo, manual_year_combo, person1_combo, person2_combo, ersatz_person1_combo, ersatz_person2_combo, template_status_value
+    # Manual date/week management
+    manual_mgmt_frame = widgets['labelframe'](manual_frame, text="✏️ Add/Remove Specific Dates or Weeks", padding="15")
+    manual_mgmt_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 15))
+
+    # Calendar week and year selection
+    widgets['label'](manual_mgmt_frame, text="Calendar Week:").grid(row=0, column=0, sticky=tk.W, pady=8)
+    week_combo = widgets['combobox'](manual_mgmt_frame, textvariable=week_var, width=10, state="readonly")
+    week_combo['values'] = [f"KW {i}" for i in range(1, 53)]
+    week_combo.grid(row=0, column=1, sticky=tk.W, pady=8, padx=(10, 0))
+
+    widgets['label'](manual_mgmt_frame, text="Year:").grid(row=0, column=2, sticky=tk.W, pady=8, padx=(20, 0))
+    manual_year_combo = widgets['combobox'](manual_mgmt_frame, textvariable=manual_year_var, width=10, state="readonly")
+    manual_year_combo.grid(row=0, column=3, sticky=tk.W, pady=8, padx=(10, 0))
+
+    widgets['label'](manual_mgmt_frame, text="Person 1:").grid(row=1, column=0, sticky=tk.W, pady=8)
+    person1_combo = widgets['combobox'](manual_mgmt_frame, textvariable=person1_var, width=18, state="readonly")
+    person1_combo.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=8, padx=(10, 0))
+
+    widgets['label'](manual_mgmt_frame, text="Person 2:").grid(row=1, column=2, sticky=tk.W, pady=8, padx=(20, 0))
+    person2_combo = widgets['combobox'](manual_mgmt_frame, textvariable=person2_var, width=18, state="readonly")
+    person2_combo.grid(row=1, column=3, sticky=(tk.W, tk.E), pady=8, padx=(10, 0))
+
+    # ErsatzPerson (substitute person) fields
+    widgets['label'](manual_mgmt_frame, text="ErsatzPerson 1:").grid(row=2, column=0, sticky=tk.W, pady=8)
+    ersatz_person1_combo = widgets['combobox'](manual_mgmt_frame, textvariable=ersatz_person1_var, width=18, state="readonly")
+    ersatz_person1_combo.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=8, padx=(10, 0))
+
+    widgets['label'](manual_mgmt_frame, text="ErsatzPerson 2:").grid(row=2, column=2, sticky=tk.W, pady=8, padx=(20, 0))
+    ersatz_person2_combo = widgets['combobox'](manual_mgmt_frame, textvariable=ersatz_person2_var, width=18, state="readonly")
+    ersatz_person2_combo.grid(row=2, column=3, sticky=(tk.W, tk.E), pady=8, padx=(10, 0))
+
+    manual_button_frame = widgets['frame'](manual_mgmt_frame)
+    manual_button_frame.grid(row=3, column=0, columnspan=4, pady=15)
+
+    add_date_button = widgets['success_button'](manual_button_frame, text="➕ Add Date/Week", command=lambda: add_date_or_week())
+    add_date_button.grid(row=0, column=0, padx=(0, 15))
+
+    delete_date_button = widgets['button'](manual_button_frame, text="➖ Delete Date/Week", command=lambda: delete_date_or_week())
+    delete_date_button.grid(row=0, column=1, padx=(15, 15))
+
+    bulk_import_button = widgets['button'](manual_button_frame, text="📥 Bulk Import CSV...", command=lambda: bulk_import_csv())
+    bulk_import_button.grid(row=0, column=2, padx=(15, 0))
+
+    # Configure grid weights for manual frame
+    manual_mgmt_frame.columnconfigure(1, weight=1)
+    manual_mgmt_frame.columnconfigure(3, weight=1)
+
+    # Data Backup and Recovery System
+    backup_frame = widgets['labelframe'](manual_frame, text="💾 Data Backup & Recovery", padding="15")
+    backup_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 15))
+
+    # Backup section
+    backup_info_frame = widgets['frame'](backup_frame)
+    backup_info_frame.grid(row=0, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
+
+    backup_info_label = widgets['label'](backup_info_frame, 
+        text="Create and manage data backups for recovery after code reinstallation.")
+    backup_info_label.grid(row=0, column=0, sticky=tk.W)
+
+    # Template status
+    template_status_frame = widgets['frame'](backup_frame)
+    template_status_frame.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(5, 10))
+
+    template_status_label = widgets['label'](template_status_frame, text="Template Status:")
+    template_status_label.grid(row=0, column=0, sticky=tk.W)
+
+    template_status_value = widgets['label'](template_status_frame, text="Checking...")
+    template_status_value.grid(row=0, column=1, sticky=tk.W, padx=(10, 0))
+
+    # Backup buttons
+    backup_button_frame = widgets['frame'](backup_frame)
+    backup_button_frame.grid(row=2, column=0, columnspan=3, pady=10)
+
+    backup_button = widgets['success_button'](backup_button_frame, text="💾 Backup Current Data", 
+                                              command=backup_current_data)
+    backup_button.grid(row=0, column=0, padx=(0, 10))
+
+    restore_button = widgets['button'](backup_button_frame, text="🔄 Restore from Backup", 
+                                      command=restore_from_backup)
+    restore_button.grid(row=0, column=1, padx=(10, 10))
+
+    integrity_button = widgets['button'](backup_button_frame, text="🔍 Check Integrity", 
+                                        command=check_data_integrity)
+    integrity_button.grid(row=0, column=2, padx=(10, 10))
+
+    migrate_button = widgets['button'](backup_button_frame, text="📦 Create Migration Package", 
+                                      command=create_migration_package)
+    migrate_button.grid(row=0, column=3, padx=(10, 0))
+
+    # Configure grid weights for backup frame
+    backup_frame.columnconfigure(0, weight=1)
+
+    week_combo.bind('<<ComboboxSelected>>', request_autofill)
+    manual_year_combo.bind('<<ComboboxSelected>>', request_autofill)
+
+    update_person_combos()
+    if BACKUP_AVAILABLE:
+        update_template_status()
+
+register_lazy_tab(manual_frame, build_manual_tab)
+
+# Tab 5: Heatmap - who watered which week, one pixel block per person and week
+heatmap_frame = widgets['frame'](notebook, padding="15", card_style=True)
+notebook.add(heatmap_frame, text="🗺️ Heatmap")
+heatmap_scope_var = tk.StringVar(value="Current Year")
+
+def build_heatmap_tab():
+    """Create the heatmap tab widgets, called when the tab is first opened"""
+    global heatmap, heatmap_legend_label
+    heatmap_controls = widgets['frame'](heatmap_frame)
+    heatmap_controls.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+    widgets['label'](heatmap_controls, text="Show:").grid(row=0, column=0, padx=(0, 10))
+    heatmap_scope_combo = widgets['combobox'](heatmap_controls, textvariable=heatmap_scope_var,
+                                              values=["Current Year", "All Years"], state="readonly", width=15)
+    heatmap_scope_combo.grid(row=0, column=1, padx=(0, 15))
+    heatmap_legend_label = widgets['label'](heatmap_controls, text="")
+    heatmap_legend_label.grid(row=0, column=2, padx=(15, 0))
+
+    heatmap_canvas = tk.Canvas(heatmap_frame, width=600, height=300)
+    theme_instance.configure_canvas(heatmap_canvas)
+    heatmap_canvas.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+    heatmap_yscroll = widgets['scrollbar'](heatmap_frame, orient=tk.VERTICAL, command=heatmap_canvas.yview)
+    heatmap_yscroll.grid(row=1, column=1, sticky=(tk.N, tk.S))
+    heatmap_xscroll = widgets['scrollbar'](heatmap_frame, orient=tk.HORIZONTAL, command=heatmap_canvas.xview)
+    heatmap_xscroll.grid(row=2, column=0, sticky=(tk.W, tk.E))
+    heatmap_canvas.configure(yscrollcommand=heatmap_yscroll.set, xscrollcommand=heatmap_xscroll.set)
+
+    heatmap_info_var = tk.StringVar()
+    widgets['label'](heatmap_frame, textvariable=heatmap_info_var).grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+    heatmap = HeatmapView(heatmap_canvas, heatmap_info_var)
+
+    heatmap_frame.columnconfigure(0, weight=1)
+    heatmap_frame.rowconfigure(1, weight=1)
+    heatmap_scope_combo.bind('<<ComboboxSelected>>', lambda e: update_heatmap())
+    update_heatmap()
+
+register_lazy_tab(heatmap_frame, build_heatmap_tab)
+
+def get_heatmap_records():
+    """(year, week, main, ersatz) records for the selected heatmap scope"""
+    current_year = get_current_year()
+    model = data.get_schedule_model()
+    if heatmap_scope_var.get() != "All Years":
+        return model.records
+    records = []
+    for year, path, is_archive in year_files.iter_year_files():
+        if year == current_year:
+            # Unsaved in-memory state wins over the file on disk
+            records.extend(model.records)
+        else:
+            history = (year_files.read_year_file(path) or {}).get("WATERING_HISTORY", {})
+            records.extend(year_files.week_records_from_history(history))
+    if current_year not in {record[0] for record in records}:
+        records.extend(model.records)
+    return sorted(records, key=lambda record: (record[0], record[1]))
+
+def update_heatmap():
+    """Rebuild the heatmap image for the selected scope"""
+    if not is_tab_built(heatmap_frame):
+        return
+    if THEME_AVAILABLE:
+        canvas_colors = theme.get_canvas_colors()
+    else:
+        canvas_colors = {'background': '#ffffff', 'current_week': '#e6f3ff', 'current_week_border': '#0066cc'}
+    heatmap.set_colors(canvas_colors['background'], canvas_colors['current_week_border'], canvas_colors['current_week'])
+    heatmap_legend_label.config(text="■ dark: main   ■ light: ersatz   (hover a cell for details)")
+    heatmap.set_data(data.PEOPLE, get_heatmap_records())
+
+def update_heatmap_weeks(weeks):
+    """Re-render only the columns of changed weeks of the current year"""
+    if not is_tab_built(heatmap_frame):
+        return
+    current_year = get_current_year()
+    wanted = {int(week) for week in weeks}
+    model = data.get_schedule_model()
+    records = [model.get_week(current_year, week) for week in sorted(wanted)]
+    records = [record for record in records if record is not None]
+    # Deleted weeks and new people change the matrix shape
+    if len(records) != len(wanted) or not heatmap.update_weeks(records):
+        update_heatmap()
 
 def update_person_combos():
     """Update the combobox options with current people"""
     print(f"Updating combos with people: {data.PEOPLE}")
-    person1_combo['values'] = data.PEOPLE
-    person2_combo['values'] = data.PEOPLE
-    ersatz_person1_combo['values'] = data.PEOPLE
-    ersatz_person2_combo['values'] = data.PEOPLE
-    
     # Update experience level management combo
     exp_person_combo['values'] = data.PEOPLE
     if data.PEOPLE and not exp_person_var.get():
         exp_person_var.set(data.PEOPLE[0])
     
+    if not is_tab_built(manual_frame):
+        return  # The manual tab fills its combos when it is built
+    person1_combo['values'] = data.PEOPLE
+    person2_combo['values'] = data.PEOPLE
+    ersatz_person1_combo['values'] = data.PEOPLE
+    ersatz_person2_combo['values'] = data.PEOPLE
+    
     # Clear any existing selections that might be invalid
     if person1_var.get() not in data.PEOPLE:
         person1_var.set("")
@@ -1334,7 +1472,6 @@ def add_date_or_week():
 
     # Clean up person names in case they contain extra text
     # Remove any parentheses and content within them
-    import re
     person1 = re.sub(r'\s*\([^)]*\).*', '', person1).strip()
     person2 = re.sub(r'\s*\([^)]*\).*', '', person2).strip()
     ersatz_person1 = re.sub(r'\s*\([^)]*\).*', '', ersatz_person1).strip()
@@ -1394,12 +1531,9 @@ def add_date_or_week():
         if not messagebox.askyesno("Confirm Change", confirmation_message):
             return
 
-    # Update week data with ErsatzPersons
+    # Update week data with ErsatzPersons - the views follow through the WeekChanged event
     update_week_data_with_ersatz(year_selection, week_number, person1, person2, ersatz_person1, ersatz_person2)
 
-    # Reload the current data to reflect the changes in the global variables
-    reload_current_data()
-
     # Excel functionality removed - using JSON-only data storage
 
     # Clear entries
@@ -1409,13 +1543,6 @@ def add_date_or_week():
     person2_var.set("")
     ersatz_person1_var.set("")
     ersatz_person2_var.set("")
-
-    update_people_list()
-    update_schedule_display()
-    update_status()
-    # Update tabelle management displays
-    if 'tabelle_manager' in globals():
-        tabelle_manager.update_displays()
     
     # Create success message
     success_message = f"Entry for {year_selection} {week_selection} added successfully."
@@ -1454,51 +1581,145 @@ def delete_date_or_week():
     
     # Confirmation dialog
     if messagebox.askyesno("Confirm Delete", f"This will delete {entries_to_delete} entries for {year_selection} {week_selection}. Continue?"):
-        for person in data.PEOPLE:
-            data.watering_history[person] = [entry for entry in data.watering_history[person] if not entry.startswith(search_pattern)]
-
-        # Save changes to JSON file
-        save_to_file()
+        # Remove the week and save changes to JSON file
+        data.delete_week_data(year_selection, week_number)
 
         # Excel functionality removed - using JSON-only data storage
         
         week_var.set("")
         manual_year_var.set("")
-        update_people_list()
-        update_schedule_display()
-        update_status()
-        # Update tabelle management displays
-        if 'tabelle_manager' in globals():
-            tabelle_manager.update_displays()
         messagebox.showinfo("Success", f"Entry for {year_selection} {week_selection} deleted successfully.")
 
+def bulk_import_csv():
+    """Import schedule, roster and availability CSV files in one validated step"""
+    from tkinter import filedialog
+    import bulk_import
+    paths = filedialog.askopenfilenames(
+        title="Select schedule, roster and/or availability CSV files",
+        filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+    if not paths:
+        return
+
+    files = {}
+    for path in paths:
+        try:
+            kind = bulk_import.classify_csv(path)
+        except (OSError, UnicodeDecodeError) as e:
+            messagebox.showerror("Error", f"Cannot read {path}:\n{e}")
+            return
+        if kind is None or kind in files:
+            messagebox.showerror("Error", f"Cannot use {path}:\n" +
+                                 ("unknown columns" if kind is None else f"more than one {kind} file selected") +
+                                 "\n\nExpected columns:\n"
+                                 "• Schedule: Kalenderwoche, Jahr, Person 1, Person 2, Ersatz 1, Ersatz 2\n"
+                                 "• Roster: Name, Erfahrung\n"
+                                 "• Availability: Name, Jahr, Kalenderwoche, Bis KW")
+            return
+        files[kind] = path
+
+    plan, problems = bulk_import.validate_import(files.get('schedule'), files.get('roster'), files.get('availability'))
+    if problems:
+        shown = "\n".join(problems[:25])
+        more = f"\n... and {len(problems) - 25} more" if len(problems) > 25 else ""
+        messagebox.showerror("Import Not Possible", f"Nothing was imported, {len(problems)} problem(s) found:\n\n{shown}{more}")
+        return
+
+    week_count = sum(len(weeks) for weeks in plan['weeks'].values())
+    replaced = sum(1 for year, weeks in plan['weeks'].items() for week in weeks
+                   if any(get_week_data(year, week)))
+    summary = (f"Weeks: {week_count} ({replaced} replace existing weeks)\n"
+               f"New people: {len(plan['new_people'])}\n"
+               f"Experience levels: {len(plan['levels'])}\n"
+               f"Unavailable weeks: {sum(len(weeks) for weeks in plan['unavailable'].values())}")
+    if not messagebox.askyesno("Confirm Import", f"All rows are valid.\n\n{summary}\n\nImport now?"):
+        return
+
+    try:
+        bulk_import.commit_import(plan)
+    except PermissionError as e:
+        messagebox.showerror("Error", f"Import failed: {e}\n\n"
+                             "Please close any Excel files or other applications using this file and try again.")
+        return
+    except Exception as e:
+        messagebox.showerror("Error", f"Import failed: {e}")
+        return
+    messagebox.showinfo("Success", f"Import complete.\n\n{summary}")
+
 def get_all_weeks_assignments():
-    # Aggregate all week assignments from watering_history
-    week_assignments = {}
-    for person, entries in data.watering_history.items():
-        for entry in entries:
-            m = re.match(r"(\d{4} KW \d+): (.+) and (.+)", entry)
-            if m:
-                week, p1, p2 = m.group(1), m.group(2), m.group(3)
-                week_assignments[week] = (p1, p2)
-    # Sort by week number
-    def week_sort_key(week):
-        year, kw = re.match(r"(\d{4}) KW (\d+)", week).groups()
-        return (int(year), int(kw))
-    return [ (week, week_assignments[week][0], week_assignments[week][1]) 
-             for week in sorted(week_assignments, key=week_sort_key) ]
+    # All week assignments as ("2025 KW 15", person1, person2), sorted by (year, week)
+    return [(f"{year} KW {week}", main[0], main[1])
+            for year, week, main, ersatz in data.get_schedule_model().records]
 
 # Initialize the GUI
 def update_all_displays():
-    """Update all display elements when data changes"""
-    reload_current_data()  # Reload data from file to ensure we have the latest
-    update_people_list()
-    update_person_combos()
-    update_schedule_display()
-    update_status()
-    # Update tabelle management displays
-    if 'tabelle_manager' in globals():
-        tabelle_manager.update_displays()
+    """Reload the current year file and redraw every view"""
+    reload_current_data(notify=False)  # Reload data from file to ensure we have the latest
+    request_refresh(*YEAR_SWITCHED_VIEWS)
+
+# Change notifications - each view subscribes to the events it renders and
+# all refreshes requested in one event-loop pass run once in an idle callback
+_pending_refreshes = []
+_generation_running = False
+
+def request_refresh(*views):
+    """Queue view refresh functions, coalesced into one idle callback"""
+    if not _pending_refreshes:
+        root.after_idle(flush_refreshes)
+    for view in views:
+        if view not in _pending_refreshes:
+            _pending_refreshes.append(view)
+
+def flush_refreshes():
+    if _generation_running:
+        # Views are redrawn once the generated weeks are committed
+        root.after(100, flush_refreshes)
+        return
+    views = list(_pending_refreshes)
+    _pending_refreshes.clear()
+    for view in views:
+        try:
+            view()
+        except Exception as e:
+            print(f"Error refreshing {getattr(view, '__name__', view)}: {e}")
+
+YEAR_SWITCHED_VIEWS = (refresh_years, update_people_list, update_schedule_display, tabelle_manager.refresh_displays, update_heatmap)
+
+def on_roster_changed(event_type, details):
+    request_refresh(update_people_list, update_status, update_heatmap)
+
+def on_weights_changed(event_type, details):
+    request_refresh(update_people_list)
+
+def on_week_changed(event_type, details):
+    # Weeks written to another year's file are not shown until that year is selected
+    if details.get('year', get_current_year()) != get_current_year():
+        return
+    request_refresh(update_people_list, update_schedule_display, tabelle_manager.update_displays)
+    weeks = details.get('weeks')
+    if weeks is None:
+        request_refresh(update_heatmap)
+    else:
+        _pending_heatmap_weeks.update(weeks)
+        request_refresh(flush_heatmap_weeks)
+
+_pending_heatmap_weeks = set()
+
+def flush_heatmap_weeks():
+    weeks = set(_pending_heatmap_weeks)
+    _pending_heatmap_weeks.clear()
+    update_heatmap_weeks(weeks)
+
+def on_year_switched(event_type, details):
+    request_refresh(*YEAR_SWITCHED_VIEWS)
+
+data.subscribe(data.ROSTER_CHANGED, on_roster_changed)
+data.subscribe(data.WEIGHTS_CHANGED, on_weights_changed)
+data.subscribe(data.WEEK_CHANGED, on_week_changed)
+data.subscribe(data.YEAR_SWITCHED, on_year_switched)
+
+# Opt-in automatic export (Tabelle tab) - debounced, only after data commits
+for event_type in (data.WEEK_CHANGED, data.ROSTER_CHANGED, data.WEIGHTS_CHANGED):
+    data.subscribe(event_type, tabelle_manager.auto_exporter.notify)
 
 def initialize_gui():
     update_all_displays()
@@ -1560,17 +1781,33 @@ def show_help():
     """
     messagebox.showinfo("Help", help_text)
 
+startup_profiler.checkpoint("register lazy tabs and event handlers")
+
 # Initialize everything
 initialize_gui()
 setup_keyboard_shortcuts()
+startup_profiler.checkpoint("initialize_gui")
+
+# Autofill person1 and person2 when week or year changes - the variable traces
+# and combobox events of one user action are coalesced into one idle update
+_autofill_pending = False
+
+def request_autofill(*args):
+    global _autofill_pending
+    if not _autofill_pending:
+        _autofill_pending = True
+        root.after_idle(autofill_persons_for_week)
 
-# Autofill person1 and person2 when week or year changes
 def autofill_persons_for_week(*args):
+    global _autofill_pending
+    _autofill_pending = False
     week_selection = week_var.get().strip()
     year_selection = manual_year_var.get().strip()
     if week_selection and year_selection:
         week_number = week_selection.replace("KW ", "").strip()
         existing_data = get_week_data_with_ersatz(year_selection, week_number)
+        # Load the neighbouring weeks once the fields are updated
+        root.after_idle(lambda: data.prefetch_week_data(year_selection, week_number))
         
         # existing_data format: [person1, person2, ersatz_person1, ersatz_person2]
         if existing_data and len(existing_data) >= 4:
@@ -1586,12 +1823,14 @@ def autofill_persons_for_week(*args):
             ersatz_person2_var.set("")
 
 # Bind autofill to week and year changes
-week_var.trace_add("write", autofill_persons_for_week)
-manual_year_var.trace_add("write", autofill_persons_for_week)
-week_combo.bind('<<ComboboxSelected>>', lambda e: autofill_persons_for_week())
-manual_year_combo.bind('<<ComboboxSelected>>', lambda e: autofill_persons_for_week())
+week_var.trace_add("write", request_autofill)
+manual_year_var.trace_add("write", request_autofill)
 
 # Initialize combo boxes with current data
 update_person_combos()
 
+# Build whichever tab is visible at launch (the People tab is built eagerly)
+on_tab_changed()
+
+startup_profiler.report_after_first_paint(root)
 root.mainloop()
@@ -0,0 +1,139 @@
+"""
+Person x week heatmap rendered into a single PhotoImage
+
+Every cell of the assignment matrix (main / ersatz / none) is one pixel of
+a small base image that is written with one bulk put() of row strings and
+shown zoomed by CELL_SIZE. A week edit only rewrites the changed columns,
+and mouse hover finds the cell by dividing the canvas coordinates by the
+cell size instead of looking up canvas items.
+"""
+
+import tkinter as tk
+
+CELL_SIZE = 8
+STATE_NONE = 0
+STATE_MAIN = 1
+STATE_ERSATZ = 2
+STATE_LABELS = {STATE_NONE: "-", STATE_MAIN: "main", STATE_ERSATZ: "ersatz"}
+
+def build_matrix(people, records):
+    """Build the assignment matrix
+
+    Args:
+        people: row order (people missing from it but found in records are appended)
+        records: (year, week, [main...], [ersatz...]) sorted by (year, week)
+
+    Returns:
+        tuple: (people, columns [(year, week)], matrix[row][column])
+    """
+    people = list(people)
+    row_of = {person: row for row, person in enumerate(people)}
+    for year, week, main, ersatz in records:
+        for person in list(main) + list(ersatz):
+            if person and person not in row_of:
+                row_of[person] = len(people)
+                people.append(person)
+
+    columns = [(year, week) for year, week, main, ersatz in records]
+    matrix = [[STATE_NONE] * len(columns) for _ in people]
+    for column, (year, week, main, ersatz) in enumerate(records):
+        for person in ersatz:
+            if person:
+                matrix[row_of[person]][column] = STATE_ERSATZ
+        for person in main:
+            if person:
+                matrix[row_of[person]][column] = STATE_MAIN
+    return people, columns, matrix
+
+class HeatmapView:
+    def __init__(self, canvas, info_var):
+        """Render into a Canvas, hover information goes to a StringVar"""
+        self.canvas = canvas
+        self.info_var = info_var
+        self.people = []
+        self.columns = []
+        self.column_index = {}
+        self.matrix = []
+        self.colors = {STATE_NONE: '#ffffff', STATE_MAIN: '#cc0000', STATE_ERSATZ: '#f4b6b6'}
+        self.base = None
+        self.image = None
+        self.image_item = None
+        canvas.bind('<Motion>', self._on_motion)
+        canvas.bind('<Leave>', lambda event: self.info_var.set(""))
+
+    def set_colors(self, none_color, main_color, ersatz_color):
+        self.colors = {STATE_NONE: none_color, STATE_MAIN: main_color, STATE_ERSATZ: ersatz_color}
+
+    def set_data(self, people, records):
+        """Replace the whole matrix and render it with one put()"""
+        self.people, self.columns, self.matrix = build_matrix(people, records)
+        self.column_index = {key: column for column, key in enumerate(self.columns)}
+        self._render_all()
+
+    def update_weeks(self, records):
+        """Re-render only the columns of the given weeks
+
+        Returns:
+            bool: False if a week or person is new and set_data is needed instead
+        """
+        row_of = {person: row for row, person in enumerate(self.people)}
+        changed = []
+        for year, week, main, ersatz in records:
+            column = self.column_index.get((year, week))
+            if column is None or any(person and person not in row_of for person in list(main) + list(ersatz)):
+                return False
+            for row in range(len(self.people)):
+                self.matrix[row][column] = STATE_NONE
+            for person in ersatz:
+                if person:
+                    self.matrix[row_of[person]][column] = STATE_ERSATZ
+            for person in main:
+                if person:
+                    self.matrix[row_of[person]][column] = STATE_MAIN
+            changed.append(column)
+        for column in changed:
+            self._render_column(column)
+        return True
+
+    def _render_all(self):
+        width = max(1, len(self.columns))
+        height = max(1, len(self.people))
+        self.base = tk.PhotoImage(width=width, height=height)
+        if self.columns and self.people:
+            rows = []
+            for states in self.matrix:
+                rows.append("{" + " ".join(self.colors[state] for state in states) + "}")
+            self.base.put(" ".join(rows), to=(0, 0))
+        # The visible image is the base image zoomed - done by Tk in C
+        self.image = self.base.zoom(CELL_SIZE, CELL_SIZE)
+        if self.image_item is None:
+            self.image_item = self.canvas.create_image(0, 0, image=self.image, anchor='nw')
+        else:
+            self.canvas.itemconfigure(self.image_item, image=self.image)
+        self.canvas.configure(scrollregion=(0, 0, width * CELL_SIZE, height * CELL_SIZE))
+
+    def _render_column(self, column):
+        """Write one column into the base image and copy it zoomed into the visible image"""
+        data = " ".join("{" + self.colors[self.matrix[row][column]] + "}" for row in range(len(self.people)))
+        self.base.put(data, to=(column, 0))
+        self.image.tk.call(self.image, 'copy', self.base,
+                           '-from', column, 0, column + 1, len(self.people),
+                           '-to', column * CELL_SIZE, 0,
+                           '-zoom', CELL_SIZE, CELL_SIZE)
+
+    def cell_at(self, x, y):
+        """Matrix cell under canvas window coordinates, or None"""
+        column = int(self.canvas.canvasx(x) // CELL_SIZE)
+        row = int(self.canvas.canvasy(y) // CELL_SIZE)
+        if 0 <= row < len(self.people) and 0 <= column < len(self.columns):
+            return row, column
+        return None
+
+    def _on_motion(self, event):
+        cell = self.cell_at(event.x, event.y)
+        if cell is None:
+            self.info_var.set("")
+            return
+        row, column = cell
+        year, week = self.columns[column]
+        self.info_var.set(f"{self.people[row]} - {year} KW {week}: {STATE_LABELS[self.matrix[row][column]]}")
@@ -0,0 +1,153 @@
+"""
+Full-history export across all year files
+
+Streams every people_{year}.json file (and archived copies in backups/)
+one file at a time into CSV or JSON Lines, so an audit export of all
+years never loads more than one year into memory and does not touch the
+data loaded in the GUI. Rows use the same columns as the CSV Tabelle.
+
+    python history_export.py audit.csv
+    python history_export.py audit.jsonl.gz --from 2023 --to 2025 --person Jan
+    python history_export.py past.csv --status Vergangen --no-archives
+"""
+
+import os
+import csv
+import gzip
+import json
+import datetime
+import tempfile
+
+import year_files
+from csv_export import FIELDNAMES
+
+STATUSES = ["Aktuelle Woche", "Nächste Woche", "Vergangen", "Zukünftig"]
+
+def week_status(year, week, today=None):
+    """Tabelle status of a week relative to today"""
+    today = today or datetime.date.today()
+    # Compared by Monday, so KW 1 is the next week after KW 52/53
+    current_start = today - datetime.timedelta(days=today.weekday())
+    week_start = year_files.week_start_date(year, week)
+    if week_start == current_start:
+        return "Aktuelle Woche"
+    if week_start - datetime.timedelta(days=7) == current_start:
+        return "Nächste Woche"
+    return "Vergangen" if week_start < current_start else "Zukünftig"
+
+def record_row(record, today=None):
+    """CSV Tabelle row dict of a (year, week, main, ersatz) record"""
+    year, week, main, ersatz = record
+    week_start = year_files.week_start_date(year, week)
+    week_end = week_start + datetime.timedelta(days=6)
+    return {
+        'Kalenderwoche': f"KW {week}",
+        'Jahr': str(year),
+        'Datum': f"{week_start.strftime('%d.%m')} - {week_end.strftime('%d.%m')}",
+        'Person 1': main[0],
+        'Person 2': main[1],
+        'Ersatz 1': ersatz[0],
+        'Ersatz 2': ersatz[1],
+        'Status': week_status(year, week, today)
+    }
+
+def iter_rows(start_year=None, end_year=None, person=None, status=None, include_archives=True, folder="."):
+    """Yield export rows of all year files, oldest week first
+
+    Args:
+        start_year, end_year: inclusive year range (None = open)
+        person: only weeks where this person is main or ersatz (case-insensitive)
+        status: only weeks with this Tabelle status
+        include_archives: also read years only found in backups/
+        folder: data folder with the year files
+    """
+    today = datetime.date.today()
+    wanted_person = person.strip().lower() if person else None
+    for year, path, is_archive in year_files.iter_year_files(folder, include_archives):
+        # Skip files outside the range without reading them
+        if (start_year is not None and year < start_year) or (end_year is not None and year > end_year):
+            continue
+        file_data = year_files.read_year_file(path)
+        if file_data is None:
+            continue
+        for record in year_files.week_records_from_history(file_data.get("WATERING_HISTORY", {})):
+            record_year, week, main, ersatz = record
+            if record_year != year:
+                continue  # Stray entry of another year - exported with its own file
+            if wanted_person and wanted_person not in [name.lower() for name in main + ersatz if name]:
+                continue
+            row = record_row(record, today)
+            if status and row['Status'] != status:
+                continue
+            yield row
+
+def detect_format(path):
+    """('csv' or 'jsonl', compressed) from the file name, e.g. audit.jsonl.gz"""
+    name = path.lower()
+    compressed = name.endswith(".gz")
+    if compressed:
+        name = name[:-3]
+    return ("jsonl" if name.endswith(".jsonl") else "csv"), compressed
+
+def export_history(path, rows, fmt=None, compress=None):
+    """Stream rows into a CSV or JSON Lines file, optionally gzip compressed
+
+    The file is written under a temporary name and moved into place when
+    complete, so an aborted export never leaves a truncated file.
+
+    Returns:
+        int: number of rows written
+    """
+    detected_format, detected_compress = detect_format(path)
+    fmt = fmt or detected_format
+    compress = detected_compress if compress is None else compress
+
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp_", dir=folder)
+    os.close(fd)
+    count = 0
+    try:
+        if compress:
+            file = gzip.open(temp_path, 'wt', encoding='utf-8', newline='')
+        else:
+            # BOM so Excel detects UTF-8 in plain CSV files
+            file = open(temp_path, 'w', encoding='utf-8-sig' if fmt == 'csv' else 'utf-8', newline='')
+        with file:
+            if fmt == 'csv':
+                writer = csv.DictWriter(file, fieldnames=FIELDNAMES)
+                writer.writeheader()
+                for row in rows:
+                    writer.writerow(row)
+                    count += 1
+            else:
+                for row in rows:
+                    file.write(json.dumps(row, ensure_ascii=False) + "\n")
+                    count += 1
+        year_files.replace_file(temp_path, path, public=True)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    print(f"📄 Exported {count} weeks to {path}")
+    return count
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Export the watering history of all year files")
+    parser.add_argument("output", help="target file: .csv or .jsonl, add .gz to compress")
+    parser.add_argument("--from", dest="start_year", type=int, help="first year to export")
+    parser.add_argument("--to", dest="end_year", type=int, help="last year to export")
+    parser.add_argument("--person", help="only weeks of this person (main or ersatz)")
+    parser.add_argument("--status", choices=STATUSES, help="only weeks with this status")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="override the format detected from the file name")
+    parser.add_argument("--gzip", action="store_true", default=None, help="compress even without .gz extension")
+    parser.add_argument("--no-archives", action="store_true", help="ignore year files in backups/")
+    parser.add_argument("--folder", default=".", help="data folder with people_YYYY.json files")
+    args = parser.parse_args(argv)
+
+    rows = iter_rows(args.start_year, args.end_year, args.person, args.status,
+                     include_archives=not args.no_archives, folder=args.folder)
+    export_history(args.output, rows, fmt=args.format, compress=args.gzip)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+Append-only event log for roster, weight and week changes
+
+WEIGHTS and EXTRA_WEIGHTS are overwritten in place, so the year files only
+show the latest state. Every change is appended as one JSON line to
+history_events.jsonl instead:
+
+    baseline, person_added, person_removed, experience_override,
+    week_assigned, week_edited, week_deleted, weights_recomputed
+
+The first event of a new log is a baseline with the roster, weights and
+weeks that existed before logging started.
+
+week_assigned events carry the scoring inputs used by the schedule
+generator, so "why was X picked in KW 12" can be answered later.
+
+Every SNAPSHOT_INTERVAL events the full state is written to
+history_snapshots/ together with the byte offset of the next event in the
+log. Reconstructing the state at any point seeks to the nearest earlier
+snapshot and replays only the tail.
+"""
+
+import os
+import json
+import bisect
+import datetime
+import year_files
+
+LOG_FILE = "history_events.jsonl"
+SNAPSHOT_FOLDER = "history_snapshots"
+SNAPSHOT_INTERVAL = 200
+
+_state = None
+_last_seq = 0
+_events_since_snapshot = 0
+
+def _empty_state():
+    return {
+        'people': [],
+        'weights': {},
+        'extra_weights': {},
+        'overrides': {},
+        'counts': {},
+        'weeks': {}
+    }
+
+def week_key(year, week):
+    """Key of a week inside the state, e.g. "2025-12" """
+    return f"{int(year)}-{int(week)}"
+
+def apply_event(state, event, offset):
+    """Apply one event to a state dict in place
+
+    Args:
+        state: state dict as returned by state_at_seq
+        event: parsed event line
+        offset: byte offset of the event in the log (stored for week lookups)
+    """
+    event_type = event.get('type')
+    person = event.get('person')
+
+    if event_type == 'baseline':
+        state['people'] = list(event.get('people', []))
+        state['weights'] = dict(event.get('weights', {}))
+        state['extra_weights'] = dict(event.get('extra_weights', {}))
+        state['overrides'] = dict(event.get('overrides', {}))
+        for year, week, main, ersatz in event.get('weeks', []):
+            key = week_key(year, week)
+            if key not in state['weeks']:
+                state['weeks'][key] = {'main': main, 'ersatz': ersatz, 'seq': event['seq'],
+                                       'offset': offset, 'decision_offset': None}
+                for name in main:
+                    state['counts'][name] = state['counts'].get(name, 0) + 1
+    elif event_type == 'person_added':
+        if person not in state['people']:
+            state['people'].append(person)
+        state['weights'][person] = event.get('weight')
+        state['extra_weights'][person] = event.get('extra_weight')
+    elif event_type == 'person_removed':
+        if person in state['people']:
+            state['people'].remove(person)
+        state['weights'].pop(person, None)
+        state['extra_weights'].pop(person, None)
+        state['overrides'].pop(person, None)
+    elif event_type == 'experience_override':
+        if event.get('level'):
+            state['overrides'][person] = event['level']
+        else:
+            state['overrides'].pop(person, None)
+    elif event_type == 'weights_recomputed':
+        state['weights'] = dict(event.get('weights', {}))
+        state['extra_weights'] = dict(event.get('extra_weights', {}))
+    elif event_type in ('week_assigned', 'week_edited', 'week_deleted'):
+        key = week_key(event['year'], event['week'])
+        previous = state['weeks'].pop(key, None)
+        if previous:
+            for name in previous['main']:
+                state['counts'][name] = state['counts'].get(name, 0) - 1
+        if event_type == 'week_deleted':
+            return
+        record = {
+            'main': event.get('main', []),
+            'ersatz': event.get('ersatz', []),
+            'seq': event['seq'],
+            'offset': offset,
+            # Keep pointing at the generator's decision after manual edits
+            'decision_offset': offset if event_type == 'week_assigned' else (previous or {}).get('decision_offset')
+        }
+        for name in record['main']:
+            state['counts'][name] = state['counts'].get(name, 0) + 1
+        state['weeks'][key] = record
+
+def _snapshot_seqs():
+    """Sorted sequence numbers of all stored snapshots"""
+    if not os.path.isdir(SNAPSHOT_FOLDER):
+        return []
+    seqs = []
+    for name in os.listdir(SNAPSHOT_FOLDER):
+        stem, ext = os.path.splitext(name)
+        if ext == ".json" and stem.isdigit():
+            seqs.append(int(stem))
+    return sorted(seqs)
+
+def _snapshot_path(seq):
+    return os.path.join(SNAPSHOT_FOLDER, f"{seq:08d}.json")
+
+def _load_snapshot(max_seq=None):
+    """Latest snapshot at or before max_seq, or an empty state at offset 0
+
+    Returns:
+        tuple: (seq, offset, state)
+    """
+    seqs = _snapshot_seqs()
+    if max_seq is not None:
+        seqs = seqs[:bisect.bisect_right(seqs, max_seq)]
+    for seq in reversed(seqs):
+        snapshot = year_files.read_year_file(_snapshot_path(seq))
+        if snapshot and 'state' in snapshot:
+            return snapshot['seq'], snapshot['offset'], snapshot['state']
+    return 0, 0, _empty_state()
+
+def _replay(state, offset, max_seq=None):
+    """Replay log events from a byte offset, returns the last applied seq and end offset"""
+    last_seq = None
+    if not os.path.exists(LOG_FILE):
+        return last_seq, offset
+    with open(LOG_FILE, "rb") as file:
+        file.seek(offset)
+        while True:
+            position = file.tell()
+            line = file.readline()
+            if not line:
+                break
+            if not line.endswith(b"\n"):
+                # Half-written last line from an interrupted append
+                break
+            try:
+                event = json.loads(line)
+            except ValueError:
+                print(f"Skipping unreadable event at byte {position} in {LOG_FILE}")
+                continue
+            if max_seq is not None and event['seq'] > max_seq:
+                return last_seq, position
+            apply_event(state, event, position)
+            last_seq = event['seq']
+        return last_seq, file.tell()
+
+def _current_state():
+    """Current state, loaded once from the latest snapshot plus the log tail"""
+    global _state, _last_seq, _events_since_snapshot
+    if _state is None:
+        snapshot_seq, offset, state = _load_snapshot()
+        last_seq, _ = _replay(state, offset)
+        _state = state
+        _last_seq = last_seq if last_seq is not None else snapshot_seq
+        _events_since_snapshot = _last_seq - snapshot_seq
+    return _state
+
+def _write_snapshot(seq, offset):
+    global _events_since_snapshot
+    try:
+        os.makedirs(SNAPSHOT_FOLDER, exist_ok=True)
+        year_files.atomic_write_json(_snapshot_path(seq), {'seq': seq, 'offset': offset, 'state': _state}, compact=True)
+        _events_since_snapshot = 0
+    except OSError as e:
+        print(f"Error writing history snapshot {seq}: {e}")
+
+def record_event(event_type, **payload):
+    """Append one event to the log and apply it to the current state
+
+    Returns:
+        int: sequence number of the event, or None if it could not be written
+    """
+    global _last_seq, _events_since_snapshot
+    state = _current_state()
+    seq = _last_seq + 1
+    event = {'seq': seq, 'ts': datetime.datetime.now().isoformat(timespec='seconds'), 'type': event_type}
+    event.update(payload)
+    line = (json.dumps(event, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+
+    try:
+        with open(LOG_FILE, "ab") as file:
+            file.seek(0, os.SEEK_END)
+            offset = file.tell()
+            file.write(line)
+    except OSError as e:
+        print(f"Error writing to {LOG_FILE}: {e}")
+        return None
+
+    apply_event(state, event, offset)
+    _last_seq = seq
+    _events_since_snapshot += 1
+    if _events_since_snapshot >= SNAPSHOT_INTERVAL:
+        _write_snapshot(seq, offset + len(line))
+    return seq
+
+def ensure_baseline(people, weights, extra_weights, overrides, history):
+    """Write the baseline event if the log is still empty"""
+    _current_state()
+    if _last_seq:
+        return None
+    weeks = [[year, week, [p for p in main if p], [p for p in ersatz if p]]
+             for year, week, main, ersatz in year_files.week_records_from_history(history)]
+    return record_event('baseline',
+                        people=list(people),
+                        weights={person: weights[i] for i, person in enumerate(people) if i < len(weights)},
+                        extra_weights={person: extra_weights[i] for i, person in enumerate(people) if i < len(extra_weights)},
+                        overrides=dict(overrides),
+                        weeks=weeks)
+
+def record_weights(reason, people, weights, extra_weights):
+    """Log a weights_recomputed event, skipped when nothing changed"""
+    state = _current_state()
+    weights = {person: weights[i] for i, person in enumerate(people) if i < len(weights)}
+    extra_weights = {person: extra_weights[i] for i, person in enumerate(people) if i < len(extra_weights)}
+    if weights == state['weights'] and extra_weights == state['extra_weights']:
+        return None
+    return record_event('weights_recomputed', reason=reason, weights=weights, extra_weights=extra_weights)
+
+def record_week(event_type, year, week, main_people=None, ersatz_people=None, **payload):
+    """Log a week_assigned, week_edited or week_deleted event"""
+    if event_type != 'week_deleted':
+        payload['main'] = [person for person in (main_people or []) if person]
+        payload['ersatz'] = [person for person in (ersatz_people or []) if person]
+    return record_event(event_type, year=int(year), week=int(week), **payload)
+
+def state_at_seq(seq):
+    """Reconstruct the state right after event seq (O(snapshot + tail))"""
+    if seq <= 0:
+        return _empty_state()
+    snapshot_seq, offset, state = _load_snapshot(seq)
+    _replay(state, offset, max_seq=seq)
+    return state
+
+def read_event_at(offset):
+    """Read the single event stored at a byte offset of the log"""
+    try:
+        with open(LOG_FILE, "rb") as file:
+            file.seek(offset)
+            return json.loads(file.readline())
+    except (OSError, ValueError) as e:
+        print(f"Error reading event at byte {offset} in {LOG_FILE}: {e}")
+        return None
+
+def explain_week(year, week):
+    """Recover the decision behind a week
+
+    Returns:
+        dict: 'record' (current assignment), 'decision' (week_assigned event with
+              scoring inputs, None for manual weeks) and 'state_before' (weights,
+              overrides and counts right before the decision), or None if unknown
+    """
+    record = _current_state()['weeks'].get(week_key(year, week))
+    if record is None:
+        return None
+    decision = read_event_at(record['decision_offset']) if record.get('decision_offset') is not None else None
+    before_seq = (decision or read_event_at(record['offset']) or {'seq': record['seq']})['seq'] - 1
+    return {
+        'record': record,
+        'decision': decision,
+        'state_before': state_at_seq(before_seq)
+    }
+
+def get_week_explanation(year, week):
+    """Text report answering why the persons of a week were picked"""
+    explanation = explain_week(year, week)
+    if explanation is None:
+        return f"No logged events for {year} KW {week}"
+
+    record = explanation['record']
+    report = [f"=== {year} KW {week} ==="]
+    report.append(f"Main: {' and '.join(record['main'])}")
+    if record['ersatz']:
+        report.append(f"ErsatzPersons: {' and '.join(record['ersatz'])}")
+
+    decision = explanation['decision']
+    if decision is None:
+        report.append("Entered manually or before logging started - no generator decision logged")
+    else:
+        report.append(f"Generated at {decision['ts']} (event {decision['seq']})")
+        inputs = decision.get('inputs', {})
+        if inputs:
+            report.append(f"Total weeks active: {inputs.get('total_weeks_active')}")
+            report.append("")
+            report.append("Person: score / weight / history / carry-over / level")
+            scores = inputs.get('scores', {})
+            for person in sorted(scores, key=scores.get, reverse=True):
+                report.append(f"  {person}: {scores[person]:.2f} / {inputs['weights'].get(person)} / "
+                              f"{inputs['history_counts'].get(person, 0)} / "
+                              f"{inputs['carryover'].get(person, 0):+.2f} / {inputs['levels'].get(person)}")
+
+    state_before = explanation['state_before']
+    if state_before['overrides']:
+        report.append("")
+        report.append("Experience overrides at that time: " +
+                      ", ".join(f"{person}={level}" for person, level in state_before['overrides'].items()))
+    return "\n".join(report)
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) == 3:
+        print(get_week_explanation(int(sys.argv[1]), int(sys.argv[2])))
+    else:
+        state = _current_state()
+        print(f"{LOG_FILE}: {_last_seq} events, {len(_snapshot_seqs())} snapshots, {len(state['weeks'])} weeks")
+        print("Usage: python history_log.py <year> <week>")
@@ -0,0 +1,243 @@
+"""
+Static HTML dashboard of the watering schedule
+
+Renders a self-contained site (no scripts, inline CSS) for everyone who
+cannot run the GUI:
+
+    index.html           current plan of the loaded year, current week highlighted
+    person_<Name>.html   all duties of one person across the years
+    jahr_<YYYY>.html     archive page of one year
+    fairness.html        duties, weights and cumulative fairness per person
+
+Pages are built from the shared schedule model with templates compiled
+once at import time. Every page's inputs are hashed and kept in
+dashboard_manifest.json; a page is only rendered and written when its
+input hash changed or the file is missing, so a one-week edit rewrites
+the pages of that year, its people and the summaries instead of the
+whole site.
+"""
+
+import os
+import re
+import json
+import html
+import hashlib
+import datetime
+from string import Template
+
+import year_files
+
+SITE_FOLDER = "dashboard"
+MANIFEST_FILE = "dashboard_manifest.json"
+TEMPLATE_VERSION = 1  # Bump when a template changes - every page is rebuilt
+
+PAGE_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="de">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>$title</title>
+<style>
+body { font-family: "Segoe UI", Arial, sans-serif; margin: 2em auto; max-width: 60em; color: #222; }
+nav a { margin-right: 1em; }
+table { border-collapse: collapse; width: 100%; margin-bottom: 2em; }
+th, td { border-bottom: 1px solid #ddd; padding: 0.4em 0.6em; text-align: left; }
+th { background: #f0f2f5; }
+tr.current td { background: #4c5fd5; color: #fff; }
+tr.next td { background: #f59e0b; color: #fff; }
+.muted { color: #777; }
+</style>
+</head>
+<body>
+<nav><a href="index.html">Aktueller Plan</a><a href="fairness.html">Fairness</a></nav>
+<h1>$heading</h1>
+$body
+</body>
+</html>
+""")
+
+WEEK_TABLE_TEMPLATE = Template("""<table>
+<tr><th>KW</th><th>Datum</th><th>Gießdienst</th><th>Ersatz</th>$status_header</tr>
+$rows
+</table>""")
+
+WEEK_ROW_TEMPLATE = Template(
+    '<tr class="$css_class"><td>KW $week</td><td>$dates</td><td>$main</td><td>$ersatz</td>$status_cell</tr>')
+
+DUTY_ROW_TEMPLATE = Template(
+    '<tr><td>$year</td><td>KW $week</td><td>$dates</td><td>$role</td><td>$partners</td></tr>')
+
+FAIRNESS_ROW_TEMPLATE = Template(
+    '<tr><td><a href="$link">$name</a></td><td>$main</td><td>$ersatz</td><td>$weight</td>'
+    '<td>$load</td><td>$share</td><td>$debt</td></tr>')
+
+def person_page(person):
+    """File name of a person's page, e.g. "person_Jan.html" """
+    slug = re.sub(r'[^\w-]+', '_', person).strip('_') or 'person'
+    return f"person_{slug}.html"
+
+def year_page(year):
+    return f"jahr_{year}.html"
+
+def _names(people):
+    names = [html.escape(person) for person in people if person]
+    return ", ".join(names) if names else '<span class="muted">-</span>'
+
+def _dates(year, week):
+    week_start = year_files.week_start_date(year, week)
+    week_end = week_start + datetime.timedelta(days=6)
+    return f"{week_start.strftime('%d.%m.')} - {week_end.strftime('%d.%m.%Y')}"
+
+def _page(title, body):
+    return PAGE_TEMPLATE.substitute(title=html.escape(title), heading=html.escape(title), body=body)
+
+def _week_table(records, current=None):
+    """Table of week records; current=(year, week) adds the status column"""
+    # Compared by Monday, so KW 1 is the next week after KW 52/53
+    current_start = year_files.week_start_date(*current) if current else None
+    rows = []
+    for year, week, main, ersatz in records:
+        css_class, status_cell = "", ""
+        if current:
+            week_start = year_files.week_start_date(year, week)
+            if week_start == current_start:
+                css_class, status = "current", "Aktuelle Woche"
+            elif week_start - datetime.timedelta(days=7) == current_start:
+                css_class, status = "next", "Nächste Woche"
+            else:
+                status = "Vergangen" if week_start < current_start else "Zukünftig"
+            status_cell = f"<td>{status}</td>"
+        rows.append(WEEK_ROW_TEMPLATE.substitute(css_class=css_class, week=week, dates=_dates(year, week),
+                                                 main=_names(main), ersatz=_names(ersatz),
+                                                 status_cell=status_cell))
+    if not rows:
+        return '<p class="muted">Keine Einträge.</p>'
+    return WEEK_TABLE_TEMPLATE.substitute(status_header="<th>Status</th>" if current else "",
+                                          rows="\n".join(rows))
+
+def render_index(year, records, current, people, years):
+    links = " ".join(f'<a href="{year_page(y)}">{y}</a>' for y in years)
+    people_links = " ".join(f'<a href="{person_page(person)}">{html.escape(person)}</a>' for person in people)
+    body = (_week_table(records, current) +
+            f"\n<h2>Personen</h2>\n<p>{people_links or '-'}</p>\n<h2>Archiv</h2>\n<p>{links or '-'}</p>")
+    return _page(f"Gießplan {year}", body)
+
+def render_year(year, records):
+    return _page(f"Gießplan {year} (Archiv)", _week_table(records))
+
+def render_person(person, duties):
+    rows = []
+    for year, week, role, partners in duties:
+        rows.append(DUTY_ROW_TEMPLATE.substitute(year=year, week=week, dates=_dates(year, week),
+                                                 role="Gießdienst" if role == 'main' else "Ersatz",
+                                                 partners=_names(partners)))
+    if rows:
+        body = ("<table>\n<tr><th>Jahr</th><th>KW</th><th>Datum</th><th>Dienst</th><th>Mit</th></tr>\n"
+                + "\n".join(rows) + "\n</table>")
+    else:
+        body = '<p class="muted">Keine Dienste eingetragen.</p>'
+    return _page(f"Gießplan {person}", body)
+
+def render_fairness(year, rows):
+    body_rows = []
+    for person, main, ersatz, weight, totals in rows:
+        body_rows.append(FAIRNESS_ROW_TEMPLATE.substitute(
+            link=person_page(person), name=html.escape(person), main=main, ersatz=ersatz,
+            weight="-" if weight is None else weight,
+            load=totals.get('load', '-'), share=totals.get('share', '-'), debt=totals.get('debt', '-')))
+    body = (f"<p>Dienste und Gewichte {year}, Last und Anteil über alle Jahre "
+            "(Schuld = fairer Anteil minus geleistete Dienste).</p>\n<table>\n"
+            "<tr><th>Name</th><th>Gießdienste</th><th>Ersatz</th><th>Gewicht</th>"
+            "<th>Last</th><th>Anteil</th><th>Schuld</th></tr>\n"
+            + "\n".join(body_rows) + "\n</table>")
+    return _page("Fairness", body)
+
+def _input_hash(name, inputs):
+    payload = json.dumps([TEMPLATE_VERSION, name, inputs], ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def load_manifest(folder):
+    try:
+        with open(os.path.join(folder, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def build_site(model, people, weights, year, other_years=(), totals=None, folder=SITE_FOLDER, today=None):
+    """Render the dashboard, rewriting only pages whose inputs changed
+
+    Args:
+        model: ScheduleModel of the loaded year
+        people, weights: current roster and weights
+        year: the loaded year (index and fairness page)
+        other_years: optional (year, records) pairs of further year files
+        totals: optional {person: fairness_ledger.get_person_totals(person)}
+        folder: output folder (created if missing)
+
+    Returns:
+        dict: 'written', 'unchanged' and 'removed' file names
+    """
+    os.makedirs(folder, exist_ok=True)
+    today = today or datetime.date.today()
+    current = tuple(today.isocalendar()[:2])
+    totals = totals or {}
+
+    # Records per year - the loaded model wins over the files
+    records_by_year = {model_year: model.year_records(model_year) for model_year in model.years()}
+    for other_year, records in other_years:
+        if other_year not in records_by_year:
+            records_by_year[other_year] = [record for record in records if record[0] == other_year]
+    years = sorted(records_by_year)
+
+    duties = {person: [] for person in people}
+    for records_year in years:
+        for record_year, week, main, ersatz in records_by_year[records_year]:
+            for role, role_people in (('main', main), ('ersatz', ersatz)):
+                for person in dict.fromkeys(role_people):
+                    if person:
+                        partners = [other for other in role_people if other and other != person]
+                        duties.setdefault(person, []).append((record_year, week, role, partners))
+
+    # (file name, inputs, render function) - inputs are hashed, render only runs on a change
+    year_records = model.year_records(year)
+    fairness_rows = [(person, len(model.person_records(person, 'main')), len(model.person_records(person, 'ersatz')),
+                      weights[index] if index < len(weights) else None, totals.get(person, {}))
+                     for index, person in enumerate(people)]
+    pages = [
+        ("index.html", [year, year_records, current, list(people), years],
+         lambda: render_index(year, year_records, current, people, years)),
+        ("fairness.html", [year, fairness_rows], lambda: render_fairness(year, fairness_rows)),
+    ]
+    for page_year in years:
+        pages.append((year_page(page_year), records_by_year[page_year],
+                      lambda page_year=page_year: render_year(page_year, records_by_year[page_year])))
+    for person, person_duties in duties.items():
+        pages.append((person_page(person), [person, person_duties],
+                      lambda person=person, person_duties=person_duties: render_person(person, person_duties)))
+
+    manifest = load_manifest(folder)
+    new_manifest = {}
+    result = {'written': [], 'unchanged': [], 'removed': []}
+    for filename, inputs, render in pages:
+        input_hash = _input_hash(filename, inputs)
+        new_manifest[filename] = input_hash
+        path = os.path.join(folder, filename)
+        if manifest.get(filename) == input_hash and os.path.exists(path):
+            result['unchanged'].append(filename)
+            continue
+        year_files.atomic_write_text(path, render(), public=True)
+        result['written'].append(filename)
+
+    # Pages of people or years that are gone
+    for filename in manifest:
+        if filename not in new_manifest:
+            try:
+                os.remove(os.path.join(folder, filename))
+                result['removed'].append(filename)
+            except OSError:
+                pass
+
+    year_files.atomic_write_json(os.path.join(folder, MANIFEST_FILE), new_manifest, public=True)
+    print(f"🌐 Dashboard: {len(result['written'])} pages written, {len(result['unchanged'])} unchanged, "
+          f"{len(result['removed'])} removed in {folder}")
+    return result
@@ -0,0 +1,196 @@
+"""
+iCalendar (.ics) feeds of the watering duties
+
+One feed per person plus a combined feed, built in a single pass over
+the week records. Every duty is an all-day event spanning the ISO week
+(Monday to Sunday) with the category "Gießdienst" (main) or
+"Ersatzdienst" (ersatz).
+
+UIDs are derived from year, week and role, e.g.
+"giessplan-2025-W32-main@giessplan", so calendar apps update events on a
+re-export instead of adding duplicates. DTSTAMP and SEQUENCE of an event
+only change when its content changed (kept in ics_manifest.json), and a
+feed file is only rewritten when the hash of its content changed.
+"""
+
+import os
+import re
+import json
+import hashlib
+import datetime
+
+import year_files
+
+FEED_FOLDER = "kalender"
+MANIFEST_FILE = "ics_manifest.json"
+COMBINED_FEED = "giessplan_alle.ics"
+UID_DOMAIN = "giessplan"
+CATEGORIES = {'main': "Gießdienst", 'ersatz': "Ersatzdienst"}
+SUMMARIES = {'main': "Gießdienst", 'ersatz': "Gießdienst (Ersatz)"}
+
+def feed_filename(person):
+    """File name of a person's feed, e.g. "giessplan_Jan.ics" """
+    slug = re.sub(r'[^\w-]+', '_', person).strip('_') or 'person'
+    return f"giessplan_{slug}.ics"
+
+def feed_filenames(people):
+    """{person: feed file name} - names that share a slug get a suffix from their hash
+
+    "Jan B." and "Jan_B" would both be giessplan_Jan_B.ics and one feed would
+    overwrite the other. The suffix only depends on the name itself, so it
+    does not change with the roster order.
+    """
+    by_slug = {}
+    for person in dict.fromkeys(people):
+        by_slug.setdefault(feed_filename(person), []).append(person)
+    filenames = {}
+    for filename, names in by_slug.items():
+        if len(names) == 1:
+            filenames[names[0]] = filename
+            continue
+        print(f"⚠️ Calendar feeds: {', '.join(names)} share the file name {filename} - adding a suffix")
+        for person in names:
+            suffix = hashlib.sha1(person.encode('utf-8')).hexdigest()[:6]
+            filenames[person] = f"{filename[:-len('.ics')]}_{suffix}.ics"
+    return filenames
+
+def event_uid(year, week, role):
+    return f"giessplan-{year}-W{week:02d}-{role}@{UID_DOMAIN}"
+
+def escape_text(text):
+    """Escape a TEXT value (RFC 5545 3.3.11)"""
+    return (text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+def fold_line(line):
+    """Fold a content line into 75 octet chunks (RFC 5545 3.1)"""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Never split a multi-byte UTF-8 character
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode('utf-8'))
+        encoded = encoded[cut:]
+        limit = 74  # continuation lines start with a space
+    return "\r\n ".join(parts)
+
+def _names(people):
+    names = [person for person in people if person]
+    return " und ".join(names) if names else "-"
+
+def build_event(record, role):
+    """(uid, content lines without DTSTAMP/SEQUENCE) of one duty"""
+    year, week, main, ersatz = record
+    week_start = year_files.week_start_date(year, week)
+    week_end = week_start + datetime.timedelta(days=7)  # DTEND is exclusive
+    people = main if role == 'main' else ersatz
+    summary = f"{SUMMARIES[role]} KW {week}: {_names(people)}"
+    description = f"KW {week} {year}\nHauptpersonen: {_names(main)}\nErsatz: {_names(ersatz)}"
+    lines = [
+        f"DTSTART;VALUE=DATE:{week_start.strftime('%Y%m%d')}",
+        f"DTEND;VALUE=DATE:{week_end.strftime('%Y%m%d')}",
+        f"SUMMARY:{escape_text(summary)}",
+        f"DESCRIPTION:{escape_text(description)}",
+        f"CATEGORIES:{escape_text(CATEGORIES[role])}",
+        "TRANSP:TRANSPARENT",
+    ]
+    return event_uid(year, week, role), lines
+
+def load_manifest(folder):
+    try:
+        with open(os.path.join(folder, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'events': {}, 'files': {}}
+
+def _calendar_text(name, events):
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Giessplan//Giessplan Generator//DE",
+             "CALSCALE:GREGORIAN", "METHOD:PUBLISH", f"X-WR-CALNAME:{escape_text(name)}"]
+    for uid, event_lines, stamp, sequence in events:
+        lines.append("BEGIN:VEVENT")
+        lines.append(f"UID:{uid}")
+        lines.append(f"DTSTAMP:{stamp}")
+        lines.append(f"SEQUENCE:{sequence}")
+        lines.extend(event_lines)
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(fold_line(line) for line in lines) + "\r\n"
+
+def export_feeds(records, people=(), folder=FEED_FOLDER):
+    """Write the per-person feeds and the combined feed
+
+    Args:
+        records: (year, week, main, ersatz) records, e.g. data.get_schedule_model().records
+        people: roster - people without duties get an empty feed
+        folder: output folder (created if missing)
+
+    Returns:
+        dict: 'written', 'unchanged' and 'removed' file names
+    """
+    os.makedirs(folder, exist_ok=True)
+    manifest = load_manifest(folder)
+    old_events = manifest.get('events', {})
+    events = {}
+    now = datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+    # Single pass: every event goes into the combined feed and the feeds of its people
+    filenames = feed_filenames(list(people) + [person for record in records
+                                               for role_people in record[2:4] for person in role_people if person])
+    feeds = {COMBINED_FEED: ("Gießplan", [])}
+    for person in people:
+        feeds.setdefault(filenames[person], (f"Gießplan {person}", []))
+    for record in records:
+        for role, role_people in (('main', record[2]), ('ersatz', record[3])):
+            if not any(role_people):
+                continue
+            uid, lines = build_event(record, role)
+            content_hash = hashlib.sha1("\n".join(lines).encode('utf-8')).hexdigest()
+            previous = old_events.get(uid)
+            if previous and previous['hash'] == content_hash:
+                stamp, sequence = previous['stamp'], previous['sequence']
+            else:
+                stamp = now
+                sequence = previous['sequence'] + 1 if previous else 0
+            events[uid] = {'hash': content_hash, 'stamp': stamp, 'sequence': sequence}
+            event = (uid, lines, stamp, sequence)
+            feeds[COMBINED_FEED][1].append(event)
+            for person in dict.fromkeys(role_people):
+                if person:
+                    feeds.setdefault(filenames[person], (f"Gießplan {person}", []))[1].append(event)
+
+    # Events that disappeared keep their sequence in case the week comes back
+    for uid, info in old_events.items():
+        events.setdefault(uid, info)
+
+    result = {'written': [], 'unchanged': [], 'removed': []}
+    file_hashes = {}
+    for filename, (name, feed_events) in feeds.items():
+        text = _calendar_text(name, feed_events)
+        content_hash = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        path = os.path.join(folder, filename)
+        file_hashes[filename] = content_hash
+        if manifest.get('files', {}).get(filename) == content_hash and os.path.exists(path):
+            result['unchanged'].append(filename)
+            continue
+        year_files.atomic_write_text(path, text, newline='', public=True)
+        result['written'].append(filename)
+
+    # Feeds of people who left the roster or whose file name changed
+    for filename in manifest.get('files', {}):
+        if filename not in feeds:
+            try:
+                os.remove(os.path.join(folder, filename))
+                result['removed'].append(filename)
+            except OSError:
+                pass
+
+    year_files.atomic_write_json(os.path.join(folder, MANIFEST_FILE),
+                                 {'events': events, 'files': file_hashes}, public=True)
+    print(f"📅 Calendar feeds: {len(result['written'])} written, {len(result['unchanged'])} unchanged, "
+          f"{len(result['removed'])} removed in {folder}")
+    return result
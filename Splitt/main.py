@@ -4,6 +4,10 @@ import os
 import sys
 import atexit
 import tkinter.messagebox as messagebox
+import startup_profiler
+
+# --profile-startup / GIESSPLAN_PROFILE=1 - see startup_profiler.py
+startup_profiler.enable_from_args(sys.argv)
 
 def check_single_instance():
     """Ensure only one instance of the application is running"""
@@ -55,7 +59,8 @@ def check_single_instance():
         print(f"Warning: Could not create PID file: {e}")
 
 # Check for single instance before importing GUI
-check_single_instance()
+with startup_profiler.phase("check single instance"):
+    check_single_instance()
 
 from gui import root
 # The application starts when gui.py is imported and root.mainloop() is called there.
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""
+Mentor matching for new and beginner people
+
+The weekly generator only pairs the single best newcomer with an
+experienced person, so large onboarding waves wait weeks for a mentor.
+This module plans the whole horizon at once with two assignment problems
+solved by the Hungarian algorithm:
+
+1. newcomers -> week slots: newcomers with higher scores get earlier weeks
+2. mentors -> the chosen weeks: the best available mentors, with a penalty
+   for giving the same mentor several weeks
+
+Unavailable people (see availability.json) are only used if there is no
+other way to fill a slot. schedule.generate_week consumes the resulting plan.
+"""
+
+import os
+import year_files
+
+AVAILABILITY_FILE = "availability.json"
+UNAVAILABLE_PENALTY = 1000000
+REUSE_PENALTY = 50
+
+def hungarian(cost):
+    """Minimum cost assignment for a cost matrix with rows <= columns
+
+    Returns:
+        list: column assigned to each row
+    """
+    n = len(cost)
+    m = len(cost[0]) if n else 0
+    inf = float('inf')
+    u = [0] * (n + 1)
+    v = [0] * (m + 1)
+    p = [0] * (m + 1)     # row matched to each column (1-based, 0 = free)
+    way = [0] * (m + 1)
+
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            delta = inf
+            j1 = 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    current = cost[i0 - 1][j - 1] - u[i0] - v[j]
+                    if current < minv[j]:
+                        minv[j] = current
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        # Flip the augmenting path
+        while True:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+            if j0 == 0:
+                break
+
+    assignment = [-1] * n
+    for j in range(1, m + 1):
+        if p[j]:
+            assignment[p[j] - 1] = j - 1
+    return assignment
+
+def solve_assignment(cost):
+    """Minimum cost matching for any rectangular matrix
+
+    Returns:
+        list: (row, column) pairs, one per row or column whichever is fewer
+    """
+    if not cost or not cost[0]:
+        return []
+    if len(cost) <= len(cost[0]):
+        return list(enumerate(hungarian(cost)))
+    transposed = [list(column) for column in zip(*cost)]
+    return [(row, column) for column, row in enumerate(hungarian(transposed))]
+
+def load_availability(path=AVAILABILITY_FILE):
+    """Read unavailable weeks per person
+
+    Returns:
+        dict: person -> set of (year, week) the person cannot water
+    """
+    if not os.path.exists(path):
+        return {}
+    loaded = year_files.read_year_file(path) or {}
+    availability = {}
+    for person, week_keys in loaded.get("unavailable", {}).items():
+        weeks = set()
+        for key in week_keys:
+            try:
+                year, week = str(key).split("-")
+                weeks.add((int(year), int(week)))
+            except ValueError:
+                print(f"Ignoring invalid week '{key}' for {person} in {path}")
+        availability[person] = weeks
+    return availability
+
+def _is_unavailable(availability, person, week):
+    return week in availability.get(person, ())
+
+def plan_mentor_pairs(weeks, newcomer_scores, mentor_scores, availability=None):
+    """Plan one newcomer/mentor main pair for as many weeks as possible
+
+    Args:
+        weeks: list of (year, week) in planning order
+        newcomer_scores: dict newcomer -> current weighted score
+        mentor_scores: dict mentor -> current weighted score
+        availability: dict person -> set of unavailable (year, week)
+
+    Returns:
+        dict: (year, week) -> (newcomer, mentor)
+    """
+    availability = availability or {}
+    newcomers = sorted(newcomer_scores, key=newcomer_scores.get, reverse=True)
+    mentors = [person for person in mentor_scores if person not in newcomer_scores]
+    if not weeks or not newcomers or not mentors:
+        return {}
+
+    # Stage 1: newcomers -> weeks, earlier weeks are worth more
+    horizon = len(weeks)
+    newcomer_cost = []
+    for person in newcomers:
+        row = []
+        for index, week in enumerate(weeks):
+            cost = -newcomer_scores[person] * (horizon - index)
+            if _is_unavailable(availability, person, week):
+                cost += UNAVAILABLE_PENALTY
+            row.append(cost)
+        newcomer_cost.append(row)
+
+    newcomer_weeks = {}
+    for row, column in solve_assignment(newcomer_cost):
+        if newcomer_cost[row][column] < UNAVAILABLE_PENALTY / 2:
+            newcomer_weeks[weeks[column]] = newcomers[row]
+    if not newcomer_weeks:
+        return {}
+
+    # Stage 2: mentors -> planned weeks, each extra week for a mentor costs more
+    planned_weeks = sorted(newcomer_weeks)
+    copies = -(-len(planned_weeks) // len(mentors))
+    mentor_slots = [(mentor, copy) for mentor in mentors for copy in range(copies)]
+    mentor_cost = []
+    for week in planned_weeks:
+        row = []
+        for mentor, copy in mentor_slots:
+            cost = -mentor_scores[mentor] + copy * REUSE_PENALTY
+            if _is_unavailable(availability, mentor, week):
+                cost += UNAVAILABLE_PENALTY
+            row.append(cost)
+        mentor_cost.append(row)
+
+    plan = {}
+    for row, column in solve_assignment(mentor_cost):
+        if mentor_cost[row][column] < UNAVAILABLE_PENALTY / 2:
+            week = planned_weeks[row]
+            plan[week] = (newcomer_weeks[week], mentor_slots[column][0])
+    return plan
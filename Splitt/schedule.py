@@ -1,28 +1,45 @@
 import random
 import datetime
-import json
 import os
 import re
 import data
+import year_files
+import fairness_ledger
+import history_log
+import mentor_matching
+from year_files import parse_week_entry
 from data import save_to_file, reload_current_data
 from tkinter import messagebox
 
-def update_statistics():
-    for person in data.PEOPLE:
-        watering_count = len(data.watering_history.get(person, []))
-        data.WEIGHTS[data.PEOPLE.index(person)] = max(1, 10 - watering_count)
-    save_to_file()
+def calculate_statistics_weights(history=None):
+    """Weights from the watering counts - fewer waterings, higher weight"""
+    history = data.watering_history if history is None else history
+    return [max(1, 10 - len(history.get(person, []))) for person in data.PEOPLE]
 
-def calculate_weighted_score(person_index, selection_count, total_weeks_active=None):
-    """Calculate weighted arithmetic mean score for a person"""
+def calculate_weighted_score(person_index, selection_count, total_weeks_active=None, history=None, carryover=None,
+                             weights=None):
+    """Calculate weighted arithmetic mean score for a person
+    
+    Args:
+        history: watering history to score against, defaults to the loaded one
+        carryover: {person: credit} from fairness_ledger, looked up if not given
+        weights: weights to score with, defaults to data.WEIGHTS
+    """
+    history = data.watering_history if history is None else history
+    weights = data.WEIGHTS if weights is None else weights
     person = data.PEOPLE[person_index]
-    base_weight = data.WEIGHTS[person_index]
-    watering_count = len(data.watering_history.get(person, []))
+    base_weight = weights[person_index]
+    # Duties done above or below the fair share in earlier years are carried over
+    if carryover is None:
+        credit = fairness_ledger.get_carryover_credit(person, data.get_current_year())
+    else:
+        credit = carryover.get(person, 0)
+    watering_count = len(history.get(person, [])) + credit
     recent_selections = selection_count.get(person, 0)
     
     # Calculate how long this person has been in the system
     if total_weeks_active is None:
-        total_weeks_active = max(1, len([entry for entries in data.watering_history.values() for entry in entries if "KW" in entry]) // len(data.PEOPLE))
+        total_weeks_active = max(1, len([entry for entries in history.values() for entry in entries if "KW" in entry]) // len(data.PEOPLE))
     
     # Normalize watering count based on time active
     # For short-term people (< 4 weeks), give higher initial priority
@@ -51,114 +68,19 @@ def calculate_weighted_score(person_index, selection_count, total_weeks_active=N
     
     return max(0.1, score)  # Ensure minimum score
 
-def select_with_smart_pairing(selection_count, total_weeks_active, new_people, experienced_people):
-    """Smart pairing logic with multi-tiered priority system while maintaining weight-based fairness"""
-    
-    # Calculate scores for all people
-    all_scores = []
-    for i in range(len(data.PEOPLE)):
-        score = calculate_weighted_score(i, selection_count, total_weeks_active)
-        all_scores.append((data.PEOPLE[i], score))
-    
-    # Sort by score (highest first)
-    all_scores.sort(key=lambda x: x[1], reverse=True)
-    
-    # If we have less than 2 people, fall back to regular selection
-    if len(all_scores) < 2:
-        return select_regular_two_people(all_scores, total_weeks_active)
-    
-    # Separate people by experience level and score
-    people_by_experience = {
-        'new': [],
-        'beginner': [],
-        'learning': [],
-        'experienced': []
-    }
-    
-    for person, score in all_scores:
-        experience_level = data.get_person_experience_level(person)
-        watering_count = len(data.watering_history.get(person, []))
-        people_by_experience[experience_level].append((person, score, watering_count))
-    
-    # Sort each experience group by score (highest first)
-    for level in people_by_experience:
-        people_by_experience[level].sort(key=lambda x: x[1], reverse=True)
-    
-    # Multi-tiered selection strategy:
-    # Priority 1: New people paired with experienced people (learning people also considered)
-    # Priority 2: If no experienced people, new people paired with learning people
-    # Priority 3: If only learning and experienced people, selection goes by weight alone
-    
-    selected_people = []
-    
-    # Check availability of different experience levels
-    has_new_people = bool(people_by_experience['new'])
-    has_experienced_people = bool(people_by_experience['experienced'])
-    has_learning_people = bool(people_by_experience['learning'])
-    
-    # Priority 1: New people with experienced people available (learning people also considered)
-    if has_new_people and has_experienced_people:
-        # Select highest scoring new person
-        new_person = people_by_experience['new'][0][0]
-        selected_people.append(new_person)
-        
-        # Create combined pool of experienced and learning people for pairing
-        experienced_and_learning = people_by_experience['experienced'] + people_by_experience['learning']
-        # Sort the combined pool by score (highest first)
-        experienced_and_learning.sort(key=lambda x: x[1], reverse=True)
-        
-        # Pair with highest scoring person from experienced/learning pool
-        for person, score, watering_count in experienced_and_learning:
-            if person != new_person:
-                selected_people.append(person)
-                break
-    
-    # Priority 2: New people but no experienced people available
-    elif has_new_people and not has_experienced_people and has_learning_people:
-        # Select highest scoring new person
-        new_person = people_by_experience['new'][0][0]
-        selected_people.append(new_person)
-        
-        # Pair with highest scoring learning person
-        for person, score, watering_count in people_by_experience['learning']:
-            if person != new_person:
-                selected_people.append(person)
-                break
-    
-    # Priority 3: Only learning and experienced people (no new people)
-    elif not has_new_people and (has_learning_people or has_experienced_people):
-        # Pure weight-based selection - take top 2 by score
-        selected_people = [person for person, score in all_scores[:2]]
-    
-    # Handle edge cases where we still don't have 2 people
-    if len(selected_people) < 2:
-        # If we have new people but couldn't pair them properly
-        if has_new_people:
-            # Take highest scoring new person if not already selected
-            if not selected_people:
-                selected_people.append(people_by_experience['new'][0][0])
-            
-            # Try to find a partner from any category
-            for person, score in all_scores:
-                if person not in selected_people:
-                    selected_people.append(person)
-                    break
-        else:
-            # No new people - pure weight-based selection
-            selected_people = [person for person, score in all_scores[:2]]
-    
-    return selected_people[:2]  # Ensure we return exactly 2 people
-
-def select_with_dynamic_pairing(selection_count, total_weeks_active):
+def select_with_dynamic_pairing(selection_count, total_weeks_active, history=None, carryover=None, scores_out=None,
+                                weights=None):
     """Dynamic pairing logic that prioritizes pure weight-based fairness with smart pairing preferences"""
     
     # Calculate base scores for all people - NO experience bonuses, pure weight-based
     all_scores = []
     for i in range(len(data.PEOPLE)):
-        score = calculate_weighted_score(i, selection_count, total_weeks_active)
+        score = calculate_weighted_score(i, selection_count, total_weeks_active, history, carryover, weights)
         person = data.PEOPLE[i]
-        experience_level = data.get_person_experience_level(person)
+        experience_level = data.get_person_experience_level(person, history)
         all_scores.append((person, score, experience_level))
+        if scores_out is not None:
+            scores_out[person] = score
     
     # Sort by score (highest first) - pure weight-based order
     all_scores.sort(key=lambda x: x[1], reverse=True)
@@ -263,18 +185,25 @@ def select_regular_two_people(all_scores, total_weeks_active):
     
     return selected
 
-def select_people_weighted_mean(selection_count, current_week_in_year=None):
-    """Select 2 people using weighted arithmetic mean approach with dynamic pairing"""
-    # Calculate total weeks active in system - filter out non-list entries
-    all_week_entries = []
-    for entries in data.watering_history.values():
-        if isinstance(entries, list):
-            for entry in entries:
-                if "KW" in entry:
-                    all_week_entries.append(entry)
+def count_weeks_active(history):
+    """Number of distinct weeks in a watering history"""
+    return len({entry for entries in history.values() if isinstance(entries, list)
+                for entry in entries if "KW" in entry})
+
+def select_people_weighted_mean(selection_count, current_week_in_year=None, history=None, carryover=None,
+                                weeks_active=None, scores_out=None, weights=None):
+    """Select 2 people using weighted arithmetic mean approach with dynamic pairing
     
+    Args:
+        weeks_active: count_weeks_active(history) if already known - skips the history scan
+        scores_out: optional dict filled with the score of every person
+        weights: weights to score with, defaults to data.WEIGHTS
+    """
+    history = data.watering_history if history is None else history
     # Calculate base total weeks active from existing history
-    base_total_weeks_active = len(set(all_week_entries)) if all_week_entries else 1
+    if weeks_active is None:
+        weeks_active = count_weeks_active(history)
+    base_total_weeks_active = weeks_active or 1
     
     # If we're in the middle of generating a schedule, adjust total_weeks_active
     # to reflect the progress we've made in the current generation
@@ -285,18 +214,24 @@ def select_people_weighted_mean(selection_count, current_week_in_year=None):
         total_weeks_active = base_total_weeks_active
     
     # Use dynamic pairing logic - experience-based but not fixed pairs
-    return select_with_dynamic_pairing(selection_count, total_weeks_active)
+    return select_with_dynamic_pairing(selection_count, total_weeks_active, history, carryover, scores_out, weights)
 
-def calculate_weighted_score_extra(person_index, selection_count, total_weeks_active=None):
+def calculate_weighted_score_extra(person_index, selection_count, total_weeks_active=None, history=None, carryover=None):
     """Calculate weighted arithmetic mean score for a person using extra weights"""
+    history = data.watering_history if history is None else history
     person = data.PEOPLE[person_index]
     base_weight = data.EXTRA_WEIGHTS[person_index] if person_index < len(data.EXTRA_WEIGHTS) else 1
-    watering_count = len(data.watering_history.get(person, []))
+    # Duties done above or below the fair share in earlier years are carried over
+    if carryover is None:
+        credit = fairness_ledger.get_carryover_credit(person, data.get_current_year())
+    else:
+        credit = carryover.get(person, 0)
+    watering_count = len(history.get(person, [])) + credit
     recent_selections = selection_count.get(person, 0)
     
     # Calculate how long this person has been in the system
     if total_weeks_active is None:
-        total_weeks_active = max(1, len([entry for entries in data.watering_history.values() for entry in entries if "KW" in entry]) // len(data.PEOPLE))
+        total_weeks_active = max(1, len([entry for entries in history.values() for entry in entries if "KW" in entry]) // len(data.PEOPLE))
     
     # Same logic as regular selection but using extra weights
     if total_weeks_active <= 4:
@@ -319,27 +254,27 @@ def calculate_weighted_score_extra(person_index, selection_count, total_weeks_ac
     
     return max(0.1, score)
 
-def select_ersatz_people_weighted_mean(selection_count, excluded_persons=None, current_week_in_year=None):
+def select_ersatz_people_weighted_mean(selection_count, excluded_persons=None, current_week_in_year=None,
+                                       history=None, carryover=None, weeks_active=None, scores_out=None):
     """Select 2 ErsatzPersons using weighted arithmetic mean approach with extra weights and smart pairing
     
     Args:
         selection_count: Dictionary tracking how many times each person has been selected
         excluded_persons: List of persons to exclude from ersatz selection (main persons)
         current_week_in_year: Current week in the year to adjust total_weeks_active calculation
+        history: watering history to score against, defaults to the loaded one
+        carryover: {person: credit} from fairness_ledger, looked up if not given
+        weeks_active: count_weeks_active(history) if already known - skips the history scan
+        scores_out: optional dict filled with the extra score of every candidate
     """
     if excluded_persons is None:
         excluded_persons = []
-    
-    # Calculate total weeks active in system
-    all_week_entries = []
-    for entries in data.watering_history.values():
-        if isinstance(entries, list):
-            for entry in entries:
-                if "KW" in entry:
-                    all_week_entries.append(entry)
+    history = data.watering_history if history is None else history
     
     # Calculate base total weeks active from existing history
-    base_total_weeks_active = len(set(all_week_entries)) if all_week_entries else 1
+    if weeks_active is None:
+        weeks_active = count_weeks_active(history)
+    base_total_weeks_active = weeks_active or 1
     
     # If we're in the middle of generating a schedule, adjust total_weeks_active
     # to reflect the progress we've made in the current generation
@@ -353,16 +288,20 @@ def select_ersatz_people_weighted_mean(selection_count, excluded_persons=None, c
     available_people = [person for person in data.PEOPLE if person not in excluded_persons]
     
     # Get experience levels for smart pairing among available people
-    available_new_people = [person for person in available_people if data.get_person_experience_level(person) in ["new", "beginner"]]
-    available_experienced_people = [person for person in available_people if data.get_person_experience_level(person) == "experienced"]
+    available_new_people = [person for person in available_people
+                            if data.get_person_experience_level(person, history) in ["new", "beginner"]]
+    available_experienced_people = [person for person in available_people
+                                    if data.get_person_experience_level(person, history) == "experienced"]
     
     scores = []
     for i in range(len(data.PEOPLE)):
         # Skip persons who are already selected as main persons
         if data.PEOPLE[i] in excluded_persons:
             continue
-        score = calculate_weighted_score_extra(i, selection_count, total_weeks_active)
+        score = calculate_weighted_score_extra(i, selection_count, total_weeks_active, history, carryover)
         scores.append((data.PEOPLE[i], score))
+        if scores_out is not None:
+            scores_out[data.PEOPLE[i]] = score
     
     # Sort by score in descending order
     scores.sort(key=lambda x: x[1], reverse=True)
@@ -387,7 +326,7 @@ def select_ersatz_people_weighted_mean(selection_count, excluded_persons=None, c
             return [top_new_person, best_experienced_person]
     
     # Use dynamic pairing logic for ersatz selection too
-    return select_dynamic_ersatz_pairing(scores, total_weeks_active)
+    return select_dynamic_ersatz_pairing(scores, total_weeks_active, history)
 
 def select_regular_two_people_from_scores(scores, total_weeks_active):
     """Regular selection logic for two people from pre-calculated scores"""
@@ -430,7 +369,7 @@ def select_regular_two_people_from_scores(scores, total_weeks_active):
     
     return selected
 
-def select_dynamic_ersatz_pairing(scores, total_weeks_active):
+def select_dynamic_ersatz_pairing(scores, total_weeks_active, history=None):
     """Dynamic pairing logic for ersatz selection - pure weight-based with smart pairing preferences"""
     
     # If we have fewer than 2 people available, use regular selection
@@ -440,7 +379,7 @@ def select_dynamic_ersatz_pairing(scores, total_weeks_active):
     # Get experience levels for available people - NO score bonuses, pure weight-based
     scores_with_experience = []
     for person, score in scores:
-        experience_level = data.get_person_experience_level(person)
+        experience_level = data.get_person_experience_level(person, history)
         scores_with_experience.append((person, score, experience_level))
     
     # Sort by score (highest first) - pure weight-based order
@@ -495,14 +434,133 @@ def select_dynamic_ersatz_pairing(scores, total_weeks_active):
     
     return selected_people[:2]
 
-def generate_schedule(schedule_type="Next 6 Weeks"):
-    # Reload data to ensure we're using the most current file
-    reload_current_data()
+def get_scoring_inputs(selection_count, total_weeks_active, history, carryover, scores, extra_scores, weights=None):
+    """Snapshot of the inputs of one week decision, for the people the selection scored
     
-    update_statistics()
-    full_schedule = []  # Keep track of all generated weeks
-    new_weeks_only = []  # Only the newly generated weeks
-    selection_count = {person: len(data.watering_history[person]) for person in data.PEOPLE}
+    Args:
+        scores, extra_scores: {person: score} as computed by the main and ersatz selection
+        weights: weights the selection used, defaults to data.WEIGHTS
+    """
+    people = [person for person in data.PEOPLE if person in scores or person in extra_scores]
+    weights = dict(zip(data.PEOPLE, data.WEIGHTS if weights is None else weights))
+    extra_weights = dict(zip(data.PEOPLE, data.EXTRA_WEIGHTS))
+    return {
+        'weights': {person: weights.get(person) for person in people},
+        'extra_weights': {person: extra_weights.get(person) for person in people},
+        'history_counts': {person: len(history.get(person, [])) for person in people},
+        'carryover': {person: carryover.get(person, 0) for person in people},
+        'selection_count': selection_count,
+        'levels': {person: data.get_person_experience_level(person, history) for person in people},
+        'total_weeks_active': total_weeks_active,
+        'scores': scores,
+        'extra_scores': extra_scores
+    }
+
+def plan_mentoring(weeks, selection_count, carryover=None, history=None, weights=None):
+    """Plan newcomer/mentor pairs for the weeks about to be generated
+    
+    Args:
+        weeks: list of (year, week) that will be generated
+        selection_count: current selection counts used for scoring
+        carryover: {person: credit} from fairness_ledger, looked up if not given
+        history, weights: history and weights of the run, default to the loaded ones
+    
+    Returns:
+        dict: (year, week) -> (newcomer, mentor)
+    """
+    history = data.watering_history if history is None else history
+    total_weeks_active = max(1, count_weeks_active(history))
+    newcomers = data.get_new_people(history)
+    mentors = [person for person in data.get_experienced_people(history) if person not in newcomers]
+    
+    newcomer_scores = {person: calculate_weighted_score(data.PEOPLE.index(person), selection_count,
+                                                        total_weeks_active, history, carryover, weights)
+                       for person in newcomers}
+    mentor_scores = {person: calculate_weighted_score(data.PEOPLE.index(person), selection_count,
+                                                      total_weeks_active, history, carryover, weights)
+                     for person in mentors}
+    
+    mentor_pairs = mentor_matching.plan_mentor_pairs(weeks, newcomer_scores, mentor_scores,
+                                                     mentor_matching.load_availability())
+    if mentor_pairs:
+        print(f"🤝 Planned {len(mentor_pairs)} mentor pairs for {len(newcomers)} newcomers")
+    return mentor_pairs
+
+def generate_week(schedule_year, week, selection_count, run, pending_events=None):
+    """Select main and ErsatzPersons for one week and add the entry to the run's history
+    
+    Args:
+        run: dict with the private 'history' being generated, the 'weights' and
+             'carryover' credits to score with, the remaining 'mentor_pairs' and
+             'weeks_active', the number of distinct weeks in the history (see run_schedule)
+        pending_events: if given, the week event is collected here instead of
+                        being written to the history log
+    
+    Returns:
+        str: the new week entry
+    """
+    history = run['history']
+    carryover = run['carryover']
+    weights = run['weights']
+    weeks_active = run['weeks_active']
+    total_weeks_active = max(weeks_active or 1, week)
+    scores = {}
+    extra_scores = {}
+    
+    # A planned newcomer/mentor pair takes precedence over the weekly selection
+    mentor_pair = run['mentor_pairs'].pop((int(schedule_year), int(week)), None)
+    if mentor_pair and all(person in data.PEOPLE for person in mentor_pair):
+        selected = list(mentor_pair)
+    else:
+        # Use weighted arithmetic mean selection
+        selected = select_people_weighted_mean(selection_count, week, history, carryover, weeks_active, scores, weights)
+        mentor_pair = None
+    ersatz_selected = select_ersatz_people_weighted_mean(selection_count, selected, week, history, carryover,
+                                                         weeks_active, extra_scores)
+    
+    # Log what the selection computed, before the week is added to the counts
+    inputs = get_scoring_inputs(dict(selection_count), total_weeks_active, history, carryover, scores, extra_scores,
+                                weights)
+    if mentor_pair:
+        inputs['mentor_pair'] = selected
+
+    week_entry = f"{schedule_year} KW {week}: {selected[0]} and {selected[1]} (ErsatzPersons: {ersatz_selected[0]} and {ersatz_selected[1]})"
+    for person in selected:
+        selection_count[person] += 1
+        history[person].append(week_entry)
+    run['weeks_active'] = weeks_active + 1
+
+    event = {'year': schedule_year, 'week': week, 'main_people': selected,
+             'ersatz_people': ersatz_selected, 'inputs': inputs}
+    if pending_events is not None:
+        pending_events.append(event)
+    else:
+        history_log.record_week('week_assigned', **event)
+    return week_entry
+
+def plan_schedule(schedule_type="Next 6 Weeks"):
+    """First stage of the generation, runs on the main thread
+    
+    Reloads the data and asks about year transitions. Everything the worker
+    needs from shared state is prepared here: a private copy of the history,
+    the recomputed weights, the fairness carry-over (the ledger may be rebuilt
+    and written on first use) and the mentor pairs. No weeks are generated and
+    neither the weights, the year files nor the loaded year are changed - that
+    happens in commit_schedule, so a cancelled run leaves everything as it was.
+    
+    Returns:
+        dict: plan with 'schedule_type', 'start_year', 'weeks' [(year, week), ...],
+              'history', 'weights', 'carryover', 'mentor_pairs' and 'new_year'
+              (None or the year file to switch to), or None if there is nothing to generate
+    """
+    # Reload data to ensure we're using the most current file - the views are
+    # refreshed once the generated weeks are committed
+    reload_current_data(notify=False)
+    
+    weights = calculate_statistics_weights()
+    history = {person: list(entries) if isinstance(entries, list) else entries
+               for person, entries in data.watering_history.items()}
+    new_year = None
     current_year = datetime.date.today().year
     current_week = datetime.date.today().isocalendar()[1]
     
@@ -514,330 +572,207 @@ def generate_schedule(schedule_type="Next 6 Weeks"):
         match = re.search(r'people_(\d{4})\.json', data.FILE_PATH)
         schedule_year = int(match.group(1)) if match else current_year
 
-    # Filter out non-list entries when checking for week entries
-    week_entries_found = []
-    for person in data.watering_history.values():
-        if isinstance(person, list):
-            for entry in person:
-                if "KW" in entry:
-                    week_entries_found.append(entry)
-    
-    if week_entries_found:
-        # Extract week numbers from KW entries (e.g., "2025 KW 15: ..." -> 15)
-        week_numbers = []
-        for entry in week_entries_found:
-            if "KW" in entry:
-                try:
-                    # Find KW pattern and extract number
-                    match = re.search(r'KW (\d+)', entry)
-                    if match:
-                        week_numbers.append(int(match.group(1)))
-                except:
-                    pass
-        
-        if week_numbers:
-            last_week = max(week_numbers)
-            # If last week is 52 or higher, start from week 1 of next year
-            if last_week >= 52:
-                if schedule_type == "Next 6 Weeks":
-                    # Ask user if they want to create a new year
-                    response = messagebox.askyesno("Year Complete", 
-                                                f"Year {schedule_year} is complete (week {last_week} was the last week).\n\n"
-                                                f"Do you want to create a new year {schedule_year + 1} and generate 6 weeks there?")
-                    if response:
-                        start_week = 1
-                        schedule_year = schedule_year + 1
-                        
-                        # Create the new year file if it doesn't exist
-                        new_year_file = f"people_{schedule_year}.json"
-                        if not os.path.exists(new_year_file):
-                            try:
-                                # Create new year file with current people but empty watering history
-                                new_year_data = {
-                                    "PEOPLE": data.PEOPLE[:],  # Copy current people
-                                    "WEIGHTS": data.WEIGHTS[:],  # Copy current weights
-                                    "WATERING_HISTORY": {person: [] for person in data.PEOPLE}  # Empty history for new year
-                                }
-                                
-                                # Try to write the file with better error handling
-                                try:
-                                    with open(new_year_file, "w") as file:
-                                        json.dump(new_year_data, file, indent=2)
-                                except PermissionError:
-                                    messagebox.showerror("File Permission Error", 
-                                                       f"Cannot create {new_year_file} - file may be open in another application.\n\n"
-                                                       f"Please close any Excel files or other applications using this file and try again.")
-                                    return []
-                                except Exception as file_error:
-                                    messagebox.showerror("File Creation Error", 
-                                                       f"Failed to create {new_year_file}: {str(file_error)}")
-                                    return []
-                                    
-                                print(f"Created new year file: {new_year_file}")
-                            except Exception as e:
-                                messagebox.showerror("Error", f"Failed to create new year file: {str(e)}")
-                                return []
-                        
-                        # Load the new year data
-                        if not data.load_year_data(schedule_year):
+    # Week numbers of all KW entries (e.g., "2025 KW 15: ..." -> 15)
+    week_numbers = [week for year, week, main, ersatz in data.get_schedule_model().records]
+    
+    if week_numbers:
+        last_week = max(week_numbers)
+        # If last week is 52 or higher, start from week 1 of next year
+        if last_week >= 52:
+            if schedule_type == "Next 6 Weeks":
+                # Ask user if they want to create a new year
+                response = messagebox.askyesno("Year Complete", 
+                                            f"Year {schedule_year} is complete (week {last_week} was the last week).\n\n"
+                                            f"Do you want to create a new year {schedule_year + 1} and generate 6 weeks there?")
+                if response:
+                    start_week = 1
+                    schedule_year = schedule_year + 1
+                    
+                    # The new year file is created and loaded on commit - continue
+                    # with its history, or an empty one if it does not exist yet
+                    new_year_file = f"people_{schedule_year}.json"
+                    new_year = {'year': schedule_year, 'file': new_year_file, 'file_data': None}
+                    if os.path.exists(new_year_file):
+                        file_data = year_files.read_year_file(new_year_file)
+                        if file_data is None:
                             messagebox.showerror("Error", f"Failed to load new year data for {schedule_year}")
-                            return []
+                            return None
+                        history = {person: [] for person in data.PEOPLE}
+                        history.update({person: list(entries) if isinstance(entries, list) else entries
+                                        for person, entries in file_data.get("WATERING_HISTORY", {}).items()})
                     else:
-                        # User cancelled, return empty schedule
-                        return []
+                        # Current people and weights with an empty watering history
+                        new_year['file_data'] = {
+                            "PEOPLE": data.PEOPLE[:],
+                            "WEIGHTS": weights[:],
+                            "WATERING_HISTORY": {person: [] for person in data.PEOPLE}
+                        }
+                        history = {person: [] for person in data.PEOPLE}
                 else:
-                    # For "Remaining Weeks", if we're already at week 52, there are no remaining weeks
-                    start_week = 53  # This will result in 0 weeks to generate
+                    # User cancelled, nothing to generate
+                    return None
             else:
-                start_week = last_week + 1
+                # For "Remaining Weeks", if we're already at week 52, there are no remaining weeks
+                start_week = 53  # This will result in 0 weeks to generate
         else:
-            start_week = current_week  # Changed from current_week + 1 to start from current week
+            start_week = last_week + 1
     else:
         # No existing entries - this is first time use, start from current week
         start_week = current_week
 
     max_week = 52
-    week = start_week
-    year_transition_occurred = False  # Initialize for both schedule types
     
-    # Calculate number of weeks to generate based on schedule type
     if schedule_type == "Remaining Weeks":
-        # Calculate remaining weeks in current year
-        if week <= max_week:
-            weeks_to_generate = max_week - week + 1
-        else:
-            weeks_to_generate = 0  # No remaining weeks if we're already past week 52
+        if start_week > max_week:
             messagebox.showinfo("Year Complete", f"Year {schedule_year} is already complete. No remaining weeks to generate.")
-            return []
-        
-        # Generate schedule for the calculated number of weeks
-        for _ in range(weeks_to_generate):
-            # Handle year transition
-            if week > max_week:
-                year_transition_occurred = True
-                
-                # Save only the new weeks generated in the current year
-                if new_weeks_only:
-                    # Excel functionality removed - using JSON-only data storage
-                    pass
-                
-                # Transition to new year
-                schedule_year = schedule_year + 1  # Increment from current year
-                week = 1
-                
-                # Create new year data file and reset history
-                new_json_file = f"people_{schedule_year}.json"
-                new_history = {person: [] for person in data.PEOPLE}
-                
-                # Save new year file
-                with open(new_json_file, "w") as file:
-                    json.dump({"PEOPLE": data.PEOPLE, "WEIGHTS": data.WEIGHTS, "WATERING_HISTORY": new_history}, file)
-                
-                # Update global variables in data module
-                data.FILE_PATH = new_json_file
-                data.watering_history = new_history
-                
-                # Reset selection count for new year
-                selection_count = {person: 0 for person in data.PEOPLE}
-                
-                # Excel functionality removed - using JSON-only data storage
-                new_weeks_only = []  # Reset new weeks for new year
+            return None
+        weeks = [(schedule_year, week) for week in range(start_week, max_week + 1)]
+    else:  # "Next 6 Weeks" - continues in week 1 of the next year if needed
+        weeks = [(schedule_year + (week - 1) // max_week, (week - 1) % max_week + 1)
+                 for week in range(start_week, start_week + 6)]
+    
+    carryover = {person: fairness_ledger.get_carryover_credit(person, schedule_year)
+                 for person in data.PEOPLE}
+    selection_count = {person: len(history.get(person, [])) for person in data.PEOPLE}
+    # Match newcomers with mentors over the whole planning horizon first
+    mentor_pairs = plan_mentoring(weeks, selection_count, carryover, history, weights)
+    
+    return {'schedule_type': schedule_type, 'start_year': schedule_year, 'weeks': weeks,
+            'history': history, 'weights': weights, 'carryover': carryover,
+            'mentor_pairs': mentor_pairs, 'new_year': new_year}
 
-            # Use weighted arithmetic mean selection
-            selected = select_people_weighted_mean(selection_count, current_week_in_year=week)
-            ersatz_selected = select_ersatz_people_weighted_mean(selection_count, excluded_persons=selected, current_week_in_year=week)
-
-            for person in selected:
-                selection_count[person] += 1
-                data.watering_history[person].append(f"{schedule_year} KW {week}: {selected[0]} and {selected[1]} (ErsatzPersons: {ersatz_selected[0]} and {ersatz_selected[1]})")
-
-            week_entry = f"{schedule_year} KW {week}: {selected[0]} and {selected[1]} (ErsatzPersons: {ersatz_selected[0]} and {ersatz_selected[1]})"
-            new_weeks_only.append(week_entry)
-            full_schedule.append(week_entry)
-            week += 1
+def run_schedule(plan, progress_callback=None, cancel_event=None):
+    """Second stage of the generation, safe to run in a worker thread
     
-    else:  # "Next 6 Weeks"
-        weeks_to_generate = 6
-        
-        # Check if we'll cross a year boundary within the next 6 weeks
-        weeks_remaining_in_year = max_week - week + 1
+    Generates the planned weeks into the private history copy of the plan
+    without touching data or writing any file. Weeks of a following year are
+    collected in a separate history.
+    
+    Args:
+        plan: dict returned by plan_schedule
+        progress_callback: called as progress_callback(done, total, week_entry) after every week
+        cancel_event: threading.Event checked between weeks
+    
+    Returns:
+        dict: 'years' [{'year', 'history', 'entries'}], 'events' for the history log
+              and 'cancelled'
+    """
+    run = {'history': plan['history'], 'weights': plan['weights'], 'carryover': plan['carryover'],
+           'mentor_pairs': dict(plan['mentor_pairs']),
+           'weeks_active': count_weeks_active(plan['history'])}  # kept up to date by generate_week
+    selection_count = {person: len(run['history'].get(person, [])) for person in data.PEOPLE}
+    
+    years = [{'year': plan['start_year'], 'history': run['history'], 'entries': []}]
+    events = []
+    cancelled = False
+    total = len(plan['weeks'])
+    for done, (schedule_year, week) in enumerate(plan['weeks'], start=1):
+        if cancel_event is not None and cancel_event.is_set():
+            cancelled = True
+            break
         
-        # If we're already at or past week 52, or if we need to cross year boundary
-        if weeks_remaining_in_year <= 0 or weeks_remaining_in_year < weeks_to_generate:
-            year_transition_occurred = True
-            
-            # If we're already past week 52, skip to new year directly
-            if weeks_remaining_in_year <= 0:
-                year_transition_message = f"Year transition detected:\n\n"
-                year_transition_message += f"Current year {schedule_year - 1} is already complete.\n"
-                year_transition_message += f"Starting new year {schedule_year} with 6 weeks...\n"
-                
-                # We should already be in the new year due to the logic above
-                # Generate all 6 weeks for the new year
-                for _ in range(weeks_to_generate):
-                    # Use weighted arithmetic mean selection
-                    selected = select_people_weighted_mean(selection_count, current_week_in_year=week)
-                    ersatz_selected = select_ersatz_people_weighted_mean(selection_count, excluded_persons=selected, current_week_in_year=week)
-
-                    for person in selected:
-                        selection_count[person] += 1
-                        data.watering_history[person].append(f"{schedule_year} KW {week}: {selected[0]} and {selected[1]} (ErsatzPersons: {ersatz_selected[0]} and {ersatz_selected[1]})")
-
-                    week_entry = f"{schedule_year} KW {week}: {selected[0]} and {selected[1]} (ErsatzPersons: {ersatz_selected[0]} and {ersatz_selected[1]})"
-                    new_weeks_only.append(week_entry)
-                    full_schedule.append(week_entry)
-                    week += 1
-                
-                year_transition_message += f"✓ Generated 6 weeks for new year {schedule_year} (KW 1-6)\n"
-                messagebox.showinfo("Year Transition Complete", year_transition_message)
-                
-            else:
-                # We need to finish current year first, then start new year
-                year_transition_message = f"Year transition detected:\n\n"
-                year_transition_message += f"Step 1: Completing current year {schedule_year} with {weeks_remaining_in_year} weeks remaining...\n"
-                
-                current_year_weeks = []  # Track weeks for current year
-                current_year_start_week = week  # Remember the starting week for this year
-                
-                # Generate ALL remaining weeks for the current year
-                for _ in range(weeks_remaining_in_year):
-                    # Use weighted arithmetic mean selection
-                    selected = select_people_weighted_mean(selection_count, current_week_in_year=week)
-                    ersatz_selected = select_ersatz_people_weighted_mean(selection_count, excluded_persons=selected, current_week_in_year=week)
-
-                    for person in selected:
-                        selection_count[person] += 1
-                        data.watering_history[person].append(f"{schedule_year} KW {week}: {selected[0]} and {selected[1]} (ErsatzPersons: {ersatz_selected[0]} and {ersatz_selected[1]})")
-
-                    week_entry = f"{schedule_year} KW {week}: {selected[0]} and {selected[1]} (ErsatzPersons: {ersatz_selected[0]} and {ersatz_selected[1]})"
-                    current_year_weeks.append(week_entry)
-                    full_schedule.append(week_entry)
-                    week += 1
-                
-                # IMMEDIATELY save the completed year's schedule and data
-                if current_year_weeks:
-                    # Excel functionality removed - using JSON-only data storage
-                    save_to_file()  # Save current year's data to JSON immediately
-                current_year_end_week = week - 1
-                if current_year_start_week == current_year_end_week:
-                    year_transition_message += f"✓ Completed and saved 1 week for year {schedule_year} (KW {current_year_start_week})\n"
-                else:
-                    year_transition_message += f"✓ Completed and saved {len(current_year_weeks)} weeks for year {schedule_year} (KW {current_year_start_week}-{current_year_end_week})\n"
-            
-            year_transition_message += f"✓ Year {schedule_year} is now complete and saved.\n"
-            
-            # Step 2: NOW transition to new year
-            original_schedule_year = schedule_year
-            schedule_year = schedule_year + 1
-            week = 1
-            
-            year_transition_message += f"\nStep 2: Now transitioning to new year {schedule_year}...\n"
-            
-            # Create new year data file and reset history
-            new_json_file = f"people_{schedule_year}.json"
-            new_history = {person: [] for person in data.PEOPLE}
-            
-            # Save new year file
-            with open(new_json_file, "w") as file:
-                json.dump({"PEOPLE": data.PEOPLE, "WEIGHTS": data.WEIGHTS, "WATERING_HISTORY": new_history}, file)
-            
-            # Update global variables in data module
-            data.FILE_PATH = new_json_file
-            data.watering_history = new_history
-            
-            # Reset selection count for new year
+        if schedule_year != years[-1]['year']:
+            # Year transition: continue with an empty history, the file is written on commit
+            run['history'] = {person: [] for person in data.PEOPLE}
+            run['weeks_active'] = 0
             selection_count = {person: 0 for person in data.PEOPLE}
-            
-            # Excel functionality removed - using JSON-only data storage
-            
-            # Step 3: Generate remaining weeks for the new year
-            remaining_weeks_needed = weeks_to_generate - weeks_remaining_in_year
-            year_transition_message += f"✓ Created new year file: people_{schedule_year}.json\n"
-            year_transition_message += f"\nStep 3: Generating {remaining_weeks_needed} weeks for new year {schedule_year}...\n"
-            
-            new_year_weeks = []  # Track weeks for new year
-            new_year_start_week = week  # Should be 1 for new year
-            
-            for _ in range(remaining_weeks_needed):
-                # Use weighted arithmetic mean selection
-                selected = select_people_weighted_mean(selection_count, current_week_in_year=week)
-                ersatz_selected = select_ersatz_people_weighted_mean(selection_count, excluded_persons=selected, current_week_in_year=week)
-
-                for person in selected:
-                    selection_count[person] += 1
-                    data.watering_history[person].append(f"{schedule_year} KW {week}: {selected[0]} and {selected[1]} (ErsatzPersons: {ersatz_selected[0]} and {ersatz_selected[1]})")
-
-                week_entry = f"{schedule_year} KW {week}: {selected[0]} and {selected[1]} (ErsatzPersons: {ersatz_selected[0]} and {ersatz_selected[1]})"
-                new_year_weeks.append(week_entry)
-                full_schedule.append(week_entry)
-                week += 1
-            
-            # Save the new year's schedule
-            if new_year_weeks:
-                # Excel functionality removed - using JSON-only data storage
-                save_to_file()  # Save new year's data to JSON
-                new_year_end_week = week - 1
-                if new_year_start_week == new_year_end_week:
-                    year_transition_message += f"✓ Generated and saved 1 week for new year {schedule_year} (KW {new_year_start_week})\n"
-                else:
-                    year_transition_message += f"✓ Generated and saved {len(new_year_weeks)} weeks for new year {schedule_year} (KW {new_year_start_week}-{new_year_end_week})\n"
-            
-            # Combine all weeks for the final list
-            new_weeks_only = current_year_weeks + new_year_weeks
-            
-            year_transition_message += f"\nYear transition completed successfully!"
-            
-            # Create summary of all generated weeks
-            total_weeks_summary = f"Total weeks generated: {len(new_weeks_only)}\n"
-            if current_year_weeks:
-                current_year_start = current_year_start_week
-                current_year_end = current_year_start + len(current_year_weeks) - 1
-                if len(current_year_weeks) == 1:
-                    total_weeks_summary += f"• {original_schedule_year}: 1 week (KW {current_year_start})\n"
-                else:
-                    total_weeks_summary += f"• {original_schedule_year}: {len(current_year_weeks)} weeks (KW {current_year_start}-{current_year_end})\n"
-            
-            if new_year_weeks:
-                if len(new_year_weeks) == 1:
-                    total_weeks_summary += f"• {schedule_year}: 1 week (KW {new_year_start_week})\n"
-                else:
-                    total_weeks_summary += f"• {schedule_year}: {len(new_year_weeks)} weeks (KW {new_year_start_week}-{new_year_end_week})\n"
-            
-            year_transition_message += f"\n{total_weeks_summary}"
-            
-            # Show the transition summary
-            messagebox.showinfo("Year Transition Complete", year_transition_message)
+            years.append({'year': schedule_year, 'history': run['history'], 'entries': []})
         
-        else:
-            # No year boundary crossing, generate normally
-            year_transition_occurred = False
-            start_week_for_message = week
-            
-            for _ in range(weeks_to_generate):
-                # Use weighted arithmetic mean selection
-                selected = select_people_weighted_mean(selection_count, current_week_in_year=week)
-                ersatz_selected = select_ersatz_people_weighted_mean(selection_count, excluded_persons=selected, current_week_in_year=week)
-
-                for person in selected:
-                    selection_count[person] += 1
-                    data.watering_history[person].append(f"{schedule_year} KW {week}: {selected[0]} and {selected[1]} (ErsatzPersons: {ersatz_selected[0]} and {ersatz_selected[1]})")
-
-                week_entry = f"{schedule_year} KW {week}: {selected[0]} and {selected[1]} (ErsatzPersons: {ersatz_selected[0]} and {ersatz_selected[1]})"
-                new_weeks_only.append(week_entry)
-                full_schedule.append(week_entry)
-                week += 1
+        week_entry = generate_week(schedule_year, week, selection_count, run, events)
+        years[-1]['entries'].append(week_entry)
+        if progress_callback:
+            progress_callback(done, total, week_entry)
+    
+    return {'years': years, 'events': events, 'cancelled': cancelled}
 
-    # Only save if we didn't already save during year transition
-    if not year_transition_occurred:
-        save_to_file()
+def commit_schedule(plan, result):
+    """Last stage of the generation, runs on the main thread
+    
+    Stores the recomputed weights, creates and switches to the new year file
+    if the plan starts a new year, then swaps the generated histories into
+    data and writes them to the year files, the fairness ledger and the
+    history log.
+    
+    Returns:
+        list: all generated week entries
+    """
+    if result['cancelled']:
+        return []
+    
+    data.WEIGHTS[:] = plan['weights']
+    history_log.record_weights('update_statistics', data.PEOPLE, data.WEIGHTS, data.EXTRA_WEIGHTS)
+    new_year = plan['new_year']
+    if new_year:
+        save_to_file()  # The completed year keeps its updated weights
+        if new_year['file_data'] is not None and not os.path.exists(new_year['file']):
+            try:
+                year_files.atomic_write_json(new_year['file'], new_year['file_data'])
+            except PermissionError:
+                messagebox.showerror("File Permission Error", 
+                                   f"Cannot create {new_year['file']} - file may be open in another application.\n\n"
+                                   f"Please close any Excel files or other applications using this file and try again.")
+                return []
+            print(f"Created new year file: {new_year['file']}")
+        if not data.load_year_data(new_year['year']):
+            messagebox.showerror("Error", f"Failed to load new year data for {new_year['year']}")
+            return []
     
-    # Save only the newly generated weeks to Excel (only if not already saved during year transition)
-    if new_weeks_only and not year_transition_occurred:
-        # Excel functionality removed - using JSON-only data storage
-        pass
+    full_schedule = []
+    for index, year_run in enumerate(result['years']):
+        if index > 0:
+            # Switch to the new year file - created with the current people and weights
+            data.FILE_PATH = f"people_{year_run['year']}.json"
+        data.watering_history = year_run['history']
+        save_to_file()
+        full_schedule.extend(year_run['entries'])
+    
+    # Commit the generated weeks to the cross-year fairness ledger in one write
+    committed_weeks = []
+    for week_entry in full_schedule:
+        parsed = parse_week_entry(week_entry)
+        if parsed:
+            committed_weeks.append((parsed[0], parsed[1], parsed[2]))
+    if committed_weeks:
+        fairness_ledger.record_weeks(committed_weeks, data.PEOPLE)
+    
+    for event in result['events']:
+        history_log.record_week('week_assigned', **event)
+    
+    if len(result['years']) > 1:
+        data.emit(data.YEAR_SWITCHED, year=result['years'][-1]['year'])
+    else:
+        data.emit(data.WEEK_CHANGED, year=result['years'][0]['year'],
+                  weeks=[parse_week_entry(entry)[1] for entry in result['years'][0]['entries']])
+    
+    if len(result['years']) > 1:
+        # Create summary of all generated weeks
+        year_transition_message = f"Year transition detected:\n\n"
+        for year_run in result['years']:
+            weeks = [parse_week_entry(entry)[1] for entry in year_run['entries']]
+            if not weeks:
+                continue
+            if len(weeks) == 1:
+                year_transition_message += f"✓ {year_run['year']}: 1 week (KW {weeks[0]})\n"
+            else:
+                year_transition_message += f"✓ {year_run['year']}: {len(weeks)} weeks (KW {min(weeks)}-{max(weeks)})\n"
+        year_transition_message += f"\n✓ Created new year file: {data.FILE_PATH}\n"
+        year_transition_message += f"\nYear transition completed successfully!"
+        messagebox.showinfo("Year Transition Complete", year_transition_message)
     
     return full_schedule
 
+def generate_schedule(schedule_type="Next 6 Weeks"):
+    """Plan, generate and commit a schedule synchronously
+    
+    The GUI runs run_schedule in a worker thread instead, see
+    gui.generate_and_show_schedule.
+    """
+    plan = plan_schedule(schedule_type)
+    if not plan:
+        return []
+    result = run_schedule(plan)
+    return commit_schedule(plan, result)
+
 def show_schedule(schedule_type="Next 6 Weeks"):
     # Reload current data before generating schedule
     reload_current_data()
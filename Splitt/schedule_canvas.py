@@ -0,0 +1,174 @@
+"""
+Schedule visualization canvas with viewport culling
+
+The summary canvas used to delete everything and create about seven items
+per week on each refresh. ScheduleCanvas keeps a small pool of item groups
+("slots"), draws only the weeks intersecting the visible part of the scroll
+region and moves/reconfigures pooled items in place when the view scrolls.
+
+Usage:
+    schedule_visual = ScheduleCanvas(schedule_canvas, canvas_scrollbar)
+    schedule_visual.set_rows(rows, style)
+"""
+
+ROW_HEIGHT = 60
+BLOCK_HEIGHT = 50
+BLOCK_WIDTH = 260
+TOP_OFFSET = 20
+LEGEND_HEIGHT = 70
+CANVAS_WIDTH = 280
+
+class ScheduleCanvas:
+    def __init__(self, canvas, scrollbar=None):
+        """Attach to a Canvas and take over its vertical scrollbar"""
+        self.canvas = canvas
+        self.rows = []
+        self.style = None
+        self.slots = []       # item ids per slot: block, week text, person rects and texts
+        self.drawn = []       # (row index, row) currently shown by each slot, None if hidden
+        self.assigned = {}    # row index -> slot
+        self.legend = None
+
+        if scrollbar is not None:
+            scrollbar.configure(command=self.yview)
+        canvas.bind('<Configure>', lambda event: self.redraw_visible(), add='+')
+        canvas.bind('<MouseWheel>', self._on_mousewheel)
+        canvas.bind('<Button-4>', self._on_mousewheel)
+        canvas.bind('<Button-5>', self._on_mousewheel)
+
+    def set_rows(self, rows, style):
+        """Show new week rows
+
+        Args:
+            rows: list of (week, bg_color, border_color, border_width, ((person, color), ...))
+            style: dict with 'colors' (theme canvas colors), 'fonts' (heading/text/legend)
+                   and 'person_outline'
+        """
+        self.rows = [tuple(row) for row in rows]
+        if style != self.style:
+            self.style = style
+            self._apply_style()
+
+        content_height = TOP_OFFSET + len(self.rows) * ROW_HEIGHT
+        self.canvas.configure(scrollregion=(0, 0, CANVAS_WIDTH, content_height + LEGEND_HEIGHT))
+        self._place_legend(content_height + 20)
+        self.redraw_visible()
+
+    def yview(self, *args):
+        self.canvas.yview(*args)
+        self.redraw_visible()
+
+    def redraw_visible(self):
+        """Assign pooled slots to the rows inside the viewport"""
+        total = len(self.rows)
+        top = self.canvas.canvasy(0)
+        height = self.canvas.winfo_height()
+        if height <= 1:
+            height = int(self.canvas.cget('height'))
+        first = max(0, int((top - TOP_OFFSET) // ROW_HEIGHT))
+        last = min(total, int((top + height - TOP_OFFSET) // ROW_HEIGHT) + 1)
+
+        # Release slots of rows that left the viewport
+        for index in [index for index in self.assigned if index < first or index >= last]:
+            del self.assigned[index]
+        used = set(self.assigned.values())
+        free = [slot for slot in range(len(self.slots)) if slot not in used]
+
+        for index in range(first, last):
+            slot = self.assigned.get(index)
+            if slot is None:
+                slot = free.pop() if free else self._new_slot()
+                self.assigned[index] = slot
+            row = self.rows[index]
+            if self.drawn[slot] != (index, row):
+                self._draw_row(slot, index, row)
+
+        for slot in free:
+            if self.drawn[slot] is not None:
+                for item in self.slots[slot]:
+                    self.canvas.itemconfigure(item, state='hidden')
+                self.drawn[slot] = None
+
+    def _new_slot(self):
+        canvas = self.canvas
+        fonts = self.style['fonts']
+        text_color = self.style['colors']['text']
+        items = (
+            canvas.create_rectangle(0, 0, 0, 0),
+            canvas.create_text(0, 0, anchor='w', font=fonts['heading'], fill=text_color),
+            canvas.create_rectangle(0, 0, 0, 0, outline=self.style['person_outline'], width=1),
+            canvas.create_text(0, 0, anchor='center', font=fonts['text'], fill=text_color),
+            canvas.create_rectangle(0, 0, 0, 0, outline=self.style['person_outline'], width=1),
+            canvas.create_text(0, 0, anchor='center', font=fonts['text'], fill=text_color),
+        )
+        self.slots.append(items)
+        self.drawn.append(None)
+        return len(self.slots) - 1
+
+    def _draw_row(self, slot, index, row):
+        canvas = self.canvas
+        week, bg_color, border_color, border_width, people = row
+        block, week_text, rect1, text1, rect2, text2 = self.slots[slot]
+        y = TOP_OFFSET + index * ROW_HEIGHT
+
+        canvas.coords(block, 10, y, 10 + BLOCK_WIDTH, y + BLOCK_HEIGHT)
+        canvas.itemconfigure(block, outline=border_color, width=border_width, fill=bg_color, state='normal')
+        canvas.coords(week_text, 30, y + 15)
+        canvas.itemconfigure(week_text, text=f"Week {week}", state='normal')
+
+        person_items = ((rect1, text1, 15, 135), (rect2, text2, 140, 260))
+        for position, (rect, text, x1, x2) in enumerate(person_items):
+            if len(people) >= 2:
+                person, color = people[position]
+                canvas.coords(rect, x1, y + 25, x2, y + 45)
+                canvas.itemconfigure(rect, fill=color, state='normal')
+                canvas.coords(text, (x1 + x2) / 2, y + 35)
+                canvas.itemconfigure(text, text=person, state='normal')
+            else:
+                canvas.itemconfigure(rect, state='hidden')
+                canvas.itemconfigure(text, state='hidden')
+        self.drawn[slot] = (index, row)
+
+    def _apply_style(self):
+        """Re-style pooled items after a theme change"""
+        fonts = self.style['fonts']
+        colors = self.style['colors']
+        for slot, (block, week_text, rect1, text1, rect2, text2) in enumerate(self.slots):
+            self.canvas.itemconfigure(week_text, font=fonts['heading'], fill=colors['text'])
+            self.canvas.itemconfigure(text1, font=fonts['text'], fill=colors['text'])
+            self.canvas.itemconfigure(text2, font=fonts['text'], fill=colors['text'])
+            self.canvas.itemconfigure(rect1, outline=self.style['person_outline'])
+            self.canvas.itemconfigure(rect2, outline=self.style['person_outline'])
+            self.drawn[slot] = None
+        if self.legend is not None:
+            self.canvas.delete(*self.legend)
+            self.legend = None
+
+    def _place_legend(self, legend_y):
+        canvas = self.canvas
+        colors = self.style['colors']
+        fonts = self.style['fonts']
+        if self.legend is None:
+            self.legend = (
+                canvas.create_text(0, 0, text="Legend:", font=fonts['heading'], anchor='w', fill=colors['legend']),
+                canvas.create_rectangle(0, 0, 0, 0, outline=colors['current_week_border'], width=3, fill=colors['current_week']),
+                canvas.create_text(0, 0, text="Current Week", font=fonts['legend'], anchor='w', fill=colors['text']),
+                canvas.create_rectangle(0, 0, 0, 0, outline=colors['next_week_border'], width=2, fill=colors['next_week']),
+                canvas.create_text(0, 0, text="Next Week", font=fonts['legend'], anchor='w', fill=colors['text']),
+            )
+        title, current_box, current_text, next_box, next_text = self.legend
+        canvas.coords(title, 15, legend_y)
+        canvas.coords(current_box, 15, legend_y + 15, 25, legend_y + 25)
+        canvas.coords(current_text, 30, legend_y + 20)
+        canvas.coords(next_box, 15, legend_y + 35, 25, legend_y + 45)
+        canvas.coords(next_text, 30, legend_y + 40)
+
+    def _on_mousewheel(self, event):
+        if getattr(event, 'num', None) == 4:
+            step = -1
+        elif getattr(event, 'num', None) == 5:
+            step = 1
+        else:
+            step = -1 if event.delta > 0 else 1
+        self.yview('scroll', step, 'units')
+        return "break"
@@ -0,0 +1,55 @@
+"""
+Shared parsed schedule model
+
+The watering history stores each week as a string in the history of every
+main person. ScheduleModel parses a history once into one record per
+(year, week) and keeps the views the GUI, the Tabelle and the exports need.
+
+data.get_schedule_model() returns the model of the current data and only
+rebuilds it after data.DATA_VERSION was bumped by a change.
+
+Records are tuples like everywhere else in the code:
+    (year, week, [person1, person2], [ersatz_person1, ersatz_person2])
+"""
+
+import year_files
+
+class ScheduleModel:
+    def __init__(self, history, version=None):
+        """Parse a watering history {person: [entries]}
+
+        Args:
+            history: watering history as stored in the year files
+            version: data version the model belongs to (None for file snapshots)
+        """
+        self.version = version
+        self.records = year_files.week_records_from_history(history)
+        self.weeks = {}
+        self.by_year = {}
+        self.by_person = {}
+        for record in self.records:
+            year, week, main, ersatz = record
+            self.weeks[(year, week)] = record
+            self.by_year.setdefault(year, []).append(record)
+            for role, people in (('main', main), ('ersatz', ersatz)):
+                for person in people:
+                    if person:
+                        self.by_person.setdefault(person, {'main': [], 'ersatz': []})[role].append(record)
+
+    def get_week(self, year, week):
+        """Record of one week or None"""
+        return self.weeks.get((int(year), int(week)))
+
+    def year_records(self, year):
+        """Records of one year, sorted by week"""
+        return self.by_year.get(int(year), [])
+
+    def person_records(self, person, role='main'):
+        """Records where a person is 'main' or 'ersatz', sorted by (year, week)"""
+        return self.by_person.get(person, {}).get(role, [])
+
+    def years(self):
+        return sorted(self.by_year)
+
+    def __len__(self):
+        return len(self.records)
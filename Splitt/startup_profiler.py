@@ -0,0 +1,198 @@
+"""
+Startup profiling mode
+
+Enabled with the environment variable GIESSPLAN_PROFILE=1 or the command
+line flag --profile-startup (use "cprofile" as value / --profile-startup=cprofile
+to also run cProfile):
+
+    python main.py --profile-startup
+    GIESSPLAN_PROFILE=cprofile python main.py
+
+Records the wall time of every startup phase and of every module imported
+for the first time. Once the main window has been painted the ranked
+summary is printed and a JSON trace (plus startup_profile.prof with
+cProfile) is written. When disabled every function is a cheap no-op.
+
+Show a trace copied from another machine:
+
+    python startup_profiler.py startup_trace.json
+"""
+
+import os
+import sys
+import json
+import time
+import builtins
+import datetime
+
+ENV_VAR = "GIESSPLAN_PROFILE"
+CLI_FLAG = "--profile-startup"
+TRACE_FILE = "startup_trace.json"
+CPROFILE_FILE = "startup_profile.prof"
+SUMMARY_ROWS = 15
+
+_enabled = False
+_start = None
+_last_checkpoint = None
+_phases = []
+_imports = []
+_import_stack = []
+_original_import = None
+_profiler = None
+
+def is_enabled():
+    return _enabled
+
+def enable_from_args(argv=None):
+    """Turn profiling on if requested by CLI flag or environment variable
+
+    The flag is removed from argv so the rest of the app does not see it.
+    """
+    argv = sys.argv if argv is None else argv
+    mode = os.environ.get(ENV_VAR, "").strip().lower()
+    for arg in list(argv[1:]):
+        if arg == CLI_FLAG or arg.startswith(CLI_FLAG + "="):
+            mode = arg.partition("=")[2] or "1"
+            argv.remove(arg)
+    if mode and mode not in ("0", "false", "no", "off"):
+        enable(use_cprofile=(mode == "cprofile"))
+    return _enabled
+
+def enable(use_cprofile=False):
+    """Start recording phases and imports"""
+    global _enabled, _start, _last_checkpoint, _original_import, _profiler
+    if _enabled:
+        return
+    _enabled = True
+    _start = _last_checkpoint = time.perf_counter()
+    _original_import = builtins.__import__
+    builtins.__import__ = _timed_import
+    if use_cprofile:
+        import cProfile
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    print(f"⏱️ Startup profiling enabled{' (with cProfile)' if use_cprofile else ''}")
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """builtins.__import__ replacement timing first-time imports"""
+    if level or name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+    started = time.perf_counter()
+    record = {'module': name, 'start': started - _start, 'seconds': 0.0, 'self_seconds': 0.0,
+              'parent': _import_stack[-1]['module'] if _import_stack else None, 'children_seconds': 0.0}
+    _import_stack.append(record)
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        _import_stack.pop()
+        record['seconds'] = time.perf_counter() - started
+        record['self_seconds'] = record['seconds'] - record.pop('children_seconds')
+        if _import_stack:
+            _import_stack[-1]['children_seconds'] += record['seconds']
+        _imports.append(record)
+
+def _record_phase(name, started, ended):
+    _phases.append({'name': name, 'start': started - _start, 'seconds': ended - started})
+
+class phase:
+    """Context manager timing one named startup phase
+
+        with startup_profiler.phase("check single instance"):
+            check_single_instance()
+    """
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        global _last_checkpoint
+        if _enabled:
+            ended = time.perf_counter()
+            _record_phase(self.name, self.started, ended)
+            _last_checkpoint = ended
+        return False
+
+def checkpoint(name):
+    """Record the time since the previous checkpoint as phase `name`
+
+    For module-level code (gui.py) that cannot be wrapped in a with block.
+    """
+    global _last_checkpoint
+    if not _enabled:
+        return
+    now = time.perf_counter()
+    _record_phase(name, _last_checkpoint, now)
+    _last_checkpoint = now
+
+def report_after_first_paint(root):
+    """Finish profiling once the main loop has drawn the window"""
+    if _enabled:
+        root.after_idle(lambda: finish(root))
+
+def finish(root=None):
+    """Stop profiling, print the ranked summary and write the trace files"""
+    global _enabled, _profiler
+    if not _enabled:
+        return None
+    if root is not None:
+        root.update_idletasks()
+        checkpoint("first paint")
+    builtins.__import__ = _original_import
+    _enabled = False
+
+    cprofile_path = None
+    if _profiler is not None:
+        _profiler.disable()
+        try:
+            _profiler.dump_stats(CPROFILE_FILE)
+            cprofile_path = CPROFILE_FILE
+        except OSError as e:
+            print(f"Error writing {CPROFILE_FILE}: {e}")
+
+    trace = {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'total_seconds': time.perf_counter() - _start,
+        'phases': _phases,
+        'imports': sorted(_imports, key=lambda record: record['start']),
+        'cprofile_file': cprofile_path
+    }
+    try:
+        with open(TRACE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, indent=2)
+        print(f"⏱️ Startup trace written to {TRACE_FILE}")
+    except OSError as e:
+        print(f"Error writing {TRACE_FILE}: {e}")
+
+    print(format_summary(trace))
+    if _profiler is not None:
+        import pstats
+        pstats.Stats(_profiler).sort_stats('cumulative').print_stats(SUMMARY_ROWS)
+        _profiler = None
+    return trace
+
+def format_summary(trace):
+    """Ranked text summary of a trace dict"""
+    lines = [f"=== Startup profile: {trace['total_seconds']:.3f}s until first paint ==="]
+    lines.append("Phases (slowest first):")
+    for record in sorted(trace['phases'], key=lambda record: record['seconds'], reverse=True):
+        lines.append(f"  {record['seconds']:8.3f}s  {record['name']}")
+
+    imports = sorted(trace['imports'], key=lambda record: record['self_seconds'], reverse=True)
+    lines.append(f"Imports by own time (top {min(SUMMARY_ROWS, len(imports))} of {len(imports)}):")
+    for record in imports[:SUMMARY_ROWS]:
+        lines.append(f"  {record['self_seconds']:8.3f}s  {record['module']}"
+                     f" (total {record['seconds']:.3f}s, imported by {record['parent'] or 'main'})")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else TRACE_FILE
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            print(format_summary(json.load(f)))
+    except (OSError, ValueError) as e:
+        print(f"Error reading {path}: {e}")
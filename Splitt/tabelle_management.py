@@ -1,12 +1,21 @@
 import tkinter as tk
 from tkinter import messagebox, ttk, filedialog
-import csv
 import os
 import datetime
 import re
 import json
 import data
 from data import get_current_year, get_available_years
+from virtual_tree import VirtualTreeview
+import csv_export
+import csv_diff
+import csv_preview
+import xlsx_writer
+import ics_export
+import html_dashboard
+import fairness_ledger
+import year_files
+import auto_export
 
 # Try to import theme integration
 try:
@@ -15,6 +24,13 @@ try:
 except ImportError:
     THEME_AVAILABLE = False
 
+# Highlighting of rows that differ between the expected structure and the CSV
+DIFF_TAGS = {
+    'added': {'background': '#2e7d32', 'foreground': '#ffffff'},    # Green - missing in the CSV
+    'changed': {'background': '#f9a825', 'foreground': '#000000'},  # Amber - different values
+    'removed': {'background': '#c62828', 'foreground': '#ffffff'}   # Red - only in the CSV
+}
+
 class TabelleManager:
     def __init__(self, parent, widgets, colors, theme=None):
         self.parent = parent
@@ -23,6 +39,12 @@ class TabelleManager:
         self.theme = theme
         self.csv_file_path = None
         self.current_csv_data = []
+        self.current_csv_signature = None  # (path, size, mtime) of the rows shown in the current CSV view
+        self.csv_loader = None  # CsvPreviewLoader, created with the current CSV view
+        self.expected_rows = []
+        self.csv_diff = None  # csv_diff result of expected vs. current rows, None while loading
+        self.tabelle_frame = None
+        self.built = False
         
         # Settings file for persistent configuration
         self.settings_file = "tabelle_settings.json"
@@ -31,10 +53,18 @@ class TabelleManager:
         # Initialize CSV file path based on current year and selected folder
         self.update_csv_file_path()
         
+        # Opt-in regeneration of the exports after data changes (gui subscribes notify)
+        self.auto_exporter = auto_export.AutoExporter(parent, self.auto_export_signature,
+                                                      self.prepare_auto_export, self.show_auto_export_status)
+        self.auto_exporter.enabled = bool(self.settings.get("auto_export", False))
+        self.auto_export_var = None
+        
     def load_settings(self):
         """Load settings from file"""
         default_settings = {
             "csv_output_folder": os.getcwd(),  # Default to current working directory
+            "auto_export": False,  # Regenerate exports automatically after data changes
+            "auto_export_targets": ["csv"],  # Any of "csv", "excel", "calendars", "html"
             "last_updated": datetime.datetime.now().isoformat()
         }
         
@@ -94,7 +124,11 @@ class TabelleManager:
         self.csv_file_path = os.path.join(output_folder, filename)
         
     def create_tabelle_tab(self, notebook):
-        """Create the Tabelle Management tab"""
+        """Add the Tabelle Management tab, its content is built by build_tabelle_tab
+        
+        Returns:
+            The tab frame
+        """
         # Create main frame for the tab
         tabelle_frame = self.widgets['frame'](notebook, padding="15", card_style=True)
         notebook.add(tabelle_frame, text="📊 Tabelle Management")
@@ -102,6 +136,12 @@ class TabelleManager:
         # Configure grid weights
         tabelle_frame.columnconfigure(0, weight=1)
         tabelle_frame.rowconfigure(1, weight=1)
+        self.tabelle_frame = tabelle_frame
+        return tabelle_frame
+    
+    def build_tabelle_tab(self):
+        """Create the tab content and read the CSV file - called when the tab is first opened"""
+        tabelle_frame = self.tabelle_frame
         
         # Title and controls section
         self.create_control_section(tabelle_frame)
@@ -120,6 +160,7 @@ class TabelleManager:
         self.create_current_csv_section(content_frame)
         
         # Initialize display
+        self.built = True
         self.update_displays()
         
     def create_control_section(self, parent):
@@ -176,9 +217,47 @@ class TabelleManager:
                                                  command=self.refresh_displays)
         self.refresh_btn.grid(row=0, column=2, padx=(15, 0))
         
+        # Further exports in a second row
+        # Full history export of all year files
+        self.export_history_btn = self.widgets['button'](button_frame, 
+                                                        text="🗂️ Export All Years...", 
+                                                        command=self.export_all_years)
+        self.export_history_btn.grid(row=1, column=0, padx=(0, 15), pady=(10, 0))
+        
+        # Excel workbook regenerated from the schedule data
+        self.export_excel_btn = self.widgets['button'](button_frame, 
+                                                      text="📗 Export Excel", 
+                                                      command=self.export_excel)
+        self.export_excel_btn.grid(row=1, column=1, padx=(15, 15), pady=(10, 0))
+        
+        # Calendar feeds per person
+        self.export_ics_btn = self.widgets['button'](button_frame, 
+                                                    text="📅 Export Calendars", 
+                                                    command=self.export_calendars)
+        self.export_ics_btn.grid(row=1, column=2, padx=(15, 0), pady=(10, 0))
+        
+        # Static HTML site for people without the GUI
+        self.export_html_btn = self.widgets['button'](button_frame, 
+                                                     text="🌐 Export HTML Dashboard", 
+                                                     command=self.export_dashboard)
+        self.export_html_btn.grid(row=2, column=0, padx=(0, 15), pady=(10, 0))
+        
+        # Automatic export after data changes
+        auto_frame = self.widgets['frame'](control_frame)
+        auto_frame.grid(row=3, column=0, columnspan=3, pady=(15, 0))
+        
+        self.auto_export_var = tk.BooleanVar(value=self.auto_exporter.enabled)
+        self.auto_export_check = self.widgets['checkbutton'](auto_frame, 
+                                                            text="🔄 Update exports automatically after changes", 
+                                                            variable=self.auto_export_var, 
+                                                            command=self.toggle_auto_export)
+        self.auto_export_check.grid(row=0, column=0, sticky=tk.W, padx=(0, 15))
+        self.auto_export_label = self.widgets['label'](auto_frame, text="")
+        self.auto_export_label.grid(row=0, column=1, sticky=tk.W)
+        
         # Protection info
         protection_frame = self.widgets['frame'](control_frame)
-        protection_frame.grid(row=3, column=0, columnspan=3, pady=(15, 0))
+        protection_frame.grid(row=4, column=0, columnspan=3, pady=(15, 0))
         
         protection_text = "ℹ️ Die CSV-Datei ist für Endbenutzer bestimmt und wird automatisch als schreibgeschützt erstellt."
         self.widgets['label'](protection_frame, text=protection_text, 
@@ -222,10 +301,13 @@ class TabelleManager:
         expected_scrollbar = self.widgets['scrollbar'](expected_frame, orient=tk.VERTICAL, command=self.expected_tree.yview)
         expected_scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
         self.expected_tree.configure(yscrollcommand=expected_scrollbar.set)
+        self.expected_view = VirtualTreeview(self.expected_tree, expected_scrollbar)
         
         # Configure alternating row colors with theme - same as Schedule Generation
         if self.theme:
             self.theme.configure_treeview_tags(self.expected_tree)
+        for state, config in DIFF_TAGS.items():
+            self.expected_tree.tag_configure('diff_' + state, **config)
         
     def create_current_csv_section(self, parent):
         """Create the current CSV content section"""
@@ -265,63 +347,25 @@ class TabelleManager:
         current_scrollbar = self.widgets['scrollbar'](current_frame, orient=tk.VERTICAL, command=self.current_tree.yview)
         current_scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
         self.current_tree.configure(yscrollcommand=current_scrollbar.set)
+        self.current_view = VirtualTreeview(self.current_tree, current_scrollbar)
         
         # Configure alternating row colors with theme - same as Schedule Generation
         if self.theme:
             self.theme.configure_treeview_tags(self.current_tree)
+        for state, config in DIFF_TAGS.items():
+            self.current_tree.tag_configure('diff_' + state, **config)
         
     def get_schedule_data(self):
         """Extract schedule data from the current data structure"""
         schedule_data = []
         current_year = get_current_year()
         
-        # Get all week assignments from watering history
-        week_assignments = {}
-        
-        for person in data.PEOPLE:
-            if person in data.watering_history:
-                for entry in data.watering_history[person]:
-                    if "KW" in entry:
-                        try:
-                            # Parse KW format: "2025 KW 15: person1 and person2 (ErsatzPersons: ersatz1 and ersatz2)"
-                            parts = entry.split(":")
-                            if len(parts) >= 2:
-                                week_part = parts[0].strip()
-                                match = re.search(r'(\d{4})\s*KW\s*(\d+)', week_part)
-                                if match:
-                                    year_num = int(match.group(1))
-                                    week_num = int(match.group(2))
-                                    
-                                    if week_num not in week_assignments:
-                                        week_assignments[week_num] = {
-                                            'year': year_num,
-                                            'main': [],
-                                            'ersatz': []
-                                        }
-                                    
-                                    # Add main person
-                                    if person not in week_assignments[week_num]['main']:
-                                        week_assignments[week_num]['main'].append(person)
-                                    
-                                    # Extract ErsatzPersons
-                                    if "ErsatzPersons:" in entry:
-                                        ersatz_part = entry.split("ErsatzPersons:")[1].strip()
-                                        if " and " in ersatz_part:
-                                            ersatz_persons = ersatz_part.rstrip(")").split(" and ")
-                                            for ersatz in ersatz_persons:
-                                                ersatz = ersatz.strip()
-                                                if ersatz and ersatz not in week_assignments[week_num]['ersatz']:
-                                                    week_assignments[week_num]['ersatz'].append(ersatz)
-                        except (ValueError, IndexError):
-                            continue
-        
         # Convert to schedule data format
         current_week = datetime.date.today().isocalendar()[1]
         current_date = datetime.date.today()
         
-        for week_num in sorted(week_assignments.keys()):
-            assignment = week_assignments[week_num]
-            year = assignment['year']
+        # One record per (year, week) from the shared parsed model
+        for year, week_num, main, ersatz in data.get_schedule_model().records:
             
             # Calculate date range
             try:
@@ -348,14 +392,8 @@ class TabelleManager:
                 date_range = "TBD"
                 status = "Unbekannt"
             
-            # Get persons
-            main_people = assignment['main']
-            ersatz_people = assignment['ersatz']
-            
-            person1 = main_people[0] if len(main_people) > 0 else ""
-            person2 = main_people[1] if len(main_people) > 1 else ""
-            ersatz1 = ersatz_people[0] if len(ersatz_people) > 0 else ""
-            ersatz2 = ersatz_people[1] if len(ersatz_people) > 1 else ""
+            person1, person2 = main
+            ersatz1, ersatz2 = ersatz
             
             schedule_data.append({
                 'week': f"KW {week_num}",
@@ -372,86 +410,115 @@ class TabelleManager:
     
     def update_expected_display(self):
         """Update the expected structure display"""
-        # Clear existing items
-        for item in self.expected_tree.get_children():
-            self.expected_tree.delete(item)
-        
-        # Get schedule data
-        schedule_data = self.get_schedule_data()
-        
-        # Add data to treeview
-        for i, item in enumerate(schedule_data):
+        self.expected_rows = csv_export.schedule_rows(self.get_schedule_data())
+        if self.current_csv_signature is not None:
+            # The CSV shown is complete - compare it with the new expected rows
+            self.show_csv_rows(self.current_csv_data)
+        else:
+            self.expected_view.set_rows(self.tree_rows(self.expected_rows))
+    
+    def tree_rows(self, rows, states=None):
+        """Virtual treeview rows of CSV row dicts
+        
+        Args:
+            rows: row dicts with csv_export.FIELDNAMES keys
+            states: optional {row key: 'added'/'removed'/'changed'} of csv_diff - these rows are highlighted
+        """
+        tree_rows = []
+        seen_ids = set()
+        for i, row in enumerate(rows):
             # Determine tag for styling - use theme tags
-            if item['status'] == "Aktuelle Woche":
+            status = row.get('Status', '')
+            state = states.get(csv_export.row_key(row)) if states else None
+            if state:
+                tag = 'diff_' + state
+            elif status == "Aktuelle Woche":
                 tag = 'current_week'
-            elif item['status'] == "Nächste Woche":
+            elif status == "Nächste Woche":
                 tag = 'next_week'
             else:
                 # Use alternating row colors for past/future weeks
                 tag = 'oddrow' if i % 2 == 0 else 'evenrow'
             
-            self.expected_tree.insert('', 'end', values=(
-                item['week'],
-                item['year'],
-                item['date_range'],
-                item['person1'],
-                item['person2'],
-                item['ersatz1'],
-                item['ersatz2'],
-                item['status']
-            ), tags=(tag,))
+            tree_rows.append((self.row_id(row.get('Jahr', ''), row.get('Kalenderwoche', ''), i, seen_ids), (
+                row.get('Kalenderwoche', ''),
+                row.get('Jahr', ''),
+                row.get('Datum', ''),
+                row.get('Person 1', ''),
+                row.get('Person 2', ''),
+                row.get('Ersatz 1', ''),
+                row.get('Ersatz 2', ''),
+                status
+            ), (tag,)))
+        return tree_rows
+    
+    def row_id(self, year, week, position, seen_ids):
+        """Unique Treeview iid for a schedule row, e.g. "2025-32"
+        
+        Duplicate weeks (e.g. in a hand-edited CSV) fall back to the row position.
+        """
+        week_number = re.sub(r'\D', '', str(week))
+        row_id = f"{year}-{week_number}" if week_number else f"row-{position}"
+        if row_id in seen_ids:
+            row_id = f"row-{position}"
+        seen_ids.add(row_id)
+        return row_id
     
     def update_current_csv_display(self):
         """Update the current CSV content display"""
-        # Clear existing items
-        for item in self.current_tree.get_children():
-            self.current_tree.delete(item)
-        
         # Check if CSV file exists
+        if self.csv_loader is None:
+            self.csv_loader = csv_preview.CsvPreviewLoader(self.csv_status_label)
         if not os.path.exists(self.csv_file_path):
+            self.csv_loader.cancel()
+            self.current_csv_signature = None
+            self.show_csv_rows([], complete=False)
             self.csv_status_label.config(text="📄 No CSV file found - Create one using the button above")
             return
         
-        # Try to read current CSV file
-        try:
-            with open(self.csv_file_path, 'r', encoding='utf-8-sig', newline='') as csvfile:
-                reader = csv.DictReader(csvfile)
-                rows = list(reader)
-                
-                if not rows:
-                    self.csv_status_label.config(text="📄 CSV file is empty")
-                    return
-                
-                self.csv_status_label.config(text=f"📄 CSV file loaded - {len(rows)} entries")
-                
-                # Add data to treeview
-                for i, row in enumerate(rows):
-                    # Determine tag for styling - use theme tags
-                    status = row.get('Status', '')
-                    if status == "Aktuelle Woche":
-                        tag = 'current_week'
-                    elif status == "Nächste Woche":
-                        tag = 'next_week'
-                    else:
-                        # Use alternating row colors for past/future weeks
-                        tag = 'oddrow' if i % 2 == 0 else 'evenrow'
-                    
-                    self.current_tree.insert('', 'end', values=(
-                        row.get('Kalenderwoche', ''),
-                        row.get('Jahr', ''),
-                        row.get('Datum', ''),
-                        row.get('Person 1', ''),
-                        row.get('Person 2', ''),
-                        row.get('Ersatz 1', ''),
-                        row.get('Ersatz 2', ''),
-                        status
-                    ), tags=(tag,))
-                    
-        except Exception as e:
+        signature = (self.csv_file_path, csv_export.file_signature(self.csv_file_path))
+        if signature == self.current_csv_signature:
+            return  # File unchanged since it was last shown
+        
+        # Read in the background (or take the cached rows), the view fills up chunk by chunk
+        def on_rows(rows):
+            self.show_csv_rows(rows, complete=False)
+        
+        def on_done(rows):
+            self.current_csv_signature = signature
+            self.show_csv_rows(rows)
+        
+        def on_error(e):
             self.csv_status_label.config(text=f"❌ Error reading CSV file: {str(e)}")
+        
+        self.current_csv_signature = None
+        self.csv_status_label.config(text="📄 Loading CSV file...")
+        self.csv_loader.load(self.csv_file_path, on_rows, on_done, on_error)
+    
+    def show_csv_rows(self, rows, complete=True):
+        """Show CSV row dicts in the current CSV view
+        
+        Complete rows are diffed against the expected rows and only the
+        differing rows are highlighted in both views.
+        """
+        self.current_csv_data = rows
+        self.csv_diff = csv_diff.diff_rows(self.expected_rows, rows) if complete else None
+        states = csv_diff.row_states(self.csv_diff) if self.csv_diff else None
+        self.expected_view.set_rows(self.tree_rows(self.expected_rows, states))
+        self.current_view.set_rows(self.tree_rows(rows, states))
+        
+        if not rows:
+            self.csv_status_label.config(text="📄 CSV file is empty")
+        elif not complete:
+            self.csv_status_label.config(text=f"📄 Loading CSV file... {len(rows)} entries")
+        elif csv_export.has_differences(self.csv_diff):
+            self.csv_status_label.config(text=f"📄 CSV file loaded - {len(rows)} entries - "
+                                              f"⚠️ differs from expected: {csv_diff.summary(self.csv_diff)}")
+        else:
+            self.csv_status_label.config(text=f"📄 CSV file loaded - {len(rows)} entries - ✅ matches expected")
     
     def create_update_csv(self):
-        """Create or update the CSV file"""
+        """Create or update the CSV file - only written if a row changed"""
         try:
             # Get schedule data
             schedule_data = self.get_schedule_data()
@@ -460,113 +527,211 @@ class TabelleManager:
                 messagebox.showwarning("No Data", "No schedule data available to export to CSV.")
                 return
             
-            # If file exists and is read-only, make it writable first
-            if os.path.exists(self.csv_file_path):
-                try:
-                    import stat
-                    # Make file writable if it exists
-                    os.chmod(self.csv_file_path, stat.S_IWRITE | stat.S_IREAD)
-                except Exception:
-                    pass  # Continue anyway if we can't change permissions
+            rows = csv_export.schedule_rows(schedule_data)
+            result = csv_export.export_rows(self.csv_file_path, rows)
             
-            # Create CSV file
-            with open(self.csv_file_path, 'w', encoding='utf-8-sig', newline='') as csvfile:
-                fieldnames = ['Kalenderwoche', 'Jahr', 'Datum', 'Person 1', 'Person 2', 'Ersatz 1', 'Ersatz 2', 'Status']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                # Write header
-                writer.writeheader()
-                
-                # Write data
-                for item in schedule_data:
-                    writer.writerow({
-                        'Kalenderwoche': item['week'],
-                        'Jahr': item['year'],
-                        'Datum': item['date_range'],
-                        'Person 1': item['person1'],
-                        'Person 2': item['person2'],
-                        'Ersatz 1': item['ersatz1'],
-                        'Ersatz 2': item['ersatz2'],
-                        'Status': item['status']
-                    })
-            
-            # Make file read-only for end users to prevent accidental modifications
-            try:
-                import stat
-                os.chmod(self.csv_file_path, stat.S_IREAD | stat.S_IRGRP | stat.S_IROTH)
-            except Exception:
-                # If we can't set read-only permissions, continue anyway
-                # This might happen on some systems or network drives
-                pass
-            
-            # Update displays
-            self.update_displays()
-            
-            messagebox.showinfo("Success", 
-                              f"CSV Tabelle successfully created/updated!\n\n"
-                              f"File: {self.csv_file_path}\n"
-                              f"Entries: {len(schedule_data)}\n"
-                              f"File is now read-only to prevent accidental modifications.\n"
-                              f"File can be opened with Excel or other CSV applications.")
+            # The rows just exported are the file content - no need to read it back
+            if self.csv_loader is not None:
+                self.csv_loader.cancel()
+            csv_preview.remember(self.csv_file_path, rows)
+            self.expected_rows = rows
+            self.current_csv_signature = (self.csv_file_path, csv_export.file_signature(self.csv_file_path))
+            self.show_csv_rows(rows)
+            self.update_status_labels()
             
-        except PermissionError as e:
-            # Try alternative approaches if permission denied
-            try:
-                # Try with a temporary file and rename approach
-                import tempfile
-                temp_file = self.csv_file_path + ".tmp"
-                
-                # Create temporary CSV file
-                with open(temp_file, 'w', encoding='utf-8-sig', newline='') as csvfile:
-                    fieldnames = ['Kalenderwoche', 'Jahr', 'Datum', 'Person 1', 'Person 2', 'Ersatz 1', 'Ersatz 2', 'Status']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    for item in schedule_data:
-                        writer.writerow({
-                            'Kalenderwoche': item['week'],
-                            'Jahr': item['year'],
-                            'Datum': item['date_range'],
-                            'Person 1': item['person1'],
-                            'Person 2': item['person2'],
-                            'Ersatz 1': item['ersatz1'],
-                            'Ersatz 2': item['ersatz2'],
-                            'Status': item['status']
-                        })
-                
-                # Remove old file if it exists and rename temp file
-                if os.path.exists(self.csv_file_path):
-                    # Try to make the existing file writable and remove it
-                    try:
-                        import stat
-                        os.chmod(self.csv_file_path, stat.S_IWRITE | stat.S_IREAD)
-                        os.remove(self.csv_file_path)
-                    except Exception:
-                        pass
-                
-                # Rename temp file to final name
-                os.rename(temp_file, self.csv_file_path)
-                
-                self.update_displays()
+            if result['written']:
                 messagebox.showinfo("Success", 
                                   f"CSV Tabelle successfully created/updated!\n\n"
                                   f"File: {self.csv_file_path}\n"
-                                  f"Entries: {len(schedule_data)}")
-                
-            except Exception as e2:
-                messagebox.showerror("Permission Error", 
-                                   f"Cannot write to CSV file. This may be because:\n\n"
-                                   f"1. The file is open in Excel or another application\n"
-                                   f"2. The file is read-only or locked\n"
-                                   f"3. Insufficient permissions\n\n"
-                                   f"Please try:\n"
-                                   f"• Close Excel or any applications using the file\n"
-                                   f"• Right-click the file → Properties → uncheck 'Read-only'\n"
-                                   f"• Run this application as administrator\n\n"
-                                   f"Error details: {str(e2)}")
+                                  f"Entries: {len(rows)} ({len(result['added'])} new, "
+                                  f"{len(result['changed'])} changed, {len(result['removed'])} removed)\n"
+                                  f"File is now read-only to prevent accidental modifications.\n"
+                                  f"File can be opened with Excel or other CSV applications.")
+            else:
+                messagebox.showinfo("Up to Date", 
+                                  f"CSV Tabelle is already up to date - file was not rewritten.\n\n"
+                                  f"File: {self.csv_file_path}\n"
+                                  f"Entries: {len(rows)}")
+            
+        except PermissionError as e:
+            messagebox.showerror("Permission Error", 
+                               f"Cannot write to CSV file. This may be because:\n\n"
+                               f"1. The file is open in Excel or another application\n"
+                               f"2. The file is read-only or locked\n"
+                               f"3. Insufficient permissions\n\n"
+                               f"Please try:\n"
+                               f"• Close Excel or any applications using the file\n"
+                               f"• Right-click the file → Properties → uncheck 'Read-only'\n"
+                               f"• Run this application as administrator\n\n"
+                               f"Error details: {str(e)}")
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create/update CSV file: {str(e)}")
     
+    def export_all_years(self):
+        """Export the weeks of every year file into one CSV or JSON Lines file"""
+        output_folder = self.settings.get("csv_output_folder", os.getcwd())
+        path = filedialog.asksaveasfilename(
+            title="Export All Years",
+            initialdir=output_folder,
+            initialfile="giessplan_alle_jahre.csv",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl"),
+                       ("Compressed", "*.csv.gz *.jsonl.gz"), ("All files", "*.*")])
+        if not path:
+            return
+        
+        try:
+            import history_export
+            count = history_export.export_history(path, history_export.iter_rows())
+            messagebox.showinfo("Export Complete", 
+                              f"Exported {count} weeks of all years.\n\n"
+                              f"File: {path}")
+        except PermissionError as e:
+            messagebox.showerror("Permission Error", 
+                               f"Cannot write the export file. Close it in Excel or other applications.\n\n"
+                               f"Error details: {str(e)}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export all years: {str(e)}")
+    
+    def other_year_records(self, current_year):
+        """Yield (year, records) of all year files except the loaded one
+        
+        One year file at a time - the loaded year comes from memory.
+        """
+        for year, path, is_archive in year_files.iter_year_files():
+            if year != current_year:
+                history = (year_files.read_year_file(path) or {}).get("WATERING_HISTORY", {})
+                yield year, year_files.week_records_from_history(history)
+    
+    def export_excel(self):
+        """Regenerate Gießplan.xlsx in the output folder from all year files"""
+        output_folder = self.settings.get("csv_output_folder", os.getcwd())
+        excel_path = os.path.join(output_folder, "Gießplan.xlsx")
+        
+        try:
+            rows = xlsx_writer.write_giessplan_workbook(excel_path, data.PEOPLE, data.WEIGHTS,
+                                                        data.get_schedule_model(),
+                                                        self.other_year_records(get_current_year()))
+            messagebox.showinfo("Success", 
+                              f"Excel workbook created!\n\n"
+                              f"File: {excel_path}\n"
+                              f"Weeks: {rows}")
+        except PermissionError as e:
+            messagebox.showerror("Permission Error", 
+                               f"Cannot write the Excel file. Close it in Excel and try again.\n\n"
+                               f"Error details: {str(e)}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to create Excel file: {str(e)}")
+    
+    def export_calendars(self):
+        """Write one .ics feed per person and a combined feed into the output folder"""
+        output_folder = self.settings.get("csv_output_folder", os.getcwd())
+        feed_folder = os.path.join(output_folder, ics_export.FEED_FOLDER)
+        try:
+            result = ics_export.export_feeds(data.get_schedule_model().records, data.PEOPLE, feed_folder)
+            messagebox.showinfo("Success", 
+                              f"Calendar feeds exported!\n\n"
+                              f"Folder: {feed_folder}\n"
+                              f"Updated: {len(result['written'])}, unchanged: {len(result['unchanged'])}, "
+                              f"removed: {len(result['removed'])}\n\n"
+                              f"Subscribe to or import giessplan_<Name>.ics in your calendar app.")
+        except PermissionError as e:
+            messagebox.showerror("Permission Error", 
+                               f"Cannot write the calendar files.\n\n"
+                               f"Error details: {str(e)}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export calendars: {str(e)}")
+    
+    def fairness_totals(self):
+        """Cumulative fairness of the current roster - read in the Tk thread"""
+        return {person: fairness_ledger.get_person_totals(person) for person in data.PEOPLE}
+    
+    def export_dashboard(self):
+        """Render the static HTML dashboard into the output folder"""
+        output_folder = self.settings.get("csv_output_folder", os.getcwd())
+        site_folder = os.path.join(output_folder, html_dashboard.SITE_FOLDER)
+        current_year = get_current_year()
+        try:
+            result = html_dashboard.build_site(data.get_schedule_model(), data.PEOPLE, data.WEIGHTS, current_year,
+                                               self.other_year_records(current_year), self.fairness_totals(),
+                                               site_folder)
+            messagebox.showinfo("Success", 
+                              f"HTML dashboard exported!\n\n"
+                              f"Folder: {site_folder}\n"
+                              f"Updated: {len(result['written'])}, unchanged: {len(result['unchanged'])}\n\n"
+                              f"Open index.html in a browser or share the folder.")
+        except PermissionError as e:
+            messagebox.showerror("Permission Error", 
+                               f"Cannot write the dashboard files.\n\n"
+                               f"Error details: {str(e)}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export the dashboard: {str(e)}")
+    
+    def toggle_auto_export(self):
+        """Turn the automatic export on or off and remember the choice"""
+        enabled = self.auto_export_var.get()
+        self.settings["auto_export"] = enabled
+        self.save_settings()
+        self.auto_exporter.enabled = enabled
+        if enabled:
+            self.auto_export_label.config(text="Exports are updated a few seconds after each change")
+            self.auto_exporter.notify()
+        else:
+            self.auto_exporter.cancel()
+            self.auto_export_label.config(text="")
+    
+    def auto_export_signature(self):
+        """Cheap state of everything the exports depend on - stat only, nothing is read
+
+        Every year file counts, not only the loaded one: the workbook, calendars
+        and dashboard also show the other years, and edits or bulk imports
+        there must trigger a new export too.
+        """
+        sources = [path for _, path, _ in year_files.iter_year_files()] + [fairness_ledger.LEDGER_FILE]
+        return (data.FILE_PATH, [(path, csv_export.file_signature(path)) for path in sources],
+                self.settings.get("csv_output_folder", os.getcwd()),
+                tuple(self.settings.get("auto_export_targets", ["csv"])),
+                datetime.date.today().isocalendar()[:2])  # Status column changes every week
+    
+    def prepare_auto_export(self):
+        """Snapshot the data in the Tk thread and return the export jobs for the worker"""
+        self.update_csv_file_path()
+        targets = self.settings.get("auto_export_targets", ["csv"])
+        output_folder = self.settings.get("csv_output_folder", os.getcwd())
+        model = data.get_schedule_model()
+        people = list(data.PEOPLE)
+        weights = list(data.WEIGHTS)
+        current_year = get_current_year()
+        jobs = []
+        
+        if "csv" in targets:
+            csv_path = self.csv_file_path
+            rows = csv_export.schedule_rows(self.get_schedule_data())
+            if rows:
+                jobs.append(("CSV", lambda: csv_export.export_rows(csv_path, rows)))
+        if "excel" in targets:
+            excel_path = os.path.join(output_folder, "Gießplan.xlsx")
+            jobs.append(("Excel", lambda: xlsx_writer.write_giessplan_workbook(
+                excel_path, people, weights, model, self.other_year_records(current_year))))
+        if "calendars" in targets:
+            feed_folder = os.path.join(output_folder, ics_export.FEED_FOLDER)
+            jobs.append(("Calendars", lambda: ics_export.export_feeds(model.records, people, feed_folder)))
+        if "html" in targets:
+            site_folder = os.path.join(output_folder, html_dashboard.SITE_FOLDER)
+            totals = self.fairness_totals()
+            jobs.append(("Dashboard", lambda: html_dashboard.build_site(
+                model, people, weights, current_year, self.other_year_records(current_year), totals, site_folder)))
+        return jobs
+    
+    def show_auto_export_status(self, text, finished=False):
+        print(text)
+        if not self.built:
+            return
+        self.auto_export_label.config(text=text)
+        if finished:
+            self.update_displays()  # Show the regenerated CSV
+    
     def open_csv_file(self):
         """Open the CSV file in the default application"""
         if not os.path.exists(self.csv_file_path):
@@ -587,6 +752,8 @@ class TabelleManager:
     
     def update_displays(self):
         """Update all displays"""
+        if not self.built:
+            return  # Nothing to show before the tab was opened
         self.update_expected_display()
         self.update_current_csv_display()
         self.update_status_labels()
@@ -6,9 +6,22 @@ This module provides color schemes and styling configurations
 specifically designed for the Red Cross Institute environment.
 """
 
+import weakref
 import tkinter as tk
 from tkinter import ttk
 
+# Style tables per (modern_theme, light_mode), computed once per process
+_style_tables = {}
+
+# Widgets restyled on a theme switch - replaces walking the whole widget tree
+_styled_widgets = weakref.WeakSet()
+_themed_canvases = weakref.WeakSet()
+_themed_treeviews = weakref.WeakSet()
+_themed_text_widgets = weakref.WeakSet()
+
+# Attributes set by the style methods besides the ttk styles
+TABLE_ATTRIBUTES = ('schedule_treeview_tags', 'text_widget_config', 'canvas_config', 'canvas_fonts')
+
 # Red Cross Institute Color Palette
 class RKIColors:
     """Color palette inspired by Red Cross Institute branding"""
@@ -153,12 +166,11 @@ class RKITheme:
         mode_text = "Light" if self.light_mode else ("Modern Dark" if self.modern_theme else "Classic")
         print(f"🎨 Applying theme - {mode_text}")
         self._configure_root()
-        if self.modern_theme:
-            print("🌙 Configuring modern dark theme...")
-            self._configure_modern_styles()
-        else:
-            print("☀️ Configuring classic theme...")
-            self._configure_ttk_styles()
+        self._use_base_theme()
+        table = get_style_table(self.root, self.modern_theme, self.light_mode)
+        apply_style_table(self.style, table['styles'])
+        for name, value in table['attributes'].items():
+            setattr(self, name, value)
         self._configure_canvas_styles()
         self._configure_invisible_selection()
         print("✅ Theme configuration complete")
@@ -172,6 +184,18 @@ class RKITheme:
         else:
             self.root.configure(bg=self.colors.BACKGROUND_GRAY)
             
+    def _use_base_theme(self):
+        """Switch to 'clam' once - later switches only reconfigure the RKI styles"""
+        current = self.style.theme_use()
+        if current == 'clam':
+            return
+        for theme_name in ('clam', 'alt', 'default'):
+            try:
+                self.style.theme_use(theme_name)
+                return
+            except tk.TclError:
+                continue
+
     def _configure_modern_styles(self):
         """Configure modern dark theme styles"""
         
@@ -179,42 +203,6 @@ class RKITheme:
         universal_bg = self.colors.LIGHT_BACKGROUND if self.light_mode else self.colors.CARD_BACKGROUND
         universal_field_bg = self.colors.LIGHT_BACKGROUND if self.light_mode else self.colors.CARD_BACKGROUND
         
-        # AGGRESSIVE STYLE RESET
-        # Clear any existing styles first by switching themes multiple times
-        available_themes = self.style.theme_names()
-        for theme_name in available_themes:
-            try:
-                self.style.theme_use(theme_name)
-            except:
-                continue
-        
-        # Now set our base theme
-        try:
-            self.style.theme_use('clam')
-        except:
-            try:
-                self.style.theme_use('alt')
-            except:
-                self.style.theme_use('default')
-        
-        # Force clear all existing RKI styles
-        rki_styles = [
-            'RKI.TFrame', 'RKI.Card.TFrame', 'RKI.Title.TLabel', 'RKI.Heading.TLabel',
-            'RKI.TLabel', 'RKI.Card.TLabel', 'RKI.Status.TLabel', 'RKI.TButton',
-            'RKI.Primary.TButton', 'RKI.Success.TButton', 'RKI.TNotebook',
-            'RKI.TNotebook.Tab', 'RKI.TEntry', 'RKI.TCombobox', 'RKI.TLabelframe',
-            'RKI.TLabelframe.Label', 'RKI.Treeview', 'RKI.Treeview.Heading',
-            'RKI.Vertical.TScrollbar', 'RKI.TSeparator', 'RKI.TCheckbutton'
-        ]
-        
-        for style_name in rki_styles:
-            try:
-                # Configure with empty dictionary to clear
-                self.style.configure(style_name, **{})
-                self.style.map(style_name, **{})
-            except:
-                pass
-        
         # Configure main frame style with consistent background
         frame_bg = self.colors.LIGHT_BACKGROUND if self.light_mode else self.colors.DARK_BACKGROUND
         self.style.configure('RKI.TFrame', 
@@ -511,12 +499,6 @@ class RKITheme:
     def _configure_ttk_styles(self):
         """Configure TTK widget styles"""
         
-        # Use a modern theme as base
-        try:
-            self.style.theme_use('clam')
-        except:
-            self.style.theme_use('default')
-        
         # Configure main frame style
         self.style.configure('RKI.TFrame', 
                            background=self.colors.BACKGROUND_GRAY,
@@ -732,17 +714,20 @@ class RKITheme:
     
     def configure_treeview_tags(self, treeview):
         """Configure treeview tags for schedule display"""
+        _themed_treeviews.add(treeview)
         if hasattr(self, 'schedule_treeview_tags'):
             for tag, config in self.schedule_treeview_tags.items():
                 treeview.tag_configure(tag, **config)
     
     def configure_text_widget(self, text_widget):
         """Configure a text widget with modern styling"""
+        _themed_text_widgets.add(text_widget)
         if hasattr(self, 'text_widget_config'):
             text_widget.configure(**self.text_widget_config)
     
     def configure_canvas(self, canvas):
         """Configure a canvas with modern styling"""
+        _themed_canvases.add(canvas)
         # Use appropriate background based on light mode
         if self.light_mode:
             canvas_bg = self.colors.LIGHT_BACKGROUND  # White background for light mode
@@ -783,6 +768,80 @@ class RKITheme:
         
         print(f"   ✓ Invisible selection: {selection_bg} on {selection_fg}")
 
+class _StyleRecorder:
+    """Stands in for ttk.Style while the style methods run, collecting their calls"""
+    
+    def __init__(self):
+        self.styles = {}
+    
+    def configure(self, style_name, **options):
+        self.styles.setdefault(style_name, {'configure': {}, 'map': {}})['configure'].update(options)
+    
+    def map(self, style_name, **options):
+        self.styles.setdefault(style_name, {'configure': {}, 'map': {}})['map'].update(options)
+
+def _record_style_table(root, modern_theme, light_mode):
+    theme = RKITheme(root, modern_theme=modern_theme, light_mode=light_mode)
+    theme.style = _StyleRecorder()
+    if modern_theme:
+        theme._configure_modern_styles()
+    else:
+        theme._configure_ttk_styles()
+    attributes = {name: getattr(theme, name) for name in TABLE_ATTRIBUTES if hasattr(theme, name)}
+    return {'styles': theme.style.styles, 'attributes': attributes}
+
+def get_style_table(root, modern_theme=True, light_mode=False):
+    """Cached style configuration of a mode
+    
+    The first call for the modern theme computes the dark and the light table,
+    so toggling later only applies a ready table.
+    
+    Returns:
+        dict: 'styles' {style name: {'configure': options, 'map': state maps}}
+              and 'attributes' (treeview tags, text/canvas configuration)
+    """
+    key = (modern_theme, light_mode)
+    if key not in _style_tables:
+        modes = [(True, False), (True, True)] if modern_theme else [key]
+        for mode in modes:
+            if mode not in _style_tables:
+                _style_tables[mode] = _record_style_table(root, *mode)
+    return _style_tables[key]
+
+def apply_style_table(style, styles):
+    """Apply a cached style table on the active ttk theme"""
+    for style_name, options in styles.items():
+        if options['configure']:
+            style.configure(style_name, **options['configure'])
+        if options['map']:
+            style.map(style_name, **options['map'])
+
+def refresh_registered_widgets(theme):
+    """Re-apply styling to the widgets created through the factories or theme helpers"""
+    for canvas in list(_themed_canvases):
+        if canvas.winfo_exists():
+            theme.configure_canvas(canvas)
+    for treeview in list(_themed_treeviews):
+        if treeview.winfo_exists():
+            theme.configure_treeview_tags(treeview)
+    for text_widget in list(_themed_text_widgets):
+        if text_widget.winfo_exists():
+            theme.configure_text_widget(text_widget)
+    for widget in list(_styled_widgets):
+        try:
+            if widget.winfo_exists():
+                widget.configure(style=widget.cget('style'))
+        except tk.TclError:
+            pass
+
+def _tracked(factory):
+    """Register every widget a factory creates for refresh_registered_widgets"""
+    def create(*args, **kwargs):
+        widget = factory(*args, **kwargs)
+        _styled_widgets.add(widget)
+        return widget
+    return create
+
 def create_styled_widgets(modern_theme=True, light_mode=False):
     """Factory functions for creating styled widgets"""
     
@@ -872,7 +931,7 @@ def create_styled_widgets(modern_theme=True, light_mode=False):
     def create_checkbutton(parent, text="", **kwargs):
         return ttk.Checkbutton(parent, text=text, style='RKI.TCheckbutton', **kwargs)
     
-    return {
+    factories = {
         'title_label': create_title_label,
         'heading_label': create_heading_label,
         'label': create_label,
@@ -891,73 +950,30 @@ def create_styled_widgets(modern_theme=True, light_mode=False):
         'separator': create_separator,
         'checkbutton': create_checkbutton
     }
+    return {name: _tracked(factory) for name, factory in factories.items()}
 
 def apply_rki_theme_to_app(root, modern_theme=True, light_mode=False):
-    """Apply Red Cross Institute theme to the entire application"""
+    """Apply Red Cross Institute theme to the entire application
     
+    Stays on the 'clam' theme and applies the cached style table of the
+    requested mode, then restyles only the registered widgets.
+    """
     mode_text = "LIGHT MODE" if light_mode else "DARK MODE"
-    print(f"🔄 FORCE APPLYING {mode_text}...")
+    print(f"🔄 Applying {mode_text}...")
     
-    # NUCLEAR OPTION: Complete TTK reset
-    try:
-        # Get fresh style instance
-        style = ttk.Style()
-        
-        # Cycle through ALL themes to clear any cached configurations
-        for theme_name in style.theme_names():
-            try:
-                style.theme_use(theme_name)
-                root.update_idletasks()  # Force refresh
-            except:
-                pass
-        
-        # Set base theme
-        style.theme_use('clam')
-        root.update_idletasks()
-        
-        print("✅ TTK style cache cleared")
-        
-        # Delete the old style object and create fresh one in theme
-        del style
-        
-    except Exception as e:
-        print(f"⚠️  Style reset warning: {e}")
-    
-    # Apply our theme
     theme = RKITheme(root, modern_theme=modern_theme, light_mode=light_mode)
     theme.apply_theme()
     widget_factory = create_styled_widgets(modern_theme=modern_theme, light_mode=light_mode)
     
-    # FORCE IMMEDIATE APPLICATION
     try:
         # Use appropriate background color based on theme mode
         bg_color = theme.colors.LIGHT_BACKGROUND if light_mode else theme.colors.DARK_BACKGROUND
         root.configure(bg=bg_color)
-        root.update()
-        root.update_idletasks()
-        
-        # Force style refresh on all existing widgets
-        def refresh_widget_styles(widget):
-            try:
-                if hasattr(widget, 'configure'):
-                    # Try to force style refresh
-                    if hasattr(widget, 'cget') and 'style' in str(widget.configure()):
-                        current_style = widget.cget('style') if widget.cget('style') else ''
-                        if current_style and 'RKI' in current_style:
-                            widget.configure(style=current_style)
-                
-                # Recursively refresh children
-                for child in widget.winfo_children():
-                    refresh_widget_styles(child)
-            except:
-                pass
-        
-        root.after_idle(lambda: refresh_widget_styles(root))
-        
+        root.after_idle(lambda: refresh_registered_widgets(theme))
     except Exception as e:
         print(f"⚠️  Force refresh warning: {e}")
     
-    print("✅ MODERN THEME FORCE APPLIED")
+    print("✅ MODERN THEME APPLIED")
     return theme, widget_factory
 
 # Example usage and theme preview
@@ -0,0 +1,202 @@
+"""
+Virtual list rendering for ttk.Treeview
+
+The treeviews used to delete and re-insert every row on each refresh. A
+VirtualTreeview keeps the rows in a plain Python list and only creates
+Treeview items for the rows in the viewport plus a small buffer. The
+scrollbar is driven by the model, so a refresh costs the same for 50 or
+50,000 rows.
+
+set_rows compares the new rows with the previous ones by iid, so only
+inserted, changed or removed rows touch the Treeview. The top row and the
+selection are kept across refreshes.
+
+Usage:
+    people_view = VirtualTreeview(people_tree, people_scrollbar)
+    people_view.set_rows([(iid, values, tags), ...])
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+HEADING_HEIGHT = 25
+DEFAULT_ROW_HEIGHT = 20
+
+class VirtualTreeview:
+    def __init__(self, tree, scrollbar=None, buffer=20):
+        """Attach to an existing Treeview and its vertical scrollbar
+
+        Args:
+            tree: the ttk.Treeview to render into
+            scrollbar: vertical scrollbar, its command is taken over
+            buffer: rows materialized above and below the viewport
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.buffer = buffer
+        self.rows = []
+        self.index = {}
+        self.first = 0
+        self.window = (0, 0)
+        self.selected = set()
+
+        if scrollbar is not None:
+            scrollbar.configure(command=self.yview)
+        tree.configure(yscrollcommand=self._on_tree_scroll)
+        tree.bind('<MouseWheel>', self._on_mousewheel)
+        tree.bind('<Button-4>', self._on_mousewheel)
+        tree.bind('<Button-5>', self._on_mousewheel)
+        tree.bind('<Configure>', lambda event: self.render(), add='+')
+        tree.bind('<<TreeviewSelect>>', self._on_select, add='+')
+
+    def visible_rows(self):
+        """Number of rows that fit into the Treeview right now"""
+        height = self.tree.winfo_height()
+        if height <= 1:
+            # Not mapped yet - use the configured height
+            return max(1, int(self.tree.cget('height')))
+        style = self.tree.cget('style') or 'Treeview'
+        try:
+            row_height = int(ttk.Style().lookup(style, 'rowheight') or DEFAULT_ROW_HEIGHT)
+        except (tk.TclError, ValueError):
+            row_height = DEFAULT_ROW_HEIGHT
+        return max(1, (height - HEADING_HEIGHT) // row_height)
+
+    def set_rows(self, rows):
+        """Replace the model and apply only the differences to the Treeview
+
+        Args:
+            rows: list of (iid, values, tags) - iids must be unique strings
+
+        Returns:
+            dict: iids that were 'added', 'changed' and 'removed'
+        """
+        previous = {iid: (tuple(values), tuple(tags)) for iid, values, tags in self.rows}
+        top_iid = self.rows[self.first][0] if self.first < len(self.rows) else None
+
+        self.rows = [(iid, tuple(values), tuple(tags)) for iid, values, tags in rows]
+        self.index = {row[0]: position for position, row in enumerate(self.rows)}
+
+        added = []
+        changed = set()
+        for iid, values, tags in self.rows:
+            if iid not in previous:
+                added.append(iid)
+            elif previous[iid] != (values, tags):
+                changed.add(iid)
+        removed = [iid for iid in previous if iid not in self.index]
+
+        # Keep the same row at the top of the viewport
+        if top_iid in self.index:
+            self.first = self.index[top_iid]
+        self.selected.difference_update(removed)
+
+        self.render(force=True, changed=changed)
+        return {'added': added, 'changed': sorted(changed), 'removed': removed}
+
+    def row_values(self, iid):
+        """Values of a model row, also for rows that are not materialized"""
+        position = self.index.get(iid)
+        return self.rows[position][1] if position is not None else None
+
+    def see(self, iid):
+        """Scroll the model so that a row is visible"""
+        position = self.index.get(iid)
+        if position is None:
+            return
+        visible = self.visible_rows()
+        if position < self.first or position >= self.first + visible:
+            self.first = max(0, position - visible // 2)
+            self.render()
+
+    def render(self, force=False, changed=()):
+        """Materialize the rows around the viewport and position the Treeview"""
+        total = len(self.rows)
+        visible = self.visible_rows()
+        self.first = max(0, min(self.first, total - visible))
+
+        start, end = self.window
+        if force or self.first < start or min(total, self.first + visible) > end or end > total:
+            start = max(0, self.first - self.buffer)
+            end = min(total, self.first + visible + self.buffer)
+            self._materialize(start, end, changed)
+
+        if end > start:
+            self.tree.yview_moveto((self.first - start) / (end - start))
+        if self.scrollbar is not None:
+            if total:
+                self.scrollbar.set(self.first / total, min(1.0, (self.first + visible) / total))
+            else:
+                self.scrollbar.set(0.0, 1.0)
+
+    def _materialize(self, start, end, changed=()):
+        """Make the Treeview hold exactly the model rows start..end, in order
+
+        Existing items are only touched if their values changed or they moved.
+        """
+        window_rows = self.rows[start:end]
+        wanted = {row[0] for row in window_rows}
+        current = list(self.tree.get_children())
+        stale = [iid for iid in current if iid not in wanted]
+        if stale:
+            self.tree.delete(*stale)
+            current = [iid for iid in current if iid in wanted]
+        existing = set(current)
+
+        for position, (iid, values, tags) in enumerate(window_rows):
+            if iid in existing:
+                if iid in changed:
+                    self.tree.item(iid, values=values, tags=tags)
+                if position >= len(current) or current[position] != iid:
+                    self.tree.move(iid, '', position)
+                    current.remove(iid)
+                    current.insert(position, iid)
+            else:
+                self.tree.insert('', position, iid=iid, values=values, tags=tags)
+                current.insert(position, iid)
+        self.window = (start, end)
+
+        # Restore the selection of rows that scrolled back into the window
+        selection = [iid for iid in current if iid in self.selected]
+        if set(selection) != set(self.tree.selection()):
+            self.tree.selection_set(selection)
+
+    def _on_select(self, event=None):
+        """Remember selected rows, including those outside the materialized window"""
+        start, end = self.window
+        materialized = {row[0] for row in self.rows[start:end]}
+        self.selected = (self.selected - materialized) | set(self.tree.selection())
+
+    def yview(self, *args):
+        """Scrollbar command mapped to model rows"""
+        total = len(self.rows)
+        if not args or not total:
+            return
+        if args[0] == 'moveto':
+            self.first = int(float(args[1]) * total)
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if len(args) > 2 and args[2] == 'pages':
+                amount *= self.visible_rows()
+            self.first += amount
+        self.render()
+
+    def _on_tree_scroll(self, low, high):
+        """Follow scrolling done by the Treeview itself (keyboard navigation)"""
+        start, end = self.window
+        if end <= start:
+            return
+        top = start + round(float(low) * (end - start))
+        if top != self.first:
+            self.first = top
+            self.tree.after_idle(self.render)
+
+    def _on_mousewheel(self, event):
+        if getattr(event, 'num', None) == 4:
+            step = -3
+        elif getattr(event, 'num', None) == 5:
+            step = 3
+        else:
+            step = -3 if event.delta > 0 else 3
+        self.yview('scroll', step, 'units')
+        return "break"
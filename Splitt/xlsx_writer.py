@@ -0,0 +1,246 @@
+"""
+Streaming XLSX writer (standard library only)
+
+Writes a workbook as zipfile + XML without openpyxl. Each sheet is
+streamed row by row into its zip member, strings are stored inline (no
+shared string table) and nothing of an existing workbook is read, so
+memory stays constant and export time only depends on the rows written.
+Sheets are regenerated from the source data on every export instead of
+being appended to.
+
+Usage:
+    with XlsxWriter("Gießplan.xlsx") as workbook:
+        workbook.add_sheet("Statistics", rows, header=["Name", "Watering Count"])
+
+write_giessplan_workbook() builds the Statistics and per-year Schedule
+sheets from the parsed schedule model.
+"""
+
+import os
+import re
+import zipfile
+import tempfile
+from xml.sax.saxutils import escape
+
+import year_files
+
+FLUSH_ROWS = 500
+MAX_SHEET_NAME = 31
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+_INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '{sheets}'
+    '</Types>')
+
+ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>')
+
+STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>')
+
+SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetData>')
+SHEET_END = '</sheetData></worksheet>'
+
+def column_letter(index):
+    """Excel column name of a 0-based column index (0 -> A, 26 -> AA)"""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+def _cell_xml(reference, value, style):
+    style_attr = f' s="{style}"' if style else ''
+    if value is None or value == "":
+        return ""
+    if isinstance(value, bool):
+        return f'<c r="{reference}" t="b"{style_attr}><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{reference}"{style_attr}><v>{value}</v></c>'
+    text = escape(_INVALID_XML_CHARS.sub('', str(value)))
+    return f'<c r="{reference}" t="inlineStr"{style_attr}><is><t xml:space="preserve">{text}</t></is></c>'
+
+def _row_xml(row_number, values, style=0):
+    cells = "".join(_cell_xml(f"{column_letter(column)}{row_number}", value, style)
+                    for column, value in enumerate(values))
+    return f'<row r="{row_number}">{cells}</row>'
+
+def sheet_title(name, used):
+    """Valid, unique sheet name (max 31 chars, no []:*?/\\)"""
+    title = _INVALID_SHEET_CHARS.sub('_', str(name)).strip("'")[:MAX_SHEET_NAME] or "Sheet"
+    candidate, number = title, 2
+    while candidate.lower() in used:
+        suffix = f" ({number})"
+        candidate = title[:MAX_SHEET_NAME - len(suffix)] + suffix
+        number += 1
+    used.add(candidate.lower())
+    return candidate
+
+class XlsxWriter:
+    def __init__(self, path):
+        """Start a new workbook - written to a temporary file until close()"""
+        self.path = path
+        self.sheets = []
+        self._used_titles = set()
+        folder = os.path.dirname(os.path.abspath(path))
+        fd, self._temp_path = tempfile.mkstemp(prefix=".tmp_", suffix=".xlsx", dir=folder)
+        os.close(fd)
+        self._zip = zipfile.ZipFile(self._temp_path, 'w', zipfile.ZIP_DEFLATED)
+
+    def add_sheet(self, name, rows, header=None):
+        """Stream one sheet
+
+        Args:
+            name: sheet name (made valid and unique)
+            rows: iterable of row sequences (str, int, float, bool or None)
+            header: optional first row, written bold
+
+        Returns:
+            int: number of data rows written
+        """
+        title = sheet_title(name, self._used_titles)
+        number = len(self.sheets) + 1
+        count = 0
+        with self._zip.open(f"xl/worksheets/sheet{number}.xml", 'w', force_zip64=True) as member:
+            member.write(SHEET_START.encode('utf-8'))
+            row_number = 0
+            if header:
+                row_number += 1
+                member.write(_row_xml(row_number, header, style=1).encode('utf-8'))
+            buffer = []
+            for values in rows:
+                row_number += 1
+                count += 1
+                buffer.append(_row_xml(row_number, values))
+                if len(buffer) >= FLUSH_ROWS:
+                    member.write("".join(buffer).encode('utf-8'))
+                    buffer = []
+            member.write(("".join(buffer) + SHEET_END).encode('utf-8'))
+        self.sheets.append(title)
+        return count
+
+    def close(self):
+        """Write the workbook parts and move the file into place"""
+        if self._zip is None:
+            return
+        try:
+            if not self.sheets:
+                self.add_sheet("Sheet1", [])
+            sheet_types = "".join(
+                f'<Override PartName="/xl/worksheets/sheet{number}.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                for number in range(1, len(self.sheets) + 1))
+            sheet_entries = "".join(
+                f'<sheet name="{escape(title, {chr(34): "&quot;"})}" sheetId="{number}" r:id="rId{number}"/>'
+                for number, title in enumerate(self.sheets, 1))
+            sheet_rels = "".join(
+                f'<Relationship Id="rId{number}" '
+                'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+                f'Target="worksheets/sheet{number}.xml"/>'
+                for number in range(1, len(self.sheets) + 1))
+            styles_id = len(self.sheets) + 1
+
+            self._zip.writestr("[Content_Types].xml", CONTENT_TYPES_XML.format(sheets=sheet_types))
+            self._zip.writestr("_rels/.rels", ROOT_RELS_XML)
+            self._zip.writestr("xl/workbook.xml",
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+                f'<sheets>{sheet_entries}</sheets></workbook>')
+            self._zip.writestr("xl/_rels/workbook.xml.rels",
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                f'{sheet_rels}<Relationship Id="rId{styles_id}" '
+                'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+                'Target="styles.xml"/></Relationships>')
+            self._zip.writestr("xl/styles.xml", STYLES_XML)
+            self._zip.close()
+            self._zip = None
+            year_files.replace_file(self._temp_path, self.path, public=True)
+        except Exception:
+            self.abort()
+            raise
+
+    def abort(self):
+        """Discard the workbook, the existing file stays untouched"""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+def write_giessplan_workbook(path, people, weights, model, other_years=()):
+    """Regenerate the Gießplan workbook from source data
+
+    Args:
+        path: target .xlsx file
+        people, weights: current roster and weights (Statistics sheet)
+        model: ScheduleModel of the loaded year
+        other_years: optional (year, records) pairs of further year files, sorted by year
+
+    Returns:
+        int: number of schedule rows written
+    """
+    def schedule_rows(records):
+        for year, week, main, ersatz in records:
+            yield [f"KW {week}", main[0], main[1], ersatz[0], ersatz[1]]
+
+    def statistics_rows():
+        for index, person in enumerate(people):
+            weight = weights[index] if index < len(weights) else None
+            yield [person, len(model.person_records(person, 'main')),
+                   len(model.person_records(person, 'ersatz')), weight]
+
+    schedule_header = ["Week", "Person 1", "Person 2", "Ersatz 1", "Ersatz 2"]
+    written = 0
+    with XlsxWriter(path) as workbook:
+        workbook.add_sheet("Statistics", statistics_rows(),
+                           header=["Name", "Watering Count", "Ersatz Count", "Weight"])
+        # Years of the loaded model win over other files; other_years may be a
+        # generator reading one file at a time, sheets stay sorted by year
+        model_years = model.years()
+        for year, records in other_years:
+            while model_years and model_years[0] <= year:
+                model_year = model_years.pop(0)
+                written += workbook.add_sheet(f"Schedule {model_year}", schedule_rows(model.year_records(model_year)),
+                                              header=schedule_header)
+            if year not in model.by_year:
+                written += workbook.add_sheet(f"Schedule {year}", schedule_rows(records), header=schedule_header)
+        for model_year in model_years:
+            written += workbook.add_sheet(f"Schedule {model_year}", schedule_rows(model.year_records(model_year)),
+                                          header=schedule_header)
+    return written
@@ -0,0 +1,170 @@
+"""
+Year file helpers for the Gießplan data files
+
+Low-level functions to find, read and write people_{year}.json files
+without touching the data loaded in data.py. Modules that work across
+years (analytics, exports, ledger) use these so they can stream one
+file at a time.
+"""
+
+import os
+import re
+import stat
+import json
+import hashlib
+import datetime
+import tempfile
+
+YEAR_FILE_PATTERN = re.compile(r'^people_(\d{4})\.json$')
+ARCHIVE_FOLDER = "backups"
+
+# Read once at import, os.umask can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def parse_week_entry(entry):
+    """Parse a history entry into its parts
+
+    Example entry: "2025 KW 30: Jan and Jeff (ErsatzPersons: Rosa and Alexander)"
+
+    Returns:
+        tuple: (year, week, [person1, person2], [ersatz_person1, ersatz_person2]) or None if not a KW entry
+    """
+    match = re.match(r'^(\d{4})\s*KW\s*(\d+):\s*(.*)$', entry.strip()) if isinstance(entry, str) else None
+    if not match:
+        return None
+
+    year, week, rest = int(match.group(1)), int(match.group(2)), match.group(3)
+    ersatz_part = ""
+    if "(ErsatzPersons:" in rest:
+        rest, _, ersatz_part = rest.partition("(ErsatzPersons:")
+        ersatz_part = ersatz_part.strip().rstrip(")")
+
+    person1, _, person2 = rest.strip().partition(" and ")
+    ersatz_person1, _, ersatz_person2 = ersatz_part.partition(" and ")
+    return (year, week,
+            [person1.strip(), person2.strip()],
+            [ersatz_person1.strip(), ersatz_person2.strip()])
+
+def format_week_entry(year, week, person1, person2, ersatz_person1="", ersatz_person2=""):
+    """Build a history entry in the same format as data.update_week_data_with_ersatz"""
+    if ersatz_person1 or ersatz_person2:
+        return f"{year} KW {week}: {person1} and {person2} (ErsatzPersons: {ersatz_person1} and {ersatz_person2})"
+    return f"{year} KW {week}: {person1} and {person2}"
+
+def week_start_date(year, week):
+    """Monday of an ISO calendar week (clamped to the last week of the year)"""
+    try:
+        return datetime.date.fromisocalendar(year, week, 1)
+    except ValueError:
+        last_week = datetime.date(year, 12, 28).isocalendar()[1]
+        return datetime.date.fromisocalendar(year, min(max(week, 1), last_week), 1)
+
+def week_ordinal(year, week):
+    """Continuous week number across years, used to measure gaps between weeks"""
+    return week_start_date(year, week).toordinal() // 7
+
+def iter_year_files(folder=".", include_archives=True):
+    """Yield (year, path, is_archive) for every year file, oldest year first
+
+    Live files in the data folder win over copies of the same year found in
+    migration packages below the backups folder.
+    """
+    found = {}
+    try:
+        for name in os.listdir(folder):
+            match = YEAR_FILE_PATTERN.match(name)
+            if match:
+                found[int(match.group(1))] = (os.path.join(folder, name), False)
+    except OSError as e:
+        print(f"Error listing year files in {folder}: {e}")
+
+    archive_root = os.path.join(folder, ARCHIVE_FOLDER)
+    if include_archives and os.path.isdir(archive_root):
+        # Newest package first so the most recent archived copy of a year wins
+        for package in sorted(os.listdir(archive_root), reverse=True):
+            package_dir = os.path.join(archive_root, package)
+            if not os.path.isdir(package_dir):
+                continue
+            for name in os.listdir(package_dir):
+                match = YEAR_FILE_PATTERN.match(name)
+                if match and int(match.group(1)) not in found:
+                    found[int(match.group(1))] = (os.path.join(package_dir, name), True)
+
+    for year in sorted(found):
+        path, is_archive = found[year]
+        yield year, path, is_archive
+
+def read_year_file(path):
+    """Read one year file, returns the parsed JSON or None if unreadable"""
+    try:
+        with open(path, "r", encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError) as e:
+        print(f"Error reading {path}: {e}")
+        return None
+
+def week_records_from_history(history):
+    """Deduplicate the per-person history into one record per (year, week)
+
+    Returns:
+        list: (year, week, [person1, person2], [ersatz_person1, ersatz_person2]) sorted by (year, week)
+    """
+    records = {}
+    for entries in history.values():
+        if not isinstance(entries, list):
+            continue
+        for entry in entries:
+            parsed = parse_week_entry(entry)
+            if parsed and (parsed[0], parsed[1]) not in records:
+                records[(parsed[0], parsed[1])] = parsed
+    return [records[key] for key in sorted(records)]
+
+def file_hash(path, chunk_size=65536):
+    """SHA-1 of a file's content, read in chunks"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def replace_file(temp_path, path, public=False):
+    """Move a finished temporary file into place
+
+    mkstemp creates owner-only files. Exports on the share (public=True:
+    CSV, calendars, dashboard, their manifests) are made readable for
+    everyone; data files keep the mode of the file they replace, or get
+    the mode a plain open() would give them.
+    """
+    try:
+        if public:
+            mode = 0o644
+        elif os.path.exists(path):
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        else:
+            mode = 0o666 & ~_UMASK
+        os.chmod(temp_path, mode)
+    except OSError:
+        pass  # Some network drives do not support permissions
+    os.replace(temp_path, path)
+
+def atomic_write_text(path, text, encoding='utf-8', newline=None, public=False):
+    """Write a text file through a temporary file and os.replace (see replace_file)"""
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp_", dir=folder)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding, newline=newline) as file:
+            file.write(text)
+        replace_file(temp_path, path, public)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def atomic_write_json(path, obj, compact=False, public=False):
+    """Write JSON atomically - compact files skip indentation and spaces"""
+    if compact:
+        text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+    else:
+        text = json.dumps(obj, ensure_ascii=False, indent=2)
+    atomic_write_text(path, text, public=public)
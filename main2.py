@@ -1,11 +1,15 @@
 import tkinter as tk
 from tkinter import messagebox
 import random
-import openpyxl
 import json
 import os
+import sys
 import datetime
 
+# The streaming XLSX writer lives in the Splitt application
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Splitt"))
+import xlsx_writer
+
 # Define the file path for storing names
 FILE_PATH = "people.json"
 
@@ -103,7 +107,7 @@ def generate_schedule():
             watering_history["last_year"] = current_year
 
             # Create a new table in the Excel file for the new year
-            save_to_excel([], PEOPLE, watering_history, new_year=True)
+            save_to_excel(PEOPLE, watering_history, new_year=True)
 
         # Adjust weights based on selection intervals
         adjusted_weights = [WEIGHTS[i] / (1 + selection_count[PEOPLE[i]]) for i in range(len(PEOPLE))]
@@ -119,7 +123,7 @@ def generate_schedule():
 
         # Stop at week 52 and create a new table for the next year
         if week > max_week:
-            save_to_excel(schedule, PEOPLE, watering_history)
+            save_to_excel(PEOPLE, watering_history)
             schedule = []
 
     # Save updated watering history to JSON file
@@ -132,90 +136,94 @@ def show_schedule():
     schedule = generate_schedule()
     result = "\n".join(schedule)
     save_to_excel(
-        schedule,
         PEOPLE,
         watering_history
     )
     messagebox.showinfo("Gießplan", result)
 
-# Modify save_to_excel to handle cases where schedule entries are not properly formatted
+# Build the schedule rows of one history: entries are "Week 5" (generated) or
+# "Week 5: Anna and Ben" / "Date 24.12.: Anna and Ben" (added manually)
+def schedule_rows_from_history(history):
+    assignments = {}
+    for person, entries in history.items():
+        if not isinstance(entries, list):
+            continue  # e.g. "last_year"
+        for entry in entries:
+            label, _, names = entry.partition(": ")
+            people_in_entry = names.split(" and ") if " and " in names else [person]
+            assigned = assignments.setdefault(label.strip(), [])
+            for name in people_in_entry:
+                if name.strip() and name.strip() not in assigned:
+                    assigned.append(name.strip())
+
+    def sort_key(label):
+        parts = label.split()
+        if parts[0] == "Week" and len(parts) > 1 and parts[1].isdigit():
+            return (0, int(parts[1]), label)
+        return (1, 0, label)
+
+    for label in sorted(assignments, key=sort_key):
+        assigned = assignments[label] + ["", ""]
+        yield [label, assigned[0], assigned[1]]
+
+# Regenerate the whole workbook from the JSON data instead of loading and appending to it.
+# The schedule entries are already in the history when this is called.
+def save_to_excel(people, history, new_year=False):
+    global FILE_PATH, watering_history
 
-def save_to_excel(schedule, people, history, new_year=False):
     # Get the current year
     current_year = datetime.date.today().year
 
     # Determine the file name
     file_name = "Gießplan.xlsx"
 
-    # Check if the file already exists
-    file_exists = os.path.exists(file_name)
+    # Handle new year transition
+    if new_year:
+        next_year = current_year + 1
 
-    if file_exists:
-        workbook = openpyxl.load_workbook(file_name)
-        # Check if the sheet for the current year exists
-        if f"Schedule {current_year}" in workbook.sheetnames:
-            sheet1 = workbook["Statistics"]
-            sheet2 = workbook[f"Schedule {current_year}"]
-        else:
-            # Create a new sheet for the current year
-            sheet2 = workbook.create_sheet(title=f"Schedule {current_year}")
-            sheet2.append(["Week", "Person 1", "Person 2"])
-
-        # Handle new year transition
-        if new_year:
-            next_year = current_year + 1
-            if f"Schedule {next_year}" not in workbook.sheetnames:
-                sheet2 = workbook.create_sheet(title=f"Schedule {next_year}")
-                sheet2.append(["Week", "Person 1", "Person 2"])
-
-            # Create a new JSON file for the new year
-            new_json_file = f"people_{next_year}.json"
-            new_history = {person: [] for person in people}
-            with open(new_json_file, "w") as file:
-                json.dump({"PEOPLE": people, "WEIGHTS": WEIGHTS, "WATERING_HISTORY": new_history}, file)
-
-            # Update the global FILE_PATH to point to the new JSON file
-            global FILE_PATH
-            FILE_PATH = new_json_file
-
-            # Update the history reference to the new history
-            global watering_history
-            watering_history = new_history
+        # Create a new JSON file for the new year
+        new_json_file = f"people_{next_year}.json"
+        new_history = {person: [] for person in people}
+        with open(new_json_file, "w") as file:
+            json.dump({"PEOPLE": people, "WEIGHTS": WEIGHTS, "WATERING_HISTORY": new_history}, file)
+
+        # Update the global FILE_PATH to point to the new JSON file
+        FILE_PATH = new_json_file
+
+        # Update the history reference to the new history
+        watering_history = new_history
+
+    # Every year with its own JSON file gets its own sheet, the current year comes from memory
+    year_histories = [(current_year, history)]
+    for name in sorted(os.listdir(".")):
+        if name.startswith("people_") and name.endswith(".json") and name[7:11].isdigit():
+            year = int(name[7:11])
+            if year != current_year:
+                year_histories.append((year, name))
+    year_histories.sort(key=lambda item: item[0])
+
+    def statistics_rows():
+        for i, person in enumerate(people):
+            watering_count = len(history.get(person, []))
+            yield [person, watering_count, WEIGHTS[i] if i < len(WEIGHTS) else None]
+
+    try:
+        with xlsx_writer.XlsxWriter(file_name) as workbook:
+            workbook.add_sheet("Statistics", statistics_rows(), header=["Name", "Watering Count", "Weight"])
+            for year, source in year_histories:
+                if isinstance(source, str):
+                    # Read one year file at a time
+                    try:
+                        with open(source, "r") as file:
+                            source = json.load(file).get("WATERING_HISTORY", {})
+                    except (OSError, json.JSONDecodeError):
+                        continue
+                workbook.add_sheet(f"Schedule {year}", schedule_rows_from_history(source),
+                                   header=["Week", "Person 1", "Person 2"])
+    except PermissionError:
+        messagebox.showerror("Error", f"Cannot write '{file_name}'. Please close it in Excel and try again.")
+        return
 
-    else:
-        workbook = openpyxl.Workbook()
-
-        # Create the statistics sheet
-        sheet1 = workbook.active
-        sheet1.title = "Statistics"
-        sheet1.append(["Name", "Watering Count", "Weight"])
-
-        # Create the schedule sheet for the current year
-        sheet2 = workbook.create_sheet(title=f"Schedule {current_year}")
-        sheet2.append(["Week", "Person 1", "Person 2"])
-
-    # Update statistics sheet with refreshed data
-    for i, person in enumerate(people):
-        watering_count = len(history.get(person, []))
-        sheet1.append([person, watering_count, WEIGHTS[i]])
-
-    # Append the new schedule below the existing rows in the schedule sheet
-    for i, week in enumerate(schedule):
-        try:
-            week_number, people = week.split(": ")
-            if " and " in people:
-                person1, person2 = people.split(" and ")
-                if int(week_number.split()[1]) > 52 and new_year:
-                    next_year = current_year + 1
-                    sheet2 = workbook[f"Schedule {next_year}"]
-                sheet2.append([week_number, person1, person2])
-            else:
-                sheet2.append([week_number, "", ""])
-        except ValueError:
-            sheet2.append(["", "", ""])
-
-    # Save the workbook
-    workbook.save(file_name)
     messagebox.showinfo("Success", f"Plan saved to Excel in sheet 'Schedule {current_year}' of '{file_name}'.")
 
 # Ensure all dependent data structures and functions are updated after adding or deleting a person
@@ -288,7 +296,7 @@ def add_date_or_week():
         save_to_file()
 
         # Save to Excel
-        save_to_excel([schedule_entry], PEOPLE, watering_history)
+        save_to_excel(PEOPLE, watering_history)
         messagebox.showinfo("Success", "Date/Week added successfully.")
     else:
         messagebox.showerror("Error", "Invalid input. Please provide a date/week and two people.")
@@ -305,7 +313,7 @@ def delete_date_or_week():
         save_to_file()
 
         # Save updated history to Excel
-        save_to_excel([], PEOPLE, watering_history)
+        save_to_excel(PEOPLE, watering_history)
         messagebox.showinfo("Success", "Date/Week deleted successfully.")
     else:
         messagebox.showerror("Error", "Invalid input. Please provide a date/week.")